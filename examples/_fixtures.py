@@ -0,0 +1,62 @@
+"""Shared fixture documents for the usage examples."""
+
+import getpass
+import tempfile
+from functools import cache
+from pathlib import Path
+
+# Per-user, so fixtures are never shared with (or planted by) other users
+FIXTURE_ROOT = Path(tempfile.gettempdir()) / f"translator_examples_{getpass.getuser()}"
+
+FIXTURES: dict[str, dict[str, str]] = {
+    "basic": {
+        "english_doc.txt": (
+            "Hello world! This is a sample English document for translation testing."
+        ),
+        "readme.md": (
+            "# Project Documentation\n\n"
+            "This is a markdown document with some content to translate."
+        ),
+        "subdirectory/nested_doc.txt": (
+            "This is a nested document that should be translated while preserving structure."
+        ),
+    },
+    "batch": {
+        **{
+            f"doc_{i + 1}.txt": f"This is test document number {i + 1}. " * 10
+            for i in range(5)
+        },
+        **{
+            f"{lang}/{lang}_doc_{i + 1}.txt": f"This is {lang} document {i + 1}. " * 5
+            for lang in ["en", "draft"]
+            for i in range(3)
+        },
+    },
+}
+
+
+@cache
+def get_fixture_dir(name: str) -> Path:
+    """Get a directory containing the named fixture set, writing it only once.
+
+    Files left over from a previous run are reused when their content matches.
+
+    Args:
+        name: Fixture set name (see ``FIXTURES``)
+
+    Returns:
+        Directory containing the fixture documents
+    """
+    FIXTURE_ROOT.mkdir(mode=0o700, exist_ok=True)
+    root = FIXTURE_ROOT / name
+
+    for relative_path, content in FIXTURES[name].items():
+        file_path = root / relative_path
+        data = content.encode("utf-8")
+        if file_path.is_file() and file_path.read_bytes() == data:
+            continue
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+
+    return root
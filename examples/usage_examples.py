@@ -1,17 +1,15 @@
 #!/usr/bin/env python3
 """Example usage of the document translation system."""
 
-import asyncio
 import os
-import sys
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
+from _fixtures import get_fixture_dir
 from rich.console import Console
 
+from translator.cli import run_async
 from translator.document_loader import DocumentLoader
 from translator.language_detector import LanguageDetector
 from translator.processor import DocumentTranslator
@@ -24,26 +22,12 @@ async def example_basic_usage():
     """Example 1: Basic directory translation."""
     console.print("[bold blue]Example 1: Basic Directory Translation[/bold blue]")
 
-    # Create a temporary directory with test documents
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create some test documents
-        (temp_path / "english_doc.txt").write_text(
-            "Hello world! This is a sample English document for translation testing."
-        )
-        (temp_path / "readme.md").write_text(
-            "# Project Documentation\n\nThis is a markdown document with some content to translate."
-        )
-
-        # Create subdirectory
-        subdir = temp_path / "subdirectory"
-        subdir.mkdir()
-        (subdir / "nested_doc.txt").write_text(
-            "This is a nested document that should be translated while preserving structure."
-        )
+    # Test documents are staged once and reused; output goes to a fresh directory
+    source_path = get_fixture_dir("basic")
+    console.print(f"Using test documents in: {source_path}")
 
-        console.print(f"Created test documents in: {temp_path}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(temp_dir) / "translated"
 
         # Initialize translator
         translator = DocumentTranslator()
@@ -68,23 +52,24 @@ async def example_basic_usage():
         console.print(f"Translating documents to: {', '.join(target_languages)}")
 
         try:
-            results = await translator.translate_directory(
-                source_directory=temp_path,
-                target_languages=target_languages,
-                output_directory=temp_path / "translated",
-            )
+            async with translator.translation_manager:
+                results = await translator.translate_directory(
+                    source_directory=source_path,
+                    target_languages=target_languages,
+                    output_directory=output_dir,
+                )
 
             # Print results
             translator.print_results_summary(results)
 
             # Show the output structure
             console.print("\n[bold green]Output Structure:[/bold green]")
-            output_dir = temp_path / "translated"
-            if output_dir.exists():
-                for item in sorted(output_dir.rglob("*")):
-                    if item.is_file():
-                        relative_path = item.relative_to(output_dir)
-                        console.print(f"  📄 {relative_path}")
+            for dirpath, dirnames, filenames in os.walk(output_dir):
+                dirnames.sort()
+                filenames.sort()
+                for filename in filenames:
+                    relative_path = Path(dirpath, filename).relative_to(output_dir)
+                    console.print(f"  📄 {relative_path}")
 
         except Exception as e:
             console.print(f"[red]Translation failed: {e}[/red]")
@@ -106,8 +91,8 @@ async def example_language_detection():
     }
 
     console.print("Testing language detection:")
-    for actual_lang, text in test_texts.items():
-        detected = detector.detect_language(text)
+    detected_languages = detector.detect_batch(list(test_texts.values()))
+    for actual_lang, detected in zip(test_texts, detected_languages, strict=True):
         if detected:
             detected_name = detector.get_language_name(detected)
             status = "✓" if detected in ["en", "es", "fr", "ja", "ko"] else "?"
@@ -173,7 +158,8 @@ async def example_translation_services():
     console.print(f"\nTesting translation: '{test_text}' -> {target_language}")
 
     try:
-        result = await manager.translate(test_text, target_language, "en")
+        async with manager:
+            result = await manager.translate(test_text, target_language, "en")
         if result:
             console.print(f"  ✓ Translation result: '{result}'")
         else:
@@ -186,32 +172,22 @@ async def example_batch_processing():
     """Example 5: Batch processing with progress tracking."""
     console.print("\n[bold blue]Example 5: Batch Processing[/bold blue]")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create multiple test documents
-        console.print("Creating test documents...")
-        for i in range(5):
-            content = f"This is test document number {i + 1}. " * 10
-            (temp_path / f"doc_{i + 1}.txt").write_text(content)
-
-        # Create nested structure
-        for lang in ["en", "draft"]:
-            lang_dir = temp_path / lang
-            lang_dir.mkdir()
-            for i in range(3):
-                content = f"This is {lang} document {i + 1}. " * 5
-                (lang_dir / f"{lang}_doc_{i + 1}.txt").write_text(content)
+    # Test documents (including a nested structure) are staged once and reused
+    source_path = get_fixture_dir("batch")
+    console.print(f"Using test documents in: {source_path}")
 
-        console.print(f"Created test documents in: {temp_path}")
-
-        # List all created files
-        all_files = list(temp_path.rglob("*.txt"))
-        console.print(f"Total files: {len(all_files)}")
+    # Count all test files
+    total_files = sum(
+        name.endswith(".txt")
+        for _, _, filenames in os.walk(source_path)
+        for name in filenames
+    )
+    console.print(f"Total files: {total_files}")
 
+    with tempfile.TemporaryDirectory() as temp_dir:
         # Initialize translator with smaller batch size for demo
         translator = DocumentTranslator()
-        translator.config.batch_size = 2  # Process 2 files at a time
+        translator.config = replace(translator.config, batch_size=2)  # 2 files at a time
 
         # Check if services are available
         if not translator.translation_manager.get_available_services():
@@ -222,11 +198,12 @@ async def example_batch_processing():
 
         # Translate to just one language for demo
         try:
-            results = await translator.translate_directory(
-                source_directory=temp_path,
-                target_languages=["ja"],  # Just Japanese
-                output_directory=temp_path / "batch_translated",
-            )
+            async with translator.translation_manager:
+                results = await translator.translate_directory(
+                    source_directory=source_path,
+                    target_languages=["ja"],  # Just Japanese
+                    output_directory=Path(temp_dir) / "batch_translated",
+                )
 
             console.print("\nBatch processing completed:")
             console.print(f"  Total files processed: {len(results)}")
@@ -276,4 +253,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -34,16 +34,12 @@ Environment Variables:
     GOOGLE_TRANSLATE_API_KEY: Google Translate API key
 
 Requirements:
-    pip install openai langdetect googletrans python-docx PyPDF2 aiofiles
-    pip install aiohttp tqdm loguru pydantic pydantic-settings click rich tenacity
+    pip install -e .  # from the repository root
+    # or install the dependencies directly:
+    pip install openai langdetect googletrans python-docx PyPDF2
+    pip install aiohttp tqdm loguru click rich
 """
 
-import sys
-from pathlib import Path
-
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from translator.cli import cli
 
 if __name__ == "__main__":
@@ -0,0 +1,388 @@
+"""Persistent caches for expensive translation pipeline stages."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to compact JSON, using orjson when available.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON string
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when available.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def content_hash(text: str) -> str:
+    """Compute a short, stable hash for a piece of text.
+
+    Args:
+        text: Text content to hash
+
+    Returns:
+        Hex digest identifying the content
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _SQLiteCache:
+    """Thread-safe wrapper around a single SQLite cache table."""
+
+    SCHEMA = ""
+
+    def __init__(self, cache_file: Path) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            cache_file: Path to the SQLite database file
+        """
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(cache_file), check_same_thread=False)
+        self._connection.execute(self.SCHEMA)
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class DetectionCache(_SQLiteCache):
+    """SQLite-backed cache of language detection results keyed by content hash and backend."""
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS detect_cache ("
+        "hash TEXT PRIMARY KEY, lang TEXT, confidence_json TEXT)"
+    )
+
+    @staticmethod
+    def make_key(text: str, backend: str) -> str:
+        """Build the cache key for a detection result.
+
+        Args:
+            text: Text content that was analyzed
+            backend: Detection backend (and model) that produced the result
+
+        Returns:
+            Cache key string
+        """
+        return f"{content_hash(text)}:{backend}"
+
+    def get_language(self, text: str, backend: str) -> str | None:
+        """Get the cached detected language for a text.
+
+        Args:
+            text: Text content that was analyzed
+            backend: Detection backend (and model) that produced the result
+
+        Returns:
+            Cached language code or None if not cached
+        """
+        row = self._fetch(text, backend, "lang")
+        return row[0] if row else None
+
+    def set_language(self, text: str, language: str, backend: str) -> None:
+        """Store the detected language for a text.
+
+        Args:
+            text: Text content that was analyzed
+            language: Detected language code
+            backend: Detection backend (and model) that produced the result
+        """
+        self._store(text, backend, "lang", language)
+
+    def get_confidences(self, text: str, backend: str) -> list[tuple[str, float]] | None:
+        """Get cached detection confidences for a text.
+
+        Args:
+            text: Text content that was analyzed
+            backend: Detection backend (and model) that produced the result
+
+        Returns:
+            Cached (language_code, confidence) tuples or None if not cached
+        """
+        row = self._fetch(text, backend, "confidence_json")
+        if not row:
+            return None
+        return [(lang, prob) for lang, prob in json_loads(row[0])]
+
+    def set_confidences(
+        self, text: str, confidences: list[tuple[str, float]], backend: str
+    ) -> None:
+        """Store detection confidences for a text.
+
+        Args:
+            text: Text content that was analyzed
+            confidences: List of (language_code, confidence) tuples
+            backend: Detection backend (and model) that produced the result
+        """
+        self._store(text, backend, "confidence_json", json_dumps(confidences))
+
+    def _fetch(self, text: str, backend: str, column: str) -> tuple[str] | None:
+        """Fetch a non-null column value for the given text and backend."""
+        try:
+            with self._lock:
+                return self._connection.execute(
+                    f"SELECT {column} FROM detect_cache "  # noqa: S608
+                    f"WHERE hash = ? AND {column} IS NOT NULL",
+                    (self.make_key(text, backend),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading detection cache {self.cache_file}: {e}")
+            return None
+
+    def _store(self, text: str, backend: str, column: str, value: str) -> None:
+        """Insert or update a column value for the given text and backend."""
+        try:
+            with self._lock:
+                self._connection.execute(
+                    f"INSERT INTO detect_cache (hash, {column}) VALUES (?, ?) "  # noqa: S608
+                    f"ON CONFLICT(hash) DO UPDATE SET {column} = excluded.{column}",
+                    (self.make_key(text, backend), value),
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing detection cache {self.cache_file}: {e}")
+
+
+class TranslationCache(_SQLiteCache):
+    """SQLite-backed cache of translations keyed by text, languages and model."""
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS translation_cache ("
+        "key TEXT PRIMARY KEY, translation TEXT NOT NULL, expires_at REAL NOT NULL)"
+    )
+
+    def __init__(self, cache_file: Path, ttl_seconds: float = 30 * 86400) -> None:
+        """Initialize the translation cache.
+
+        Args:
+            cache_file: Path to the SQLite database file
+            ttl_seconds: How long cached translations stay valid
+        """
+        super().__init__(cache_file)
+        self.ttl_seconds = ttl_seconds
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete expired translations so the database does not grow without bound.
+
+        Expired rows are never returned, but stay on disk until purged. This runs
+        whenever the cache is opened.
+
+        Returns:
+            Number of deleted translations
+        """
+        try:
+            with self._lock:
+                deleted = self._connection.execute(
+                    "DELETE FROM translation_cache WHERE expires_at <= ?", (time.time(),)
+                ).rowcount
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error purging translation cache {self.cache_file}: {e}")
+            return 0
+        return deleted
+
+    @staticmethod
+    def make_key(
+        text: str, target_language: str, source_language: str | None, model: str
+    ) -> str:
+        """Build the cache key for a translation request.
+
+        Args:
+            text: Source text
+            target_language: Target language code
+            source_language: Source language code (optional)
+            model: Model used for translation
+
+        Returns:
+            Cache key string
+        """
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{text_hash}:{source_language or 'auto'}:{target_language}:{model}"
+
+    def get(
+        self, text: str, target_language: str, source_language: str | None, model: str
+    ) -> str | None:
+        """Get a cached translation.
+
+        Args:
+            text: Source text
+            target_language: Target language code
+            source_language: Source language code (optional)
+            model: Model used for translation
+
+        Returns:
+            Cached translation or None if missing or expired
+        """
+        key = self.make_key(text, target_language, source_language, model)
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT translation FROM translation_cache "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading translation cache {self.cache_file}: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(
+        self,
+        text: str,
+        target_language: str,
+        source_language: str | None,
+        model: str,
+        translation: str,
+    ) -> None:
+        """Store a translation.
+
+        Args:
+            text: Source text
+            target_language: Target language code
+            source_language: Source language code (optional)
+            model: Model used for translation
+            translation: Translated text
+        """
+        key = self.make_key(text, target_language, source_language, model)
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO translation_cache "
+                    "(key, translation, expires_at) VALUES (?, ?, ?)",
+                    (key, translation, time.time() + self.ttl_seconds),
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing translation cache {self.cache_file}: {e}")
+
+
+def file_hash(file_path: Path) -> str:
+    """Compute a short, stable hash of a file's contents.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest identifying the file contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with file_path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranslationManifest:
+    """Record of which source contents each translated file was produced from.
+
+    The manifest is stored as a JSON sidecar in the output directory and maps
+    each source file's relative path to the source hash per target language.
+    """
+
+    FILENAME = ".translator-manifest.json"
+
+    # Changes are saved after this many updates or seconds, so a run that is
+    # killed or crashes loses little progress
+    SAVE_EVERY = 20
+    SAVE_INTERVAL_SECONDS = 10.0
+
+    def __init__(self, output_directory: Path) -> None:
+        """Load the manifest for an output directory.
+
+        Args:
+            output_directory: Base output directory of a translation run
+        """
+        self.manifest_file = output_directory / self.FILENAME
+        self.entries: dict[str, dict[str, str]] = {}
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+        try:
+            self.entries = json_loads(self.manifest_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.manifest_file}: {e}")
+
+    def get(self, relative_path: str, target_language: str) -> str | None:
+        """Get the source hash a translation was produced from.
+
+        Args:
+            relative_path: Source file path relative to the source directory
+            target_language: Target language code
+
+        Returns:
+            Recorded source hash or None if unknown
+        """
+        return self.entries.get(relative_path, {}).get(target_language)
+
+    def set(self, relative_path: str, target_language: str, source_hash: str) -> None:
+        """Record the source hash a translation was produced from.
+
+        The manifest is saved once enough changes have built up.
+
+        Args:
+            relative_path: Source file path relative to the source directory
+            target_language: Target language code
+            source_hash: Hash of the source file contents
+        """
+        self.entries.setdefault(relative_path, {})[target_language] = source_hash
+        self._unsaved += 1
+        if (
+            self._unsaved >= self.SAVE_EVERY
+            or time.monotonic() - self._saved_at >= self.SAVE_INTERVAL_SECONDS
+        ):
+            self.save()
+
+    def save(self) -> None:
+        """Atomically write the manifest if it changed."""
+        if not self._unsaved:
+            return
+
+        temp_file = self.manifest_file.with_name(f"{self.FILENAME}.tmp")
+        try:
+            temp_file.write_bytes(json_dumps(self.entries).encode("utf-8"))
+            temp_file.replace(self.manifest_file)
+            self._unsaved = 0
+            self._saved_at = time.monotonic()
+        except OSError as e:
+            logger.warning(f"Error writing manifest {self.manifest_file}: {e}")
@@ -1,23 +1,47 @@
 """Command-line interface for the document translator."""
 
 import asyncio
+import sys
+from collections.abc import Coroutine
+from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Any
 
 import click
 from loguru import logger
 from rich.console import Console
 
+from .cache import json_dumps
 from .config import get_config
-from .processor import DocumentTranslator
+from .document_loader import DocumentLoader
+from .language_detector import LanguageDetector
+from .processor import DocumentTranslator, TranslationSummary
+from .translation_service import TranslationManager
 
-if TYPE_CHECKING:
-    pass
+try:
+    import uvloop
 
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+    uvloop = None
 
 console = Console()
 
 
+def run_async[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    return asyncio.run(main, loop_factory=loop_factory)
+
+
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--log-file", type=str, help="Log file path")
@@ -30,9 +54,9 @@ def cli(verbose: bool, log_file: str | None) -> None:
     # Remove default logger
     logger.remove()
 
-    # Add console logger
+    # Add console logger (straight to stderr; console is kept for reports)
     logger.add(
-        lambda msg: console.print(msg, end=""),
+        sys.stderr,
         level=log_level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | {message}",
         colorize=True,
@@ -62,7 +86,16 @@ def cli(verbose: bool, log_file: str | None) -> None:
 )
 @click.option("--overwrite", is_flag=True, help="Overwrite existing translations")
 @click.option(
-    "--batch-size", type=int, help="Number of documents to process in parallel"
+    "--batch-size",
+    "--concurrency",
+    "batch_size",
+    type=int,
+    help="Number of documents to process in parallel",
+)
+@click.option(
+    "--results-log",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Append each translation result to this JSON Lines file as it completes",
 )
 def translate(
     source_directory: Path,
@@ -70,8 +103,16 @@ def translate(
     output: Path | None,
     overwrite: bool,
     batch_size: int | None,
+    results_log: Path | None,
 ) -> None:
     """Translate all documents in a directory to specified languages."""
+    supported = get_config().supported_languages_set
+    unsupported = [lang for lang in languages if lang not in supported]
+    if unsupported:
+        raise click.BadParameter(
+            f"unsupported language(s): {', '.join(unsupported)}",
+            param_hint="'--languages'",
+        )
 
     async def run_translation() -> None:
         """Run the translation process asynchronously."""
@@ -81,9 +122,11 @@ def translate(
 
             # Override config settings if provided
             if overwrite:
-                translator.config.overwrite_existing = overwrite
+                translator.config = replace(
+                    translator.config, overwrite_existing=overwrite
+                )
             if batch_size:
-                translator.config.batch_size = batch_size
+                translator.config = replace(translator.config, batch_size=batch_size)
 
             # Convert languages tuple to list if provided
             target_languages = list(languages) if languages else None
@@ -96,15 +139,28 @@ def translate(
             else:
                 console.print("Using all supported languages")
 
-            # Run translation
-            results = await translator.translate_directory(
-                source_directory=source_directory,
-                target_languages=target_languages,
-                output_directory=output,
-            )
+            # Run translation, reporting each result as it completes and
+            # keeping only running totals, so memory does not grow with the run
+            summary = TranslationSummary()
+            log_file = results_log.open("a", encoding="utf-8") if results_log else None
+            try:
+                # Keep service connections open for the whole run
+                async with translator.translation_manager:
+                    async for result in translator.translate_directory_stream(
+                        source_directory=source_directory,
+                        target_languages=target_languages,
+                        output_directory=output,
+                    ):
+                        translator.print_result(result)
+                        summary.add(result)
+                        if log_file is not None:
+                            log_file.write(json_dumps(result.to_dict()) + "\n")
+            finally:
+                if log_file is not None:
+                    log_file.close()
 
             # Print results
-            translator.print_results_summary(results)
+            translator.print_results_summary(summary)
 
         except Exception as e:
             logger.error(f"Translation failed: {e}")
@@ -112,7 +168,7 @@ def translate(
             raise click.ClickException(str(e)) from e
 
     # Run the async function
-    asyncio.run(run_translation())
+    run_async(run_translation())
 
 
 @cli.command()
@@ -123,11 +179,10 @@ def languages() -> None:
     console.print("[bold blue]Supported Languages:[/bold blue]")
     console.print()
 
+    detector = LanguageDetector()
+
     # Create table-like output
     for code in sorted(config.supported_languages):
-        from .language_detector import LanguageDetector
-
-        detector = LanguageDetector()
         name = detector.get_language_name(code)
         console.print(f"  {code:<8} - {name}")
 
@@ -169,8 +224,6 @@ def config_info() -> None:
     console.print()
 
     # Check available services
-    from .translation_service import TranslationManager
-
     manager = TranslationManager()
     available_services = manager.get_available_services()
 
@@ -193,12 +246,9 @@ def detect_language(file_path: Path) -> None:
     async def run_detection() -> None:
         """Run language detection asynchronously."""
         try:
-            from .document_loader import DocumentLoader
-            from .language_detector import LanguageDetector
-
-            # Load document
+            # Load only the beginning of the document; detection needs no more
             loader = DocumentLoader()
-            content = await loader.load_document(file_path)
+            content = await loader.load_document_prefix(file_path)
 
             if not content:
                 console.print(f"[red]Failed to load content from: {file_path}[/red]")
@@ -229,7 +279,7 @@ def detect_language(file_path: Path) -> None:
             console.print(f"[bold red]Error: {e}[/bold red]")
 
     # Run the async function
-    asyncio.run(run_detection())
+    run_async(run_detection())
 
 
 if __name__ == "__main__":
@@ -1,100 +1,206 @@
 """Configuration settings for the translation system."""
 
-from typing import TYPE_CHECKING
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Final
 
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+_TRUE_VALUES: Final = frozenset({"1", "true", "yes", "on", "y", "t"})
+_FALSE_VALUES: Final = frozenset({"0", "false", "no", "off", "n", "f", ""})
 
-if TYPE_CHECKING:
-    pass
 
+@dataclass(frozen=True, slots=True)
+class TranslationConfig:
+    """Configuration settings for translation services.
 
-class TranslationConfig(BaseSettings):
-    """Configuration settings for translation services."""
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    Every field can be overridden by an environment variable (or ``.env`` entry)
+    of the same name, matched case-insensitively, e.g. ``BATCH_SIZE=4``.
+    """
 
     # API Configuration
-    openai_api_key: str = Field(default="", description="OpenAI API key")
-    openai_base_url: str = Field(
-        default="https://api.openai.com/v1", description="OpenAI base URL"
-    )
-    deepseek_api_key: str = Field(default="", description="DeepSeek API key")
-    deepseek_base_url: str = Field(
-        default="https://api.deepseek.com", description="DeepSeek base URL"
-    )
-    google_translate_api_key: str = Field(
-        default="", description="Google Translate API key"
-    )
+    openai_api_key: str = ""
+    openai_base_url: str = "https://api.openai.com/v1"
+    deepseek_api_key: str = ""
+    deepseek_base_url: str = "https://api.deepseek.com"
+    google_translate_api_key: str = ""
 
     # Translation Settings
-    default_model: str = Field(
-        default="deepseek-chat", description="Default translation model"
-    )
-    max_retries: int = Field(
-        default=3, description="Maximum number of retries for API calls"
-    )
-    retry_delay: float = Field(
-        default=1.0, description="Delay between retries in seconds"
-    )
-    batch_size: int = Field(
-        default=10, description="Number of documents to process in parallel"
-    )
-    max_file_size_mb: float = Field(default=50.0, description="Maximum file size in MB")
+    default_model: str = "deepseek-chat"
+    max_retries: int = 3  # Maximum number of retries for API calls
+    retry_delay: float = 1.0  # Delay between retries in seconds
+    batch_size: int = 10  # Number of documents to process in parallel
+    max_file_size_mb: float = 50.0
+    batch_document_chars: int = 2000  # Documents up to this size share requests (0 disables)
+    translation_chunk_chars: int = 6000  # Larger documents are translated in chunks (0 disables)
+    service_stagger_seconds: float = 0.0  # Start the next service if no reply by then (0 waits)
+    openai_max_concurrency: int = 50  # Requests in flight per OpenAI/DeepSeek service (0: no limit)
+    mymemory_max_concurrency: int = 5  # Requests in flight to MyMemory (0: no limit)
+    mymemory_requests_per_second: float = 5.0  # MyMemory free-tier pacing (0: no limit)
+    enable_mock_service: bool = False  # Register the no-op mock service last in the chain
 
     # Supported Languages
-    supported_languages: list[str] = Field(
-        default=[
-            "en",  # English
-            "ja",  # Japanese
-            "ko",  # Korean
-            "zh",  # Chinese (Simplified)
-            "zh-tw",  # Chinese (Traditional)
-            "vi",  # Vietnamese
-            "es",  # Spanish
-            "fr",  # French
-            "de",  # German
-            "it",  # Italian
-            "pt",  # Portuguese
-            "ru",  # Russian
-            "ar",  # Arabic
-            "hi",  # Hindi
-            "th",  # Thai
-        ],
-        description="List of supported language codes",
+    supported_languages: tuple[str, ...] = (
+        "en",  # English
+        "ja",  # Japanese
+        "ko",  # Korean
+        "zh",  # Chinese (Simplified)
+        "zh-tw",  # Chinese (Traditional)
+        "vi",  # Vietnamese
+        "es",  # Spanish
+        "fr",  # French
+        "de",  # German
+        "it",  # Italian
+        "pt",  # Portuguese
+        "ru",  # Russian
+        "ar",  # Arabic
+        "hi",  # Hindi
+        "th",  # Thai
     )
 
     # File Format Support
-    supported_extensions: list[str] = Field(
-        default=[".txt", ".md", ".pdf", ".docx", ".doc", ".rtf"],
-        description="Supported file extensions",
-    )
+    supported_extensions: tuple[str, ...] = (".txt", ".md", ".pdf", ".docx", ".doc", ".rtf")
+    pdf_backend: str = "auto"  # "auto" (pypdfium2 if installed), "pdfium" or "pypdf2"
+    parallel_scan: bool = True  # Scan top-level subdirectories in parallel threads
+
+    # Language Detection
+    detection_backend: str = "auto"  # "auto", "fasttext", "cld3" or "langdetect"
+    fasttext_model_file: str = ""  # fastText language ID model; empty uses langdetect
+    filename_language_hints: bool = False  # Trust codes like guide_ja.md or ja/guide.md
+
+    # Cache Configuration (empty file path disables a cache)
+    detection_cache_file: str = "~/.cache/translator/detect.sqlite"
+    translation_cache_file: str = "~/.cache/translator/translations.sqlite"
+    translation_cache_ttl_days: float = 30.0
 
     # Logging Configuration
-    log_level: str = Field(default="INFO", description="Logging level")
-    log_file: str = Field(default="translation.log", description="Log file path")
+    log_level: str = "INFO"
+    log_file: str = "translation.log"
 
     # Output Configuration
-    output_directory: str = Field(
-        default="translated", description="Output directory for translations"
-    )
-    preserve_structure: bool = Field(
-        default=True, description="Preserve directory structure in output"
-    )
-    overwrite_existing: bool = Field(
-        default=False, description="Overwrite existing translated files"
-    )
+    output_directory: str = "translated"
+    preserve_structure: bool = True
+    overwrite_existing: bool = False
 
+    # Precomputed lookup sets for O(1) membership checks
+    supported_languages_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    supported_extensions_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
-class LanguageMapping(BaseModel):
-    """Language code mapping for different translation services."""
+    def __post_init__(self) -> None:
+        """Build the lookup sets from the configured lists."""
+        object.__setattr__(
+            self, "supported_languages_set", frozenset(self.supported_languages)
+        )
+        object.__setattr__(
+            self,
+            "supported_extensions_set",
+            frozenset(extension.lower() for extension in self.supported_extensions),
+        )
+
+    @classmethod
+    def from_env(
+        cls, environ: Mapping[str, str] | None = None, env_file: Path | None = Path(".env")
+    ) -> "TranslationConfig":
+        """Build a configuration from environment variables and a ``.env`` file.
+
+        Process environment variables take precedence over ``.env`` entries.
+
+        Args:
+            environ: Environment mapping (defaults to ``os.environ``)
+            env_file: Optional dotenv file to read defaults from
+
+        Returns:
+            Configuration with overrides applied
 
-    LANGUAGE_NAMES: dict[str, str] = {
+        Raises:
+            ValueError: If an environment value cannot be parsed
+        """
+        values = _read_env_file(env_file) if env_file is not None else {}
+        values.update(
+            (key.lower(), value)
+            for key, value in (os.environ if environ is None else environ).items()
+        )
+
+        overrides: dict[str, Any] = {}
+        for config_field in fields(cls):
+            if not config_field.init or config_field.name not in values:
+                continue
+            default = config_field.default
+            if default is MISSING:
+                continue
+            try:
+                overrides[config_field.name] = _parse_value(values[config_field.name], default)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {config_field.name.upper()}: {e}") from e
+
+        return cls(**overrides)
+
+
+def _read_env_file(env_file: Path) -> dict[str, str]:
+    """Read ``KEY=VALUE`` pairs from a dotenv file.
+
+    Args:
+        env_file: Path to the dotenv file
+
+    Returns:
+        Mapping of lower-cased keys to values (empty if the file is missing)
+    """
+    try:
+        lines = env_file.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+
+    values: dict[str, str] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.removeprefix("export ").strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key.lower()] = value
+    return values
+
+
+def _parse_value(raw: str, default: Any) -> Any:
+    """Convert a raw environment string to the type of a field's default.
+
+    Args:
+        raw: Raw string value
+        default: Field default used to pick the target type
+
+    Returns:
+        Parsed value
+    """
+    if isinstance(default, bool):
+        lowered = raw.strip().lower()
+        if lowered in _TRUE_VALUES:
+            return True
+        if lowered in _FALSE_VALUES:
+            return False
+        raise ValueError(f"expected a boolean, got {raw!r}")
+    if isinstance(default, int):
+        return int(raw)
+    if isinstance(default, float):
+        return float(raw)
+    if isinstance(default, tuple):
+        raw = raw.strip()
+        if raw.startswith("["):
+            return tuple(str(item) for item in json.loads(raw))
+        return tuple(item.strip() for item in raw.split(",") if item.strip())
+    return raw
+
+
+# Language code mappings for different translation services (read-only)
+LANGUAGE_NAMES: Final[Mapping[str, str]] = MappingProxyType(
+    {
         "en": "English",
         "ja": "Japanese",
         "ko": "Korean",
@@ -111,8 +217,10 @@ class LanguageMapping(BaseModel):
         "hi": "Hindi",
         "th": "Thai",
     }
+)
 
-    GOOGLE_TRANSLATE_CODES: dict[str, str] = {
+GOOGLE_TRANSLATE_CODES: Final[Mapping[str, str]] = MappingProxyType(
+    {
         "en": "en",
         "ja": "ja",
         "ko": "ko",
@@ -129,8 +237,10 @@ class LanguageMapping(BaseModel):
         "hi": "hi",
         "th": "th",
     }
+)
 
-    LANGDETECT_CODES: dict[str, str] = {
+LANGDETECT_CODES: Final[Mapping[str, str]] = MappingProxyType(
+    {
         "en": "en",
         "ja": "ja",
         "ko": "ko",
@@ -147,8 +257,10 @@ class LanguageMapping(BaseModel):
         "hi": "hi",
         "th": "th",
     }
+)
 
-    MYMEMORY_CODES: dict[str, str] = {
+MYMEMORY_CODES: Final[Mapping[str, str]] = MappingProxyType(
+    {
         "en": "en",
         "ja": "ja",
         "ko": "ko",
@@ -165,8 +277,10 @@ class LanguageMapping(BaseModel):
         "hi": "hi",
         "th": "th",
     }
+)
 
-    LIBRETRANSLATE_CODES: dict[str, str] = {
+LIBRETRANSLATE_CODES: Final[Mapping[str, str]] = MappingProxyType(
+    {
         "en": "en",
         "ja": "ja",
         "ko": "ko",
@@ -183,13 +297,34 @@ class LanguageMapping(BaseModel):
         "hi": "hi",
         "th": "th",
     }
+)
+
+
+class LanguageMapping:
+    """Language code mapping for different translation services."""
+
+    LANGUAGE_NAMES = LANGUAGE_NAMES
+    GOOGLE_TRANSLATE_CODES = GOOGLE_TRANSLATE_CODES
+    LANGDETECT_CODES = LANGDETECT_CODES
+    MYMEMORY_CODES = MYMEMORY_CODES
+    LIBRETRANSLATE_CODES = LIBRETRANSLATE_CODES
+
+
+@lru_cache(maxsize=1)
+def _load_config_once() -> TranslationConfig:
+    """Read the environment (and ``.env``) into a configuration snapshot."""
+    return TranslationConfig.from_env()
 
 
 def get_config() -> TranslationConfig:
-    """Get the global configuration instance."""
-    return TranslationConfig()
+    """Get the global configuration instance.
+
+    The configuration is loaded (and ``.env`` parsed) only once per process.
+    """
+    return _load_config_once()
 
 
+@lru_cache(maxsize=1)
 def get_language_mapping() -> LanguageMapping:
     """Get the language mapping instance."""
     return LanguageMapping()
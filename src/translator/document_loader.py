@@ -1,72 +1,408 @@
 """Document loading and parsing utilities."""
 
+import asyncio
+import atexit
+import codecs
+import multiprocessing
+import os
+import re
+import zipfile
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from xml.etree import ElementTree
 
-import aiofiles
 from loguru import logger
 from PyPDF2 import PdfReader
 
 from .config import get_config
-
-if TYPE_CHECKING:
-    pass
+from .file_io import decode_text, read_text
 
 try:
-    from docx import Document as DocxDocument
+    import pypdfium2 as pdfium
 
-    HAS_DOCX = True
+    HAS_PDFIUM = True
 except ImportError:
-    HAS_DOCX = False
-    DocxDocument = None
+    HAS_PDFIUM = False
+    pdfium = None
+
+
+# WordprocessingML paragraph and text elements, and the inline breaks kept as text
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PARAGRAPH = f"{_W}p"
+_DOCX_TEXT = f"{_W}t"
+_DOCX_BREAKS = {f"{_W}tab": "\t", f"{_W}br": "\n", f"{_W}cr": "\n"}
+
+# Pages extracted per worker task when splitting large PDFs
+PDF_PAGES_PER_CHUNK = 50
+
+# RTF tokens: control word with optional numeric parameter, hex-escaped byte,
+# control symbol, group brace, raw line break (not text in RTF) and a text run
+_RTF_TOKEN = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-fA-F]{2})|\\(.)|([{}])"
+    r"|[\r\n]+|([^\\{}\r\n]+)",
+    re.DOTALL,
+)
+
+# Destination groups holding document metadata rather than text
+_RTF_SKIPPED_DESTINATIONS = frozenset(
+    {
+        "colortbl",
+        "datastore",
+        "filetbl",
+        "fonttbl",
+        "info",
+        "latentstyles",
+        "listoverridetable",
+        "listtable",
+        "pict",
+        "revtbl",
+        "rsidtbl",
+        "stylesheet",
+        "themedata",
+        "xmlnstbl",
+    }
+)
+
+# Control words and symbols that stand for text
+_RTF_TEXT_WORDS = {
+    "par": "\n",
+    "line": "\n",
+    "sect": "\n",
+    "page": "\n",
+    "row": "\n",
+    "cell": "\t",
+    "tab": "\t",
+    "emdash": "\u2014",
+    "endash": "\u2013",
+    "bullet": "\u2022",
+    "lquote": "\u2018",
+    "rquote": "\u2019",
+    "ldblquote": "\u201c",
+    "rdblquote": "\u201d",
+    "emspace": "\u2003",
+    "enspace": "\u2002",
+}
+_RTF_TEXT_SYMBOLS = {
+    "\\": "\\",
+    "{": "{",
+    "}": "}",
+    "~": "\u00a0",
+    "_": "\u2011",
+    "\n": "\n",
+    "\r": "\n",
+}
+
+
+@lru_cache(maxsize=1)
+def _get_parser_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool used for CPU-bound PDF parsing.
+
+    Workers are started from a fork server (or spawned where that is not
+    available) rather than forked, since forking this process while its
+    worker threads hold locks can deadlock the child. The pool is shut down
+    at interpreter exit.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("forkserver")
+    else:
+        mp_context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context)
+    atexit.register(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+def _use_pdfium(backend: str) -> bool:
+    """Check whether the configured PDF backend resolves to pypdfium2.
+
+    Args:
+        backend: Configured backend ("auto", "pdfium" or "pypdf2")
+
+    Returns:
+        True if pypdfium2 should be used
+    """
+    if backend == "pdfium" and not HAS_PDFIUM:
+        logger.warning("pypdfium2 not installed, falling back to PyPDF2")
+    return HAS_PDFIUM and backend in ("auto", "pdfium")
+
+
+def _extract_pdf_pages(
+    file_path: str, start: int, end: int, backend: str = "auto"
+) -> tuple[int, list[str]]:
+    """Extract text from a range of PDF pages (runs in a worker process).
+
+    The page count is returned from the same parse, so a PDF that fits in a
+    single range is opened only once.
+
+    Args:
+        file_path: Path to the PDF file
+        start: Index of the first page to extract
+        end: Index after the last page to extract (clamped to the page count)
+        backend: PDF backend to use
+
+    Returns:
+        The document's page count and its non-empty page texts in page order
+    """
+    text_content = []
+
+    if _use_pdfium(backend):
+        document = pdfium.PdfDocument(file_path)
+        try:
+            page_count = len(document)
+            for index in range(start, min(end, page_count)):
+                page = document[index]
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if text.strip():
+                    text_content.append(text.strip())
+        finally:
+            document.close()
+        return page_count, text_content
+
+    pages = PdfReader(file_path).pages
+    for page in pages[start:end]:
+        text = page.extract_text()
+        if text.strip():
+            text_content.append(text.strip())
+
+    return len(pages), text_content
+
+
+def _extract_docx_text(file_path: str) -> str | None:
+    """Extract paragraph text from a DOCX file (runs in a worker thread).
+
+    ``word/document.xml`` is streamed with ``iterparse`` and each paragraph is
+    cleared once its text is collected, instead of building the full
+    python-docx object model. Paragraphs in tables are included.
+
+    Args:
+        file_path: Path to the DOCX file
+
+    Returns:
+        Extracted text content or None if the document has no text
+    """
+    text_content = []
+    # Text of the open paragraphs; text boxes nest paragraphs inside runs
+    paragraphs: list[list[str]] = []
+
+    with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as xml:
+        # expat does not fetch external entities and (2.4+) caps entity expansion
+        for event, elem in ElementTree.iterparse(xml, events=("start", "end")):  # noqa: S314
+            if elem.tag == _DOCX_PARAGRAPH:
+                if event == "start":
+                    paragraphs.append([])
+                    continue
+                text = "".join(paragraphs.pop()).strip()
+                if text:
+                    text_content.append(text)
+                if not paragraphs:
+                    elem.clear()
+            elif event == "end" and paragraphs:
+                if elem.tag == _DOCX_TEXT:
+                    paragraphs[-1].append(elem.text or "")
+                elif elem.tag in _DOCX_BREAKS:
+                    paragraphs[-1].append(_DOCX_BREAKS[elem.tag])
+
+    return "\n\n".join(text_content) if text_content else None
+
+
+def _rtf_to_text(rtf: str) -> str:
+    r"""Convert RTF markup to plain text.
+
+    Metadata destinations (font and color tables, ``\info``, pictures and
+    any ``{\*...}`` group) are skipped, ``\'xx`` bytes are decoded with the
+    document's ``\ansicpg`` code page and ``\uN`` escapes are resolved,
+    skipping their ``\ucN`` fallback characters.
+
+    Args:
+        rtf: RTF document source
+
+    Returns:
+        Extracted text, one line per paragraph
+    """
+    codepage = "cp1252"
+    # Per group: fallback characters after \uN and whether the group is skipped
+    stack: list[tuple[int, bool]] = []
+    fallback_chars = 1
+    skipped = False
+    # Fallback characters still to drop after the last \uN
+    to_drop = 0
+    pending_bytes = bytearray()
+    parts: list[str] = []
+
+    def flush_bytes() -> None:
+        try:
+            parts.append(pending_bytes.decode(codepage, errors="replace"))
+        except LookupError:
+            parts.append(pending_bytes.decode("cp1252", errors="replace"))
+        pending_bytes.clear()
+
+    for match in _RTF_TOKEN.finditer(rtf):
+        word, parameter, hex_byte, symbol, brace, run = match.groups()
+        if pending_bytes and hex_byte is None:
+            flush_bytes()
+
+        if hex_byte is not None:
+            if to_drop:
+                to_drop -= 1
+            elif not skipped:
+                pending_bytes.append(int(hex_byte, 16))
+        elif run is not None:
+            if to_drop:
+                dropped = min(to_drop, len(run))
+                run = run[dropped:]
+                to_drop -= dropped
+            if not skipped:
+                parts.append(run)
+        elif brace == "{":
+            to_drop = 0
+            stack.append((fallback_chars, skipped))
+        elif brace == "}":
+            to_drop = 0
+            if stack:
+                fallback_chars, skipped = stack.pop()
+        elif symbol is not None:
+            to_drop = 0
+            if symbol == "*":
+                skipped = True
+            elif not skipped:
+                parts.append(_RTF_TEXT_SYMBOLS.get(symbol, ""))
+        elif word is not None:
+            to_drop = 0
+            if word in _RTF_SKIPPED_DESTINATIONS:
+                skipped = True
+            elif word == "ansicpg" and parameter:
+                codepage = f"cp{parameter}"
+            elif word == "uc" and parameter:
+                fallback_chars = int(parameter)
+            elif skipped:
+                continue
+            elif word == "u" and parameter:
+                # Values above 32767 are written as negative numbers
+                parts.append(chr(int(parameter) % 65536))
+                to_drop = fallback_chars
+            else:
+                parts.append(_RTF_TEXT_WORDS.get(word, ""))
+
+    if pending_bytes:
+        flush_bytes()
+
+    # Characters outside the BMP arrive as two \uN surrogates
+    return "".join(parts).encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+
+
+def _extract_rtf_text(file_path: str) -> str | None:
+    """Extract text from an RTF file (runs in a worker thread).
+
+    Args:
+        file_path: Path to the RTF file
+
+    Returns:
+        Extracted text content or None if the document has no text
+    """
+    text = _rtf_to_text(decode_text(Path(file_path).read_bytes()))
+    text_lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return "\n".join(text_lines) if text_lines else None
 
 
 class DocumentLoader:
     """Load and parse various document formats."""
 
+    # Formats whose leading bytes can be read without parsing the whole file
+    PREFIX_EXTENSIONS = frozenset({".txt", ".md"})
+
     def __init__(self) -> None:
         """Initialize the document loader."""
         self.config = get_config()
         self.max_file_size_bytes = int(self.config.max_file_size_mb * 1024 * 1024)
-
-    async def load_document(self, file_path: Path) -> str | None:
+        # Loader per (lowercase) extension, so dispatch is a single dict lookup
+        self._loaders: dict[str, Callable[[Path], Awaitable[str | None]]] = {
+            ".txt": self._load_text_file,
+            ".md": self._load_text_file,
+            ".pdf": self._load_pdf_file,
+            ".docx": self._load_docx_file,
+            ".doc": self._load_docx_file,
+            ".rtf": self._load_rtf_file,
+        }
+
+    async def load_document(self, file_path: Path, check_size: bool = True) -> str | None:
         """Load and extract text from a document.
 
         Args:
             file_path: Path to the document file
+            check_size: Whether to stat the file against the size limit; files
+                yielded by :meth:`iter_supported_files` were already checked
 
         Returns:
             Extracted text content or None if failed
         """
         try:
-            # Check file size
-            if not self._validate_file_size(file_path):
-                logger.warning(f"File {file_path} exceeds maximum size limit")
-                return None
-
-            # Check file extension
+            # Check file extension first, it needs no syscall
             extension = file_path.suffix.lower()
-            if extension not in self.config.supported_extensions:
+            if extension not in self.config.supported_extensions_set:
                 logger.warning(f"Unsupported file extension: {extension}")
                 return None
 
+            # Check file size
+            if check_size and not self._validate_file_size(file_path):
+                logger.warning(f"File {file_path} exceeds maximum size limit")
+                return None
+
             # Load based on file type
-            if extension in [".txt", ".md"]:
-                return await self._load_text_file(file_path)
-            elif extension == ".pdf":
-                return await self._load_pdf_file(file_path)
-            elif extension in [".docx", ".doc"]:
-                return await self._load_docx_file(file_path)
-            elif extension == ".rtf":
-                return await self._load_rtf_file(file_path)
-            else:
+            loader = self._loaders.get(extension)
+            if loader is None:
                 logger.warning(f"No loader available for extension: {extension}")
                 return None
+            return await loader(file_path)
 
+        except FileNotFoundError:
+            logger.warning(f"Document not found: {file_path}")
+            return None
         except Exception as e:
             logger.error(f"Error loading document {file_path}: {e}")
             return None
 
+    async def load_document_prefix(
+        self, file_path: Path, n_bytes: int = 4096
+    ) -> str | None:
+        """Load only the beginning of a document, e.g. for language detection.
+
+        Plain text formats are read partially; other formats need a full parse
+        and are truncated afterwards.
+
+        Args:
+            file_path: Path to the document file
+            n_bytes: Number of leading bytes to read from plain text files
+
+        Returns:
+            Leading text content or None if failed
+        """
+        if file_path.suffix.lower() not in self.PREFIX_EXTENSIONS:
+            content = await self.load_document(file_path)
+            return content[:n_bytes] if content else None
+
+        try:
+            data = await asyncio.to_thread(self._read_prefix, file_path, n_bytes)
+            try:
+                # Incremental decoding tolerates a multi-byte character cut at the end
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                content = decoder.decode(data, final=False)
+            except UnicodeDecodeError:
+                content = data.decode("latin-1")
+            return content.strip() or None
+        except Exception as e:
+            logger.error(f"Error reading text file {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def _read_prefix(file_path: Path, n_bytes: int) -> bytes:
+        """Read the first ``n_bytes`` of a file."""
+        with open(file_path, "rb") as file:
+            return file.read(n_bytes)
+
     def _validate_file_size(self, file_path: Path) -> bool:
         """Validate file size against maximum limit.
 
@@ -75,10 +411,15 @@ class DocumentLoader:
 
         Returns:
             True if file size is within limit
+
+        Raises:
+            FileNotFoundError: If the file does not exist
         """
         try:
             file_size = file_path.stat().st_size
             return file_size <= self.max_file_size_bytes
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Error checking file size for {file_path}: {e}")
             return False
@@ -93,18 +434,8 @@ class DocumentLoader:
             File content as string
         """
         try:
-            async with aiofiles.open(file_path, encoding="utf-8") as file:
-                content = await file.read()
-                return content.strip()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                async with aiofiles.open(file_path, encoding="latin-1") as file:
-                    content = await file.read()
-                    return content.strip()
-            except Exception as e:
-                logger.error(f"Error reading text file {file_path}: {e}")
-                return None
+            content = await read_text(file_path)
+            return content.strip()
         except Exception as e:
             logger.error(f"Error reading text file {file_path}: {e}")
             return None
@@ -119,14 +450,30 @@ class DocumentLoader:
             Extracted text content
         """
         try:
-            reader = PdfReader(str(file_path))
-            text_content = []
-
-            for page in reader.pages:
-                text = page.extract_text()
-                if text.strip():
-                    text_content.append(text.strip())
+            loop = asyncio.get_running_loop()
+            pool = _get_parser_pool()
+            path_str = str(file_path)
+            backend = self.config.pdf_backend
+            # The first range also counts the pages, so small PDFs are parsed once
+            page_count, first_chunk = await loop.run_in_executor(
+                pool, _extract_pdf_pages, path_str, 0, PDF_PAGES_PER_CHUNK, backend
+            )
 
+            # The remaining pages of large PDFs are extracted in parallel ranges
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool,
+                        _extract_pdf_pages,
+                        path_str,
+                        start,
+                        start + PDF_PAGES_PER_CHUNK,
+                        backend,
+                    )
+                    for start in range(PDF_PAGES_PER_CHUNK, page_count, PDF_PAGES_PER_CHUNK)
+                )
+            )
+            text_content = first_chunk + [text for _, chunk in chunks for text in chunk]
             return "\n\n".join(text_content) if text_content else None
         except Exception as e:
             logger.error(f"Error reading PDF file {file_path}: {e}")
@@ -141,22 +488,8 @@ class DocumentLoader:
         Returns:
             Extracted text content
         """
-        if not HAS_DOCX:
-            logger.error(
-                "python-docx library not available. Install with: pip install python-docx"
-            )
-            return None
-
         try:
-            doc = DocxDocument(str(file_path))
-            text_content = []
-
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text:
-                    text_content.append(text)
-
-            return "\n\n".join(text_content) if text_content else None
+            return await asyncio.to_thread(_extract_docx_text, str(file_path))
         except Exception as e:
             logger.error(f"Error reading DOCX file {file_path}: {e}")
             return None
@@ -171,36 +504,7 @@ class DocumentLoader:
             Extracted text content
         """
         try:
-            # Basic RTF parsing - remove RTF formatting codes
-            async with aiofiles.open(file_path, encoding="utf-8") as file:
-                content = await file.read()
-
-            # Simple RTF cleanup (basic implementation)
-            lines = content.split("\\n")
-            text_lines = []
-
-            for line in lines:
-                # Remove RTF control sequences
-                clean_line = ""
-                in_control = False
-
-                for char in line:
-                    if char == "\\":
-                        in_control = True
-                    elif char == " " and in_control:
-                        in_control = False
-                    elif not in_control:
-                        clean_line += char
-
-                clean_line = clean_line.strip()
-                if (
-                    clean_line
-                    and not clean_line.startswith("{")
-                    and not clean_line.startswith("}")
-                ):
-                    text_lines.append(clean_line)
-
-            return "\n".join(text_lines) if text_lines else None
+            return await asyncio.to_thread(_extract_rtf_text, str(file_path))
         except Exception as e:
             logger.error(f"Error reading RTF file {file_path}: {e}")
             return None
@@ -214,18 +518,107 @@ class DocumentLoader:
         Returns:
             List of supported file paths
         """
-        supported_files = []
+        return list(self.iter_supported_files(directory))
+
+    def iter_supported_files(
+        self, directory: Path, exclude: Path | None = None
+    ) -> Iterator[Path]:
+        """Lazily yield supported files from a directory recursively.
+
+        Uses ``os.scandir`` so that file type and size come from the directory
+        entry and no list of the whole tree is built up front.
+
+        Args:
+            directory: Directory to scan
+            exclude: Directory to skip while scanning (e.g. the output directory)
+
+        Yields:
+            Supported file paths
+        """
+        excluded = os.path.realpath(exclude) if exclude is not None else None
+        pending = [os.fspath(directory)]
+
+        while pending:
+            files, subdirectories = self._scan_directory(pending.pop(), excluded)
+            yield from files
+            pending.extend(subdirectories)
+
+    async def scan_supported_files(
+        self, directory: Path, exclude: Path | None = None
+    ) -> AsyncIterator[Path]:
+        """Yield supported files, scanning top-level subdirectories in parallel.
+
+        Each top-level subdirectory is walked in its own worker thread so that
+        directory metadata reads overlap and the event loop is never blocked.
+        Set ``PARALLEL_SCAN=false`` to walk one subdirectory at a time (e.g. on
+        rotating disks where parallel reads cause seeking).
+
+        Args:
+            directory: Directory to scan
+            exclude: Directory to skip while scanning (e.g. the output directory)
+
+        Yields:
+            Supported file paths, grouped by top-level subdirectory
+        """
+        excluded = os.path.realpath(exclude) if exclude is not None else None
+        files, subdirectories = await asyncio.to_thread(
+            self._scan_directory, os.fspath(directory), excluded
+        )
+        for file_path in files:
+            yield file_path
+
+        def scan_subtree(subdirectory: str) -> list[Path]:
+            return list(self.iter_supported_files(Path(subdirectory), exclude))
+
+        if not self.config.parallel_scan:
+            for subdirectory in subdirectories:
+                for file_path in await asyncio.to_thread(scan_subtree, subdirectory):
+                    yield file_path
+            return
+
+        scans = [asyncio.to_thread(scan_subtree, subdirectory) for subdirectory in subdirectories]
+        for next_scan in asyncio.as_completed(scans):
+            for file_path in await next_scan:
+                yield file_path
+
+    def _scan_directory(
+        self, directory: str, excluded: str | None
+    ) -> tuple[list[Path], list[str]]:
+        """List the supported files and subdirectories of a single directory.
+
+        Args:
+            directory: Directory to scan
+            excluded: Real path of a directory to skip (optional)
+
+        Returns:
+            Supported file paths and subdirectory paths
+        """
+        files: list[Path] = []
+        subdirectories: list[str] = []
+        # Only a subdirectory with the excluded directory's name needs resolving
+        excluded_name = os.path.basename(excluded) if excluded is not None else None
 
         try:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    extension = file_path.suffix.lower()
-                    if extension in self.config.supported_extensions:
-                        if self._validate_file_size(file_path):
-                            supported_files.append(file_path)
-                        else:
-                            logger.warning(f"Skipping {file_path}: file too large")
-        except Exception as e:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != excluded_name or os.path.realpath(entry.path) != excluded:
+                            subdirectories.append(entry.path)
+                        continue
+
+                    if not entry.is_file():
+                        continue
+
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    if extension not in self.config.supported_extensions_set:
+                        continue
+
+                    file_path = Path(entry.path)
+                    if entry.stat().st_size <= self.max_file_size_bytes:
+                        files.append(file_path)
+                    else:
+                        logger.warning(f"Skipping {file_path}: file too large")
+        except OSError as e:
             logger.error(f"Error scanning directory {directory}: {e}")
 
-        return supported_files
+        return files, subdirectories
@@ -0,0 +1,87 @@
+"""Asynchronous whole-file reads and writes for documents and translations."""
+
+import asyncio
+from pathlib import Path
+
+try:
+    from aiofile import AIOFile
+
+    HAS_AIOFILE = True
+except ImportError:
+    HAS_AIOFILE = False
+    AIOFile = None
+
+
+def decode_text(data: bytes) -> str:
+    """Decode file contents as UTF-8, falling back to latin-1.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        Decoded text
+    """
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+def _read_text(file_path: Path) -> str:
+    """Read and decode a text file (runs in a worker thread).
+
+    Args:
+        file_path: Path to the text file
+
+    Returns:
+        Decoded file content
+    """
+    return decode_text(file_path.read_bytes())
+
+
+def write_file(target_file: Path, data: bytes) -> None:
+    """Write a file, creating its parent directories first (runs in a worker thread).
+
+    Args:
+        target_file: Target file path
+        data: File contents
+    """
+    target_file.parent.mkdir(parents=True, exist_ok=True)
+    target_file.write_bytes(data)
+
+
+async def read_text(file_path: Path) -> str:
+    """Read and decode a text file without blocking the event loop.
+
+    Uses ``aiofile`` (kernel AIO via ``caio`` on Linux) when installed, so many
+    concurrent reads share one I/O context instead of occupying a worker thread
+    each. Otherwise the read and decode run in a single worker-thread call.
+
+    Args:
+        file_path: Path to the text file
+
+    Returns:
+        Decoded file content
+    """
+    if not HAS_AIOFILE:
+        return await asyncio.to_thread(_read_text, file_path)
+
+    async with AIOFile(str(file_path), "rb") as afp:
+        data = await afp.read()
+    return decode_text(data)
+
+
+async def write_bytes(target_file: Path, data: bytes) -> None:
+    """Write a file without blocking the event loop, creating parent directories.
+
+    Args:
+        target_file: Target file path
+        data: File contents
+    """
+    if not HAS_AIOFILE:
+        await asyncio.to_thread(write_file, target_file, data)
+        return
+
+    target_file.parent.mkdir(parents=True, exist_ok=True)
+    async with AIOFile(str(target_file), "wb") as afp:
+        await afp.write(data)
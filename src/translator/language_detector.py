@@ -1,64 +1,350 @@
 """Language detection utilities."""
 
-from typing import TYPE_CHECKING
-
-from langdetect import detect, detect_langs
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from langdetect.detector_factory import PROFILES_DIRECTORY, DetectorFactory
+from langdetect.language import Language
 from loguru import logger
 
-from .config import get_language_mapping
+from .cache import DetectionCache, content_hash
+from .config import get_config, get_language_mapping
+
+# Number of leading characters that are enough for stable detection
+DETECTION_PREFIX_CHARS = 4096
+
+# Texts shorter than this (ignoring surrounding whitespace) are too short
+# for reliable n-gram detection
+DETECTION_MIN_CHARS = 20
+
+# Number of detection results kept in memory per detector
+DETECTION_MEMO_SIZE = 1024
+
+try:
+    import fasttext
+
+    HAS_FASTTEXT = True
+except ImportError:
+    HAS_FASTTEXT = False
+    fasttext = None
+
+try:
+    import gcld3
+
+    HAS_GCLD3 = True
+except ImportError:
+    HAS_GCLD3 = False
+    gcld3 = None
+
+# CLD3 identifiers are not shared between the threads detection runs in
+_cld3_local = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _load_fasttext_model(model_file: str) -> Any | None:
+    """Load a fastText language identification model once per process.
+
+    Args:
+        model_file: Path to the model file (e.g. lid.176.ftz)
+
+    Returns:
+        Loaded model or None if it could not be loaded
+    """
+    try:
+        return fasttext.load_model(str(Path(model_file).expanduser()))
+    except Exception as e:
+        logger.warning(f"Could not load fastText model {model_file}: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_langdetect_factory() -> DetectorFactory:
+    """Build a langdetect factory with all of its language profiles, once per process.
+
+    All profiles are needed even though only a few languages are supported:
+    scored against a subset, text in any other language (e.g. Dutch) is
+    confidently assigned to the closest supported one (German) instead of
+    coming back as an unsupported language.
+
+    Returns:
+        Detector factory
+    """
+    factory = DetectorFactory()
+    factory.load_profile(PROFILES_DIRECTORY)
+    return factory
+
 
-if TYPE_CHECKING:
-    pass
+def _detect(text: str) -> str:
+    """Detect the most likely langdetect language code of a text.
+
+    Args:
+        text: Text content to analyze
+
+    Returns:
+        langdetect language code
+    """
+    detector = _get_langdetect_factory().create()
+    detector.append(text)
+    return detector.detect()
+
+
+def _detect_cld3(text: str) -> str | None:
+    """Detect the language of a text with CLD3 (compiled, much faster than langdetect).
+
+    Args:
+        text: Text content to analyze
+
+    Returns:
+        CLD3 language code, or None if the result is not reliable
+    """
+    identifier = getattr(_cld3_local, "identifier", None)
+    if identifier is None:
+        identifier = gcld3.NNetLanguageIdentifier(
+            min_num_bytes=0, max_num_bytes=DETECTION_PREFIX_CHARS * 4
+        )
+        _cld3_local.identifier = identifier
+    result = identifier.FindLanguage(text=text)
+    return result.language if result.is_reliable else None
+
+
+def _detect_langs(text: str) -> list[Language]:
+    """Detect candidate langdetect languages with probabilities.
+
+    Args:
+        text: Text content to analyze
+
+    Returns:
+        Candidate languages sorted by probability
+    """
+    detector = _get_langdetect_factory().create()
+    detector.append(text)
+    return detector.get_probabilities()
 
 
 class LanguageDetector:
     """Detect the language of text content."""
 
-    def __init__(self) -> None:
-        """Initialize the language detector."""
+    def __init__(self, cache: DetectionCache | None = None) -> None:
+        """Initialize the language detector.
+
+        Args:
+            cache: Detection cache to use (defaults to the configured cache file)
+        """
         self.language_mapping = get_language_mapping()
+        # langdetect code -> our code, built once for O(1) lookups
+        # (Traditional Chinese is supported separately from Simplified)
+        self._langdetect_to_code = {
+            **self.language_mapping.LANGDETECT_CODES,
+            "zh-tw": "zh-tw",
+        }
+        self.cache = cache if cache is not None else self._create_default_cache()
+        # In-memory LRU in front of the persistent cache, keyed by content hash.
+        # Detection runs in worker threads, so the LRU is only touched under a lock
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+        config = get_config()
+        backend = config.detection_backend
+        model_file = config.fasttext_model_file
+        self.fasttext_model = (
+            _load_fasttext_model(model_file)
+            if HAS_FASTTEXT and model_file and backend in ("auto", "fasttext")
+            else None
+        )
+        if backend == "fasttext" and self.fasttext_model is None:
+            logger.warning("fastText model not available, falling back to langdetect")
+        if backend == "cld3" and not HAS_GCLD3:
+            logger.warning("gcld3 not installed, falling back to langdetect")
+        self.use_cld3 = (
+            HAS_GCLD3 and self.fasttext_model is None and backend in ("auto", "cld3")
+        )
+        # Backend (and model) in use, so cached results of another one are not reused
+        if self.fasttext_model is not None:
+            self.backend = f"fasttext:{Path(model_file).expanduser().resolve()}"
+        elif self.use_cld3:
+            self.backend = "cld3"
+        else:
+            self.backend = "langdetect"
+
+    @staticmethod
+    def _create_default_cache() -> DetectionCache | None:
+        """Create the detection cache configured in settings, if enabled."""
+        cache_file = get_config().detection_cache_file
+        if not cache_file:
+            return None
+
+        try:
+            return DetectionCache(Path(cache_file).expanduser())
+        except Exception as e:
+            logger.warning(f"Language detection cache disabled: {e}")
+            return None
 
-    def detect_language(self, text: str) -> str | None:
+    def _get_cached_language(self, text: str) -> str | None:
+        """Look up a detection result in memory, then in the persistent cache."""
+        key = content_hash(text)
+        with self._memo_lock:
+            cached_lang = self._memo.get(key)
+            if cached_lang is not None:
+                self._memo.move_to_end(key)
+                return cached_lang
+
+        cached_lang = (
+            self.cache.get_language(text, self.backend) if self.cache is not None else None
+        )
+        if cached_lang:
+            self._remember(key, cached_lang)
+        return cached_lang
+
+    def _set_cached_language(self, text: str, language: str) -> None:
+        """Store a detection result in memory and in the persistent cache."""
+        self._remember(content_hash(text), language)
+        if self.cache is not None:
+            self.cache.set_language(text, language, self.backend)
+
+    def _remember(self, key: str, language: str) -> None:
+        """Add a result to the in-memory LRU, evicting the oldest entry if full."""
+        with self._memo_lock:
+            self._memo[key] = language
+            self._memo.move_to_end(key)
+            if len(self._memo) > DETECTION_MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def detect_language(
+        self, text: str, max_chars: int = DETECTION_PREFIX_CHARS
+    ) -> str | None:
         """Detect the language of the given text.
 
         Args:
             text: Text content to analyze
+            max_chars: Only the first ``max_chars`` characters are analyzed
 
         Returns:
-            Detected language code or None if detection failed
+            Detected language code or None if detection failed or the text is too short
         """
-        if not text or not text.strip():
+        text = text[:max_chars] if text else text
+        if not text or len(text.strip()) < DETECTION_MIN_CHARS:
             return None
 
-        try:
-            # Use langdetect to identify the language
-            detected_lang = detect(text)
+        cached_lang = self._get_cached_language(text)
+        if cached_lang:
+            logger.debug(f"Detected language (cached): {cached_lang}")
+            return cached_lang
 
-            # Map to our supported language codes
-            mapped_lang = self._map_langdetect_code(detected_lang)
+        try:
+            mapped_lang = self._detect_code(text)
 
-            logger.info(f"Detected language: {detected_lang} -> {mapped_lang}")
+            logger.info(f"Detected language: {mapped_lang}")
+            if mapped_lang:
+                self._set_cached_language(text, mapped_lang)
             return mapped_lang
 
         except Exception as e:
             logger.error(f"Error detecting language: {e}")
             return None
 
-    def detect_language_with_confidence(self, text: str) -> list[tuple[str, float]]:
+    def _detect_code(self, text: str) -> str | None:
+        """Detect a text's language with the configured backend.
+
+        Args:
+            text: Text content to analyze
+
+        Returns:
+            Supported language code, or None if not detected or not supported
+        """
+        if self.fasttext_model is not None:
+            # fastText classifies single lines, so flatten newlines first
+            labels, _ = self.fasttext_model.predict([text.replace("\n", " ")], k=1)
+            return self._map_fasttext_label(labels[0][0]) if labels[0] else None
+
+        if self.use_cld3:
+            # CLD3 reports ISO 639-1 codes like langdetect does
+            cld3_code = _detect_cld3(text)
+            return self._map_langdetect_code(cld3_code) if cld3_code else None
+
+        return self._map_langdetect_code(_detect(text))
+
+    def detect_batch(
+        self, texts: list[str], max_chars: int = DETECTION_PREFIX_CHARS
+    ) -> list[str | None]:
+        """Detect the language of many texts at once.
+
+        Uses a single fastText call for all uncached texts when a model is
+        configured, and falls back to per-text detection otherwise.
+
+        Args:
+            texts: Text contents to analyze
+            max_chars: Only the first ``max_chars`` characters of each text are analyzed
+
+        Returns:
+            Detected language codes (None where detection failed), in input order
+        """
+        texts = [text[:max_chars] for text in texts]
+        results: list[str | None] = [None] * len(texts)
+        pending: list[int] = []
+
+        for i, text in enumerate(texts):
+            # Same threshold as detect_language, so both entry points agree
+            if not text or len(text.strip()) < DETECTION_MIN_CHARS:
+                continue
+            cached_lang = self._get_cached_language(text)
+            if cached_lang:
+                results[i] = cached_lang
+            else:
+                pending.append(i)
+
+        if not pending:
+            return results
+
+        if self.fasttext_model is None:
+            for i in pending:
+                results[i] = self.detect_language(texts[i], max_chars=max_chars)
+            return results
+
+        try:
+            # fastText classifies single lines, so flatten newlines first
+            labels, _ = self.fasttext_model.predict(
+                [texts[i].replace("\n", " ") for i in pending], k=1
+            )
+        except Exception as e:
+            logger.error(f"Error detecting languages in batch: {e}")
+            return results
+
+        for i, label in zip(pending, labels, strict=True):
+            mapped_lang = self._map_fasttext_label(label[0]) if label else None
+            results[i] = mapped_lang
+            if mapped_lang:
+                self._set_cached_language(texts[i], mapped_lang)
+
+        return results
+
+    def detect_language_with_confidence(
+        self, text: str, max_chars: int = DETECTION_PREFIX_CHARS
+    ) -> list[tuple[str, float]]:
         """Detect languages with confidence scores.
 
         Args:
             text: Text content to analyze
+            max_chars: Only the first ``max_chars`` characters are analyzed
 
         Returns:
             List of (language_code, confidence) tuples, sorted by confidence
         """
-        if not text or not text.strip():
+        text = text[:max_chars] if text else text
+        if not text or len(text.strip()) < DETECTION_MIN_CHARS:
             return []
 
+        if self.cache is not None:
+            # Confidences always come from langdetect, whatever the backend
+            cached_results = self.cache.get_confidences(text, "langdetect")
+            if cached_results is not None:
+                return cached_results
+
         try:
             # Get language probabilities
-            lang_probs = detect_langs(text)
+            lang_probs = _detect_langs(text)
 
             # Map to our supported codes and return with confidence
             results = []
@@ -67,6 +353,8 @@ class LanguageDetector:
                 if mapped_lang:
                     results.append((mapped_lang, lang_prob.prob))
 
+            if self.cache is not None:
+                self.cache.set_confidences(text, results, "langdetect")
             return results
 
         except Exception as e:
@@ -82,16 +370,9 @@ class LanguageDetector:
         Returns:
             Mapped language code or None if not supported
         """
-        # Direct mapping for exact matches
-        for our_code, detect_code in self.language_mapping.LANGDETECT_CODES.items():
-            if detect_code == langdetect_code:
-                return our_code
-
-        # Handle special cases
-        if langdetect_code == "zh-cn":
-            return "zh"
-        elif langdetect_code == "zh-tw":
-            return "zh-tw"
+        mapped_code = self._langdetect_to_code.get(langdetect_code)
+        if mapped_code:
+            return mapped_code
 
         # If no mapping found, check if it's already one of our codes
         if langdetect_code in self.language_mapping.LANGUAGE_NAMES:
@@ -99,6 +380,20 @@ class LanguageDetector:
 
         return None
 
+    def _map_fasttext_label(self, label: str) -> str | None:
+        """Map a fastText label (e.g. ``__label__en``) to our supported codes.
+
+        Args:
+            label: Label predicted by fastText
+
+        Returns:
+            Mapped language code or None if not supported
+        """
+        code = label.removeprefix("__label__")
+        if code in self.language_mapping.LANGUAGE_NAMES:
+            return code
+        return self._map_langdetect_code(code)
+
     def is_supported_language(self, language_code: str) -> bool:
         """Check if a language code is supported.
 
@@ -127,4 +422,4 @@ class LanguageDetector:
         Returns:
             Dictionary mapping language codes to names
         """
-        return self.language_mapping.LANGUAGE_NAMES.copy()
+        return dict(self.language_mapping.LANGUAGE_NAMES)
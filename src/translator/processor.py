@@ -1,69 +1,255 @@
 """Main translation processor for batch document translation."""
 
 import asyncio
+import re
+from collections import defaultdict
+from collections.abc import AsyncIterator, Coroutine
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Any, BinaryIO
 
-import aiofiles
 from loguru import logger
 from rich.console import Console
-from rich.progress import Progress, TaskID
+from rich.progress import Progress
 
+from .cache import TranslationManifest, file_hash
 from .config import get_config
 from .document_loader import DocumentLoader
-from .language_detector import LanguageDetector
-from .translation_service import TranslationManager
-
-if TYPE_CHECKING:
-    pass
+from .file_io import write_bytes
+from .language_detector import DETECTION_PREFIX_CHARS, LanguageDetector
+from .translation_service import TranslationBatcher, TranslationManager
 
 
+@dataclass(slots=True, frozen=True)
 class TranslationResult:
-    """Result of a translation operation."""
+    """Result of a translation operation.
+
+    Slotted, since a large run may produce one per file and target language,
+    and immutable (so hashable) once reported.
+    """
+
+    source_file: Path  # Source file path
+    target_file: Path  # Target file path
+    source_language: str | None  # Detected source language
+    target_language: str  # Target language
+    success: bool  # Whether translation was successful
+    error: str | None = None  # Error message if failed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary.
+
+        Returns:
+            Result fields, with paths as strings
+        """
+        return {
+            "source_file": str(self.source_file),
+            "target_file": str(self.target_file),
+            "source_language": self.source_language,
+            "target_language": self.target_language,
+            "success": self.success,
+            "error": self.error,
+        }
+
+
+class TranslationSummary:
+    """Running totals of translation results, kept without storing every result."""
+
+    __slots__ = ("by_language", "failed", "successful")
+
+    def __init__(self) -> None:
+        """Initialize an empty summary."""
+        self.successful = 0
+        self.failed: list[TranslationResult] = []
+        self.by_language: defaultdict[str, int] = defaultdict(int)
+
+    @property
+    def total(self) -> int:
+        """Number of results added."""
+        return self.successful + len(self.failed)
+
+    def add(self, result: TranslationResult) -> None:
+        """Count a translation result.
+
+        Only failed results are kept, so they can be listed in the report.
+
+        Args:
+            result: Translation result
+        """
+        if result.success:
+            self.successful += 1
+            self.by_language[result.target_language] += 1
+        else:
+            self.failed.append(result)
+
+
+# Write buffer for translations streamed to disk chunk by chunk
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Blank lines separating paragraphs, and Markdown code fence lines
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_CODE_FENCE = re.compile(r"(?m)^[ \t]*(?:```|~~~)")
+
+
+def _split_blocks(text: str) -> list[str]:
+    """Split text into paragraphs, keeping fenced code blocks in one piece.
+
+    Leading indentation is kept, since it is meaningful in Markdown and code.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-blank paragraphs and code blocks in document order
+    """
+    blocks: list[str] = []
+    current: list[str] = []
+    fences = 0
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip("\n").rstrip()
+        if not paragraph:
+            continue
+        current.append(paragraph)
+        fences += len(_CODE_FENCE.findall(paragraph))
+        # An odd number of fences means a code block is still open
+        if fences % 2 == 0:
+            blocks.append("\n\n".join(current))
+            current, fences = [], 0
+
+    if current:
+        blocks.append("\n\n".join(current))
+    return blocks
+
+
+def _split_into_chunks(text: str, max_chars: int) -> list[str]:
+    """Split text into chunks of whole paragraphs of at most ``max_chars``.
+
+    Fenced code blocks count as one paragraph. Paragraphs longer than
+    ``max_chars`` are split at line breaks, and lines that are still too
+    long are cut at ``max_chars``.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Non-empty chunks in document order
+    """
+    pieces: list[str] = []
+    for block in _split_blocks(text):
+        if len(block) <= max_chars:
+            pieces.append(block)
+            continue
+        for line in block.splitlines():
+            pieces.extend(line[i : i + max_chars] for i in range(0, len(line), max_chars))
+
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in pieces:
+        if not piece.strip():
+            continue
+        if current and size + len(piece) > max_chars:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 2
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _open_for_writing(file_path: Path) -> BinaryIO:
+    """Open a file for buffered binary writing, creating its parent directories first.
+
+    The large buffer lets the translated chunks of a document reach the disk
+    in a few big writes rather than one small write per chunk.
+
+    Args:
+        file_path: File path
+
+    Returns:
+        Open file object
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    return file_path.open("wb", buffering=OUTPUT_BUFFER_SIZE)
+
+
+class _FileJob:
+    """A source file passing through the load, detect and translate stages."""
+
+    __slots__ = (
+        "content",
+        "file_path",
+        "manifest_key",
+        "source_hash",
+        "source_language",
+        "targets",
+    )
 
     def __init__(
         self,
-        source_file: Path,
-        target_file: Path,
-        source_language: str | None,
-        target_language: str,
-        success: bool,
-        error: str | None = None,
+        file_path: Path,
+        manifest_key: str,
+        source_hash: str | None,
+        targets: dict[str, Path],
+        content: str,
+        source_language: str | None = None,
     ) -> None:
-        """Initialize a translation result.
+        """Initialize a file job.
 
         Args:
-            source_file: Source file path
-            target_file: Target file path
-            source_language: Detected source language
-            target_language: Target language
-            success: Whether translation was successful
-            error: Error message if failed
+            file_path: Path to the source file
+            manifest_key: Source path relative to the source directory
+            source_hash: Hash of the source file contents (optional)
+            targets: Output paths of the translations still needed, by language
+            content: Loaded document text
+            source_language: Source language if already known (optional)
         """
-        self.source_file = source_file
-        self.target_file = target_file
+        self.file_path = file_path
+        self.manifest_key = manifest_key
+        self.source_hash = source_hash
+        self.targets = targets
+        self.content = content
         self.source_language = source_language
-        self.target_language = target_language
-        self.success = success
-        self.error = error
 
 
 class DocumentTranslator:
     """Main document translator with batch processing capabilities."""
 
     def __init__(self) -> None:
-        """Initialize the document translator."""
+        """Initialize the document translator.
+
+        The loader, detector and translation manager are created on first use,
+        so constructing a translator does not load models or open caches.
+        """
         self.config = get_config()
-        self.document_loader = DocumentLoader()
-        self.language_detector = LanguageDetector()
-        self.translation_manager = TranslationManager()
         self.console = Console()
 
+    @cached_property
+    def document_loader(self) -> DocumentLoader:
+        """Document loader, created on first use."""
+        return DocumentLoader()
+
+    @cached_property
+    def language_detector(self) -> LanguageDetector:
+        """Language detector, created (and its models loaded) on first use."""
+        return LanguageDetector()
+
+    @cached_property
+    def translation_manager(self) -> TranslationManager:
+        """Translation manager sharing the language detector, created on first use."""
+        manager = TranslationManager(detector=self.language_detector)
+        manager.set_connection_limit(self.config.batch_size)
+        return manager
+
     async def translate_directory(
         self,
         source_directory: Path,
         target_languages: list[str] | None = None,
         output_directory: Path | None = None,
+        concurrency: int | None = None,
     ) -> list[TranslationResult]:
         """Translate all supported documents in a directory.
 
@@ -71,16 +257,63 @@ class DocumentTranslator:
             source_directory: Directory containing source documents
             target_languages: List of target language codes (defaults to all supported)
             output_directory: Output directory (defaults to config setting)
+            concurrency: Maximum translation requests in flight (defaults to
+                the configured batch size)
 
         Returns:
-            List of translation results
+            List of translation results (use ``translate_directory_stream`` to
+            avoid holding them all for large directories)
+        """
+        valid_results = [
+            result
+            async for result in self.translate_directory_stream(
+                source_directory, target_languages, output_directory, concurrency
+            )
+        ]
+
+        # Log summary
+        successful = sum(1 for r in valid_results if r.success)
+        failed = len(valid_results) - successful
+        logger.info(f"Translation completed: {successful} successful, {failed} failed")
+
+        return valid_results
+
+    async def translate_directory_stream(
+        self,
+        source_directory: Path,
+        target_languages: list[str] | None = None,
+        output_directory: Path | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncIterator[TranslationResult]:
+        """Translate all supported documents in a directory, yielding results.
+
+        Results are yielded as soon as each file/language pair completes, so
+        callers can report progress without waiting for the whole directory.
+
+        Args:
+            source_directory: Directory containing source documents
+            target_languages: List of target language codes (defaults to all supported)
+            output_directory: Output directory (defaults to config setting)
+            concurrency: Maximum translation requests in flight (defaults to
+                the configured batch size)
+
+        Yields:
+            Translation results in completion order
         """
         if not source_directory.exists() or not source_directory.is_dir():
             raise ValueError(f"Source directory does not exist: {source_directory}")
 
         # Use configured target languages if none specified
         if target_languages is None:
-            target_languages = self.config.supported_languages.copy()
+            target_languages = list(self.config.supported_languages)
+
+        unsupported = [
+            lang
+            for lang in target_languages
+            if lang not in self.config.supported_languages_set
+        ]
+        if unsupported:
+            raise ValueError(f"Unsupported target languages: {', '.join(unsupported)}")
 
         # Set up output directory
         if output_directory is None:
@@ -91,104 +324,223 @@ class DocumentTranslator:
         logger.info(f"Target languages: {target_languages}")
         logger.info(f"Output directory: {output_directory}")
 
-        # Get all supported files
-        supported_files = await self.document_loader.get_supported_files(
-            source_directory
+        # Files flow through load -> detect -> translate stages connected by
+        # bounded queues, so scanning, loading and translation overlap while
+        # memory stays capped
+        concurrency = max(1, concurrency or self.config.batch_size)
+        self.translation_manager.set_connection_limit(concurrency)
+        paths: asyncio.Queue[Path | None] = asyncio.Queue(maxsize=concurrency * 4)
+        loaded: asyncio.Queue[_FileJob | None] = asyncio.Queue(maxsize=concurrency * 2)
+        detected: asyncio.Queue[_FileJob | None] = asyncio.Queue(maxsize=concurrency * 2)
+        results: asyncio.Queue[TranslationResult | None] = asyncio.Queue()
+        # Bounds in-flight translation requests across all files and languages
+        semaphore = asyncio.Semaphore(concurrency)
+        # Small documents share requests instead of paying one round-trip each
+        batcher = (
+            TranslationBatcher(self.translation_manager, semaphore=semaphore)
+            if self.config.batch_document_chars > 0
+            else None
         )
-        if not supported_files:
-            logger.warning("No supported files found in source directory")
-            return []
-
-        logger.info(f"Found {len(supported_files)} supported files")
-
-        # Process files in batches
-        results = []
-        semaphore = asyncio.Semaphore(self.config.batch_size)
-
-        with Progress() as progress:
-            task = progress.add_task(
-                "Translating documents...",
-                total=len(supported_files) * len(target_languages),
-            )
-
-            async def process_file_language_pair(
-                file_path: Path, target_lang: str, task_id: TaskID
-            ) -> TranslationResult:
-                async with semaphore:
-                    result = await self._translate_single_file(
-                        file_path, target_lang, source_directory, output_directory
+        # Source hashes of earlier runs, used to skip unchanged files
+        manifest = TranslationManifest(output_directory)
+        file_count = 0
+
+        async def stage(
+            workers: list[Coroutine[Any, Any, None]],
+            downstream: asyncio.Queue[Any],
+            sentinels: int,
+        ) -> None:
+            """Run a stage's workers, then signal the end of input downstream.
+
+            If a worker fails, the whole pipeline is cancelled instead, so no
+            end-of-input signal is needed.
+            """
+            async with asyncio.TaskGroup() as group:
+                for worker in workers:
+                    group.create_task(worker)
+            for _ in range(sentinels):
+                await downstream.put(None)
+
+        async def produce() -> None:
+            nonlocal file_count
+            async for file_path in self.document_loader.scan_supported_files(
+                source_directory, exclude=output_directory
+            ):
+                file_count += 1
+                progress.update(task, total=file_count * len(target_languages))
+                await paths.put(file_path)
+
+        async def load() -> None:
+            while (file_path := await paths.get()) is not None:
+                try:
+                    job, file_results = await self._load_file(
+                        file_path,
+                        target_languages,
+                        source_directory,
+                        output_directory,
+                        manifest,
                     )
-                    progress.update(task_id, advance=1)
-                    return result
-
-            # Create tasks for all file-language combinations
-            tasks = []
-            for file_path in supported_files:
-                for target_lang in target_languages:
-                    task_coro = process_file_language_pair(file_path, target_lang, task)
-                    tasks.append(task_coro)
-
-            # Execute all tasks
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out exceptions and log them
-        valid_results = []
-        for result in results:
-            if isinstance(result, TranslationResult):
-                valid_results.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Translation task failed: {result}")
-
-        # Log summary
-        successful = sum(1 for r in valid_results if r.success)
-        failed = len(valid_results) - successful
-        logger.info(f"Translation completed: {successful} successful, {failed} failed")
-
-        return valid_results
+                    for result in file_results:
+                        await results.put(result)
+                    if job is not None:
+                        await loaded.put(job)
+                except Exception as e:
+                    logger.error(f"Loading failed for {file_path}: {e}")
+
+        async def detect() -> None:
+            done = False
+            while not done:
+                # Detect everything that is already loaded in one batch
+                jobs = []
+                job = await loaded.get()
+                while job is not None:
+                    jobs.append(job)
+                    if loaded.empty():
+                        break
+                    job = loaded.get_nowait()
+                done = job is None
+
+                if jobs:
+                    await self._detect_languages(jobs)
+                    for job in jobs:
+                        await detected.put(job)
+
+        async def translate() -> None:
+            while (job := await detected.get()) is not None:
+                try:
+                    for result in await self._translate_job(
+                        job, semaphore, batcher, manifest
+                    ):
+                        await results.put(result)
+                except Exception as e:
+                    logger.error(f"Translation task failed for {job.file_path}: {e}")
+
+        async def run() -> None:
+            try:
+                # A failing stage cancels all the others instead of leaving them orphaned
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(stage([produce()], paths, concurrency))
+                    group.create_task(stage([load() for _ in range(concurrency)], loaded, 1))
+                    group.create_task(stage([detect()], detected, concurrency))
+                    for _ in range(concurrency):
+                        group.create_task(translate())
+            except BaseExceptionGroup as errors:
+                # Report the first underlying failure rather than the nested groups
+                error: BaseException = errors
+                while isinstance(error, BaseExceptionGroup):
+                    error = error.exceptions[0]
+                raise error from errors
+            finally:
+                await results.put(None)
+
+        with Progress(console=self.console) as progress:
+            task = progress.add_task("Translating documents...", total=None)
+
+            runner = asyncio.create_task(run())
+            try:
+                while (result := await results.get()) is not None:
+                    progress.update(task, advance=1)
+                    yield result
+                # Propagate unexpected scan errors
+                await runner
+            finally:
+                runner.cancel()
+                # Let cancelled stages finish before the manifest is serialized
+                await asyncio.wait([runner])
+                manifest.save()
+
+        if not file_count:
+            logger.warning("No supported files found in source directory")
+        else:
+            logger.info(f"Found {file_count} supported files")
 
-    async def _translate_single_file(
+    async def _load_file(
         self,
         file_path: Path,
-        target_language: str,
+        target_languages: list[str],
         source_directory: Path,
         output_directory: Path,
-    ) -> TranslationResult:
-        """Translate a single file to a target language.
+        manifest: TranslationManifest | None = None,
+    ) -> tuple["_FileJob | None", list[TranslationResult]]:
+        """Work out which translations a file needs and load it if any are.
+
+        Existing translations are kept unless the manifest shows the source
+        changed since they were produced.
 
         Args:
             file_path: Path to the source file
-            target_language: Target language code
+            target_languages: Target language codes
             source_directory: Base source directory
             output_directory: Base output directory
+            manifest: Source hashes of previous translations (optional)
 
         Returns:
-            Translation result
+            The loaded file job (None if nothing needs translating) and the
+            results already known for skipped or unloadable targets
         """
-        try:
-            # Generate output file path
-            relative_path = file_path.relative_to(source_directory)
+        relative_path = file_path.relative_to(source_directory)
+        manifest_key = relative_path.as_posix()
+        source_hash = (
+            await asyncio.to_thread(file_hash, file_path) if manifest is not None else None
+        )
+        results = []
+        pending: dict[str, Path] = {}
+
+        for target_language in target_languages:
             target_file = self._generate_output_path(
                 relative_path, target_language, output_directory
             )
 
-            # Skip if file already exists and not overwriting
-            if target_file.exists() and not self.config.overwrite_existing:
+            # Skip if file already exists, not overwriting and the source is unchanged
+            recorded_hash = (
+                manifest.get(manifest_key, target_language) if manifest is not None else None
+            )
+            if (
+                target_file.exists()
+                and not self.config.overwrite_existing
+                and recorded_hash in (None, source_hash)
+            ):
                 logger.info(f"Skipping existing file: {target_file}")
-                return TranslationResult(
+                results.append(
+                    TranslationResult(
+                        source_file=file_path,
+                        target_file=target_file,
+                        source_language=None,
+                        target_language=target_language,
+                        success=True,
+                    )
+                )
+            else:
+                pending[target_language] = target_file
+
+        if not pending:
+            return None, results
+
+        # Drop targets the document is already in before paying for a full load
+        source_language = await self._early_source_language(file_path, relative_path, pending)
+        if source_language in pending:
+            logger.info(f"Document already in target language ({source_language}): {file_path}")
+            results.append(
+                TranslationResult(
                     source_file=file_path,
-                    target_file=target_file,
-                    source_language=None,
-                    target_language=target_language,
+                    target_file=pending.pop(source_language),
+                    source_language=source_language,
+                    target_language=source_language,
                     success=True,
                 )
-
-            # Load document content
-            logger.info(f"Loading document: {file_path}")
-            content = await self.document_loader.load_document(file_path)
-            if not content:
-                error_msg = "Failed to load document content"
-                logger.error(f"{error_msg}: {file_path}")
-                return TranslationResult(
+            )
+            if not pending:
+                return None, results
+
+        # Load document content once for all target languages
+        logger.info(f"Loading document: {file_path}")
+        # The directory scan already checked the size from its directory entry
+        content = await self.document_loader.load_document(file_path, check_size=False)
+        if not content:
+            error_msg = "Failed to load document content"
+            logger.error(f"{error_msg}: {file_path}")
+            results.extend(
+                TranslationResult(
                     source_file=file_path,
                     target_file=target_file,
                     source_language=None,
@@ -196,11 +548,149 @@ class DocumentTranslator:
                     success=False,
                     error=error_msg,
                 )
+                for target_language, target_file in pending.items()
+            )
+            return None, results
+
+        job = _FileJob(file_path, manifest_key, source_hash, pending, content, source_language)
+        return job, results
+
+    async def _early_source_language(
+        self, file_path: Path, relative_path: Path, pending: dict[str, Path]
+    ) -> str | None:
+        """Work out a file's source language before loading it, where that is cheap.
+
+        With ``filename_language_hints`` enabled, a language code ending the
+        file name (``guide_ja.md``, ``guide.ja.md``) or naming a top-level
+        directory (``ja/guide.md``) is taken as the source language. Otherwise,
+        when a single target is pending, the start of a plain text file is
+        detected so a document already in that language is never fully loaded.
+
+        Args:
+            file_path: Path to the source file
+            relative_path: Source path relative to the source directory
+            pending: Output paths of the translations still needed, by language
+
+        Returns:
+            Source language code or None if not known yet
+        """
+        if self.config.filename_language_hints:
+            supported = self.config.supported_languages_set
+            candidates = []
+            for separator in ("_", "."):
+                stem, found, code = relative_path.stem.rpartition(separator)
+                if found and stem:
+                    candidates.append(code)
+            # Only a directory directly under the source root, not any path component
+            if len(relative_path.parts) == 2:
+                candidates.append(relative_path.parts[0])
+            for candidate in candidates:
+                if candidate.lower() in supported:
+                    logger.info(f"Taking {candidate.lower()} from the path of {relative_path}")
+                    return candidate.lower()
+
+        # With several targets the document is loaded anyway; detect it in batch
+        if len(pending) != 1 or file_path.suffix.lower() not in DocumentLoader.PREFIX_EXTENSIONS:
+            return None
+
+        prefix = await self.document_loader.load_document_prefix(
+            file_path, n_bytes=DETECTION_PREFIX_CHARS
+        )
+        if not prefix:
+            return None
+        return await asyncio.to_thread(self.language_detector.detect_language, prefix)
+
+    async def _detect_languages(self, jobs: list["_FileJob"]) -> None:
+        """Detect the source language of loaded files in one batch.
+
+        Detection runs in a worker thread so it does not block the event loop.
+
+        Args:
+            jobs: Loaded file jobs; their ``source_language`` is filled in
+                unless it was already known before loading
+        """
+        jobs = [job for job in jobs if job.source_language is None]
+        if not jobs:
+            return
+
+        logger.info(f"Detecting language for {len(jobs)} document(s)")
+        try:
+            languages = await asyncio.to_thread(
+                self.language_detector.detect_batch, [job.content for job in jobs]
+            )
+        except Exception as e:
+            # Leave the source language unknown rather than failing the run
+            logger.error(f"Language detection failed for {len(jobs)} document(s): {e}")
+            return
+
+        for job, language in zip(jobs, languages, strict=True):
+            job.source_language = language
+
+    async def _translate_job(
+        self,
+        job: "_FileJob",
+        semaphore: asyncio.Semaphore,
+        batcher: TranslationBatcher | None = None,
+        manifest: TranslationManifest | None = None,
+    ) -> list[TranslationResult]:
+        """Translate a loaded file to all of its pending target languages.
+
+        Args:
+            job: Loaded file job with its detected source language
+            semaphore: Semaphore bounding concurrent translation requests
+            batcher: Batcher used for small documents (optional)
+            manifest: Manifest updated for successful translations (optional)
+
+        Returns:
+            Translation results, one per pending target language
+        """
+        results = await asyncio.gather(
+            *(
+                self._translate_content(
+                    job.content,
+                    job.file_path,
+                    job.source_language,
+                    target_language,
+                    target_file,
+                    semaphore,
+                    batcher,
+                )
+                for target_language, target_file in job.targets.items()
+            )
+        )
+
+        if manifest is not None and job.source_hash is not None:
+            for result in results:
+                if result.success and result.source_language != result.target_language:
+                    manifest.set(job.manifest_key, result.target_language, job.source_hash)
 
-            # Detect source language
-            logger.info(f"Detecting language for: {file_path}")
-            source_language = self.language_detector.detect_language(content)
+        return list(results)
 
+    async def _translate_content(
+        self,
+        content: str,
+        file_path: Path,
+        source_language: str | None,
+        target_language: str,
+        target_file: Path,
+        semaphore: asyncio.Semaphore,
+        batcher: TranslationBatcher | None = None,
+    ) -> TranslationResult:
+        """Translate loaded document content to a target language and save it.
+
+        Args:
+            content: Document text
+            file_path: Path to the source file
+            source_language: Detected source language
+            target_language: Target language code
+            target_file: Output file path
+            semaphore: Semaphore bounding concurrent translation requests
+            batcher: Batcher used for small documents (optional)
+
+        Returns:
+            Translation result
+        """
+        try:
             # Skip if already in target language
             if source_language == target_language:
                 logger.info(
@@ -218,11 +708,27 @@ class DocumentTranslator:
             logger.info(
                 f"Translating {file_path} from {source_language} to {target_language}"
             )
-            translated_content = await self.translation_manager.translate(
-                content, target_language, source_language
-            )
+            chunk_chars = self.config.translation_chunk_chars
+            if chunk_chars > 0 and len(content) > chunk_chars:
+                saved = await self._translate_chunks(
+                    content, source_language, target_language, target_file, semaphore
+                )
+            else:
+                if batcher is not None and len(content) <= self.config.batch_document_chars:
+                    translated_content = await batcher.translate(
+                        content, target_language, source_language
+                    )
+                else:
+                    async with semaphore:
+                        translated_content = await self.translation_manager.translate(
+                            content, target_language, source_language
+                        )
 
-            if not translated_content:
+                saved = bool(translated_content)
+                if translated_content:
+                    await self._save_translated_content(translated_content, target_file)
+
+            if not saved:
                 error_msg = "Translation failed"
                 logger.error(f"{error_msg}: {file_path}")
                 return TranslationResult(
@@ -234,8 +740,6 @@ class DocumentTranslator:
                     error=error_msg,
                 )
 
-            # Save translated content
-            await self._save_translated_content(translated_content, target_file)
             logger.info(f"Saved translation: {target_file}")
 
             return TranslationResult(
@@ -250,17 +754,71 @@ class DocumentTranslator:
             logger.error(f"Error translating {file_path}: {e}")
             return TranslationResult(
                 source_file=file_path,
-                target_file=target_file
-                if "target_file" in locals()
-                else Path("unknown"),
-                source_language=source_language
-                if "source_language" in locals()
-                else None,
+                target_file=target_file,
+                source_language=source_language,
                 target_language=target_language,
                 success=False,
                 error=str(e),
             )
 
+    async def _translate_chunks(
+        self,
+        content: str,
+        source_language: str | None,
+        target_language: str,
+        target_file: Path,
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        """Translate a large document chunk by chunk, streaming the output to disk.
+
+        Chunks are translated concurrently (bounded by the semaphore) and each
+        is written, in order, as soon as it and its predecessors are ready. The
+        output goes to a temporary file that replaces the target only once
+        every chunk has succeeded.
+
+        Args:
+            content: Document text
+            source_language: Detected source language
+            target_language: Target language code
+            target_file: Output file path
+            semaphore: Semaphore bounding concurrent translation requests
+
+        Returns:
+            True if every chunk was translated and the file was saved
+        """
+        chunks = _split_into_chunks(content, self.config.translation_chunk_chars)
+        logger.info(f"Translating {len(chunks)} chunks into {target_file}")
+
+        async def translate_chunk(chunk: str) -> str | None:
+            async with semaphore:
+                return await self.translation_manager.translate(
+                    chunk, target_language, source_language
+                )
+
+        # Open the output first so a failing open leaves no requests running
+        partial_file = target_file.with_name(f"{target_file.name}.part")
+        output = await asyncio.to_thread(_open_for_writing, partial_file)
+        tasks = [asyncio.create_task(translate_chunk(chunk)) for chunk in chunks]
+        saved = False
+        try:
+            for index, task in enumerate(tasks):
+                translated = await task
+                if not translated:
+                    logger.error(f"Chunk {index + 1}/{len(chunks)} failed to translate")
+                    return False
+                separator = "\n\n" if index else ""
+                await asyncio.to_thread(output.write, (separator + translated).encode("utf-8"))
+            saved = True
+            return True
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.to_thread(output.close)
+            if saved:
+                await asyncio.to_thread(partial_file.replace, target_file)
+            else:
+                await asyncio.to_thread(partial_file.unlink, missing_ok=True)
+
     def _generate_output_path(
         self, relative_path: Path, target_language: str, output_directory: Path
     ) -> Path:
@@ -285,8 +843,6 @@ class DocumentTranslator:
             filename = f"{stem}_{target_language}{suffix}"
             target_file = output_directory / filename
 
-        # Ensure parent directory exists
-        target_file.parent.mkdir(parents=True, exist_ok=True)
         return target_file
 
     async def _save_translated_content(self, content: str, target_file: Path) -> None:
@@ -296,41 +852,55 @@ class DocumentTranslator:
             content: Translated content
             target_file: Target file path
         """
-        async with aiofiles.open(target_file, "w", encoding="utf-8") as file:
-            await file.write(content)
+        await write_bytes(target_file, content.encode("utf-8"))
 
-    def print_results_summary(self, results: list[TranslationResult]) -> None:
+    def print_result(self, result: TranslationResult) -> None:
+        """Print a single translation result as soon as it is available.
+
+        Args:
+            result: Translation result
+        """
+        if result.success:
+            self.console.print(
+                f"  [green]✓[/green] {result.source_file} -> {result.target_file}"
+            )
+        else:
+            self.console.print(
+                f"  [red]✗[/red] {result.source_file} -> "
+                f"{result.target_language}: {result.error}"
+            )
+
+    def print_results_summary(
+        self, results: list[TranslationResult] | TranslationSummary
+    ) -> None:
         """Print a summary of translation results.
 
         Args:
-            results: List of translation results
+            results: List of translation results, or their running summary
         """
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        if isinstance(results, TranslationSummary):
+            summary = results
+        else:
+            summary = TranslationSummary()
+            for result in results:
+                summary.add(result)
 
         self.console.print("\n[bold green]Translation Summary[/bold green]")
-        self.console.print(f"Total files processed: {len(results)}")
-        self.console.print(f"Successful: {len(successful)}")
-        self.console.print(f"Failed: {len(failed)}")
+        self.console.print(f"Total files processed: {summary.total}")
+        self.console.print(f"Successful: {summary.successful}")
+        self.console.print(f"Failed: {len(summary.failed)}")
 
-        if failed:
+        if summary.failed:
             self.console.print("\n[bold red]Failed Translations:[/bold red]")
-            for result in failed:
+            for result in summary.failed:
                 self.console.print(
                     f"  {result.source_file} -> {result.target_language}: {result.error}"
                 )
 
-        # Group successful translations by language
-        by_language = {}
-        for result in successful:
-            if result.target_language not in by_language:
-                by_language[result.target_language] = []
-            by_language[result.target_language].append(result)
-
-        if by_language:
+        if summary.by_language:
             self.console.print(
                 "\n[bold green]Successful Translations by Language:[/bold green]"
             )
-            for lang, lang_results in by_language.items():
+            for lang, count in summary.by_language.items():
                 lang_name = self.language_detector.get_language_name(lang)
-                self.console.print(f"  {lang_name} ({lang}): {len(lang_results)} files")
+                self.console.print(f"  {lang_name} ({lang}): {count} files")
@@ -1,29 +1,136 @@
 """Translation service implementations."""
 
 import asyncio
+import contextlib
+import random
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .cache import TranslationCache, content_hash, json_dumps, json_loads
 from .config import get_config, get_language_mapping
 
 if TYPE_CHECKING:
-    pass
+    import aiohttp
+
+    from .language_detector import LanguageDetector
+
+
+# Translations kept in memory per manager, shared by identical texts in a run
+TRANSLATION_MEMO_SIZE = 4096
+
+# A failing service is tried last for this long, doubled per consecutive failure
+SERVICE_COOLDOWN_SECONDS = 60.0
+MAX_SERVICE_COOLDOWN_SECONDS = 900.0
+
+# Any letter in any script; text without one has nothing to translate
+_LETTER = re.compile(r"[^\W\d_]")
+
+# Marker placed before each text when several texts share one request
+BATCH_MARKER = "\n<<<DOC {index}>>>\n"
+_BATCH_MARKER_PATTERN = re.compile(r"<<<DOC (\d+)>>>")
+
+
+# Batch API job states after which no more results will arrive
+BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# System messages shared by every OpenAI request; only the user message varies
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a professional translator. Translate the given text accurately while preserving "
+        "formatting, structure, and meaning. Maintain any markdown formatting, code blocks, "
+        "links, and special characters. Keep lines of the form <<<DOC n>>> unchanged. "
+        "Only return the translated text without any explanations."
+    ),
+}
+_BATCH_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a professional translator. You receive a JSON array of texts. "
+        'Reply with a JSON object {"translations": [...]} holding the translation of '
+        "each text, in the same order. Preserve formatting, structure and meaning, "
+        "including markdown, code blocks, links and special characters."
+    ),
+}
+
+
+def _split_batch(translated: str, count: int) -> list[str] | None:
+    """Split a batched translation back into its individual texts.
+
+    Args:
+        translated: Translated text containing the numbered markers
+        count: Number of texts that were packed
+
+    Returns:
+        Individual translations, or None if the markers were not preserved
+    """
+    pieces = _BATCH_MARKER_PATTERN.split(translated)
+    if pieces[0].strip() or len(pieces) != 2 * count + 1:
+        return None
+
+    indices = [int(index) for index in pieces[1::2]]
+    parts = [part.strip() for part in pieces[2::2]]
+    if indices != list(range(count)) or not all(parts):
+        return None
+    return parts
+
+
+def _is_blank(text: str) -> bool:
+    """Check for empty or whitespace-only text without building a stripped copy."""
+    return not text or text.isspace()
+
+
+@lru_cache(maxsize=1024)
+def _google_codes(target_language: str, source_language: str | None) -> tuple[str, str]:
+    """Resolve a language pair to Google Translate (target, source) codes."""
+    codes = get_language_mapping().GOOGLE_TRANSLATE_CODES
+    source_code = codes.get(source_language, "auto") if source_language else "auto"
+    return codes.get(target_language, target_language), source_code
 
-try:
-    from googletrans import Translator as GoogleTranslator
 
-    HAS_GOOGLETRANS = True
-except ImportError:
-    HAS_GOOGLETRANS = False
-    GoogleTranslator = None
+@lru_cache(maxsize=1024)
+def _mymemory_langpair(target_language: str, source_language: str | None) -> str:
+    """Resolve a language pair to MyMemory's ``source|target`` parameter."""
+    codes = get_language_mapping().MYMEMORY_CODES
+    target_code = codes.get(target_language, target_language)
+    if not source_language:
+        return target_code
+    return f"{codes.get(source_language, source_language)}|{target_code}"
+
+
+@lru_cache(maxsize=1024)
+def _libretranslate_codes(target_language: str, source_language: str | None) -> tuple[str, str]:
+    """Resolve a language pair to LibreTranslate (target, source) codes."""
+    codes = get_language_mapping().LIBRETRANSLATE_CODES
+    source_code = codes.get(source_language, source_language) if source_language else "auto"
+    return codes.get(target_language, target_language), source_code
+
+
+class _ServiceSucceeded(Exception):  # noqa: N818
+    """Raised inside a service race to end its task group once a result is in."""
 
 
 class TranslationService(ABC):
-    """Abstract base class for translation services."""
+    """Abstract base class for translation services.
+
+    ``max_concurrency`` and ``requests_per_second`` bound how hard the
+    manager may call a service (0 leaves it unbounded); see :meth:`limit`.
+    """
+
+    max_concurrency: int = 0
+    requests_per_second: float = 0.0
+    _semaphore: asyncio.Semaphore | None = None
+    _semaphore_loop: asyncio.AbstractEventLoop | None = None
+    _next_start: float = 0.0
 
     @abstractmethod
     async def translate(
@@ -44,15 +151,186 @@ class TranslationService(ABC):
     def is_available(self) -> bool:
         """Check if the translation service is available."""
 
+    # A no-op by default: services without network resources have nothing to close
+    async def aclose(self) -> None:  # noqa: B027
+        """Release network resources held by the service."""
+
+    @contextlib.asynccontextmanager
+    async def limit(self) -> AsyncIterator[None]:
+        """Hold one of the service's request slots, pacing request starts.
+
+        Keeps upstream rate limits from turning into 429 errors and retries.
+        """
+        loop = asyncio.get_running_loop()
+        if self.max_concurrency > 0 and self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        async with self._semaphore or contextlib.nullcontext():
+            if self.requests_per_second > 0:
+                now = loop.time()
+                start = max(now, self._next_start)
+                self._next_start = start + 1 / self.requests_per_second
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+
+    async def translate_many(
+        self, texts: list[str], target_language: str, source_language: str | None = None
+    ) -> list[str] | None:
+        """Translate several texts with a single request.
+
+        By default the texts are packed into one request separated by
+        numbered markers and the response is split on the same markers.
+        Services with a native batch API override this.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order, or None if the batch failed
+        """
+        packed = "".join(
+            BATCH_MARKER.format(index=n) + text for n, text in enumerate(texts)
+        )
+        translated = await self.translate(packed, target_language, source_language)
+        return _split_batch(translated, len(texts)) if translated else None
+
+
+class HTTPTranslationService(TranslationService):
+    """Base class for services that call a plain HTTP API.
+
+    A single connection-pooled session is created lazily and reused for every
+    request until :meth:`aclose` is called, so TCP/TLS connections are kept
+    alive across documents. A session handed in with :meth:`set_session` is
+    used instead and left open for its owner to close.
+    """
+
+    _session: "aiohttp.ClientSession | None" = None
+    _owns_session: bool = True
+    # Connections kept per API host (0 uses the configured batch size)
+    connection_limit: int = 0
+
+    # Total time allowed per request, so a hung server cannot stall a document
+    REQUEST_TIMEOUT_SECONDS = 30
+    # How long idle keep-alive connections and resolved host names are reused
+    KEEPALIVE_SECONDS = 60
+    DNS_CACHE_SECONDS = 300
+
+    # Replies worth another attempt; any other error status fails at once
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRY_DELAY_SECONDS = 10.0
+
+    @classmethod
+    def create_session(cls, hosts: int = 1, limit_per_host: int = 0) -> "aiohttp.ClientSession":
+        """Create a connection-pooled session for HTTP translation APIs.
+
+        Args:
+            hosts: Number of API hosts the session will serve
+            limit_per_host: Connections kept per host (0 uses the configured
+                batch size)
+
+        Returns:
+            New client session
+        """
+        import aiohttp
+
+        limit_per_host = max(1, limit_per_host or get_config().batch_size)
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=limit_per_host * 2 * max(1, hosts),
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=cls.DNS_CACHE_SECONDS,
+                keepalive_timeout=cls.KEEPALIVE_SECONDS,
+            ),
+            timeout=aiohttp.ClientTimeout(total=cls.REQUEST_TIMEOUT_SECONDS),
+            json_serialize=json_dumps,
+        )
+
+    def set_session(self, session: "aiohttp.ClientSession") -> None:
+        """Use a session owned by the caller instead of a private one.
+
+        Args:
+            session: Session to send requests with; the caller closes it
+        """
+        self._session = session
+        self._owns_session = False
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self.create_session(limit_per_host=self.connection_limit)
+            self._owns_session = True
+        return self._session
+
+    async def _request_json(self, method: str, url: str, **kwargs: Any) -> Any | None:
+        """Send a request and parse its JSON reply, retrying transient failures.
+
+        Dropped connections, timeouts and 429/5xx replies are retried up to
+        ``MAX_RETRIES`` times with jittered exponential backoff starting at
+        ``RETRY_DELAY``. Other error replies fail without waiting.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Extra arguments for ``aiohttp.ClientSession.request``
+
+        Returns:
+            Parsed JSON reply, or None if the request did not succeed
+        """
+        import aiohttp
+
+        config = get_config()
+        attempts = 1 + max(0, config.max_retries)
+        name = type(self).__name__
+
+        for attempt in range(attempts):
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    if response.status == 200:
+                        # Parsed straight from the body bytes, without a decoded str copy
+                        return json_loads(await response.read())
+                    if response.status not in self.RETRY_STATUSES:
+                        logger.error(f"{name} request failed with HTTP {response.status}")
+                        return None
+                    error = f"HTTP {response.status}"
+            except (aiohttp.ClientConnectionError, TimeoutError) as e:
+                error = str(e) or type(e).__name__
+
+            if attempt + 1 < attempts:
+                delay = min(
+                    config.retry_delay * 2**attempt * (1 + random.random()),  # noqa: S311
+                    self.MAX_RETRY_DELAY_SECONDS,
+                )
+                logger.warning(f"{name} request failed ({error}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        logger.error(f"{name} request failed after {attempts} attempts ({error})")
+        return None
+
+    async def aclose(self) -> None:
+        """Close the HTTP session, or just release it if the caller owns it."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+        self._owns_session = True
+
 
 class OpenAITranslationService(TranslationService):
     """OpenAI/DeepSeek translation service using chat completions."""
 
+    # How often a submitted Batch API job is checked for completion
+    BATCH_POLL_SECONDS = 30.0
+
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.openai.com/v1",
         model: str = "gpt-3.5-turbo",
+        max_concurrency: int = 0,
+        max_retries: int = 2,
     ) -> None:
         """Initialize the OpenAI translation service.
 
@@ -60,20 +338,33 @@ class OpenAITranslationService(TranslationService):
             api_key: API key for the service
             base_url: Base URL for the API
             model: Model to use for translation
+            max_concurrency: Maximum requests in flight (0 for no limit)
+            max_retries: Retries of connection errors, timeouts, 429 and 5xx replies,
+                done by the client with jittered exponential backoff
         """
-        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._client_options = {
+            "api_key": api_key,
+            "base_url": base_url,
+            "max_retries": max_retries,
+        }
+        self.client = AsyncOpenAI(**self._client_options)
         self.model = model
-        self.language_mapping = get_language_mapping()
+        self.max_concurrency = max_concurrency
+        self._names = get_language_mapping().LANGUAGE_NAMES
 
     def is_available(self) -> bool:
         """Check if the service is available."""
         return bool(self.client.api_key)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client.
+
+        A fresh client, which opens no connections until used, takes its
+        place so the service still works after a managed run has ended.
+        """
+        await self.client.close()
+        self.client = AsyncOpenAI(**self._client_options)
+
     async def translate(
         self, text: str, target_language: str, source_language: str | None = None
     ) -> str | None:
@@ -87,68 +378,209 @@ class OpenAITranslationService(TranslationService):
         Returns:
             Translated text or None if failed
         """
+        if _is_blank(text):
+            return None
+
         try:
-            # Get language names for better prompts
-            target_name = self.language_mapping.LANGUAGE_NAMES.get(
-                target_language, target_language
-            )
-            source_name = (
-                self.language_mapping.LANGUAGE_NAMES.get(
-                    source_language, "auto-detected"
-                )
-                if source_language
-                else "auto-detected"
+            response = await self.client.chat.completions.create(
+                **self._completion_request(text, target_language, source_language)
             )
 
-            # Create translation prompt
-            system_prompt = (
-                "You are a professional translator. Translate the given text accurately while preserving "
-                "formatting, structure, and meaning. Maintain any markdown formatting, code blocks, "
-                "links, and special characters. Only return the translated text without any explanations."
-            )
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                logger.error("OpenAI translation was cut off at max_tokens")
+                return None
+
+            translated_text = choice.message.content
+            if translated_text:
+                return translated_text.strip()
 
-            user_prompt = f"Translate the following text from {source_name} to {target_name}:\n\n{text}"
+            logger.error("Empty response from OpenAI translation service")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error in OpenAI translation: {e}")
+            return None
+
+    async def translate_many(
+        self, texts: list[str], target_language: str, source_language: str | None = None
+    ) -> list[str] | None:
+        """Translate several texts in one chat completion using JSON mode.
+
+        The texts are sent as a JSON array and the model replies with a JSON
+        object holding the translations in the same order, which holds up
+        better than in-text markers for many short items. A reply with the
+        wrong number of items fails the whole batch, so the manager falls
+        back to individual requests.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order, or None if the batch failed
+        """
+        try:
+            target_name, source_name = self._language_names(target_language, source_language)
+
+            user_prompt = (
+                f"Translate these {len(texts)} texts from {source_name} to {target_name}:\n\n"
+                f"{json_dumps(texts)}"
+            )
 
-            # Make the API call
             response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.1,  # Low temperature for consistent translations
+                messages=[_BATCH_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}],
+                temperature=0.1,
                 max_tokens=4000,
+                response_format={"type": "json_object"},
             )
 
-            translated_text = response.choices[0].message.content
-            if translated_text:
-                return translated_text.strip()
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                logger.error("OpenAI batch translation was cut off at max_tokens")
+                return None
+
+            content = choice.message.content
+            translations = json_loads(content).get("translations") if content else None
+            if (
+                not isinstance(translations, list)
+                or len(translations) != len(texts)
+                or not all(isinstance(text, str) and text.strip() for text in translations)
+            ):
+                logger.warning("OpenAI batch reply does not match the batch; discarding it")
+                return None
+            return [text.strip() for text in translations]
 
-            logger.error("Empty response from OpenAI translation service")
+        except Exception as e:
+            logger.error(f"Error in OpenAI batch translation: {e}")
             return None
 
+    async def translate_offline(
+        self, texts: list[str], target_language: str, source_language: str | None = None
+    ) -> list[str | None]:
+        """Translate texts through the OpenAI Batch API.
+
+        Each text becomes one chat completion in a JSONL batch file that is
+        processed asynchronously within 24 hours at a lower price than online
+        requests. The batch is polled until it finishes, so this suits large
+        offline runs rather than interactive use.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order (None where a request failed)
+        """
+        results: list[str | None] = [None] * len(texts)
+        try:
+            lines = [
+                json_dumps(
+                    {
+                        "custom_id": str(index),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self._completion_request(text, target_language, source_language),
+                    }
+                )
+                for index, text in enumerate(texts)
+            ]
+            batch_file = await self.client.files.create(
+                file=("translations.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(f"Submitted OpenAI batch {batch.id} with {len(texts)} requests")
+
+            while batch.status not in BATCH_FINAL_STATUSES:
+                await asyncio.sleep(self.BATCH_POLL_SECONDS)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed":
+                logger.error(f"OpenAI batch {batch.id} ended with status {batch.status}")
+            if not batch.output_file_id:
+                return results
+
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                entry = json_loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                choice = response["body"]["choices"][0]
+                content = choice["message"].get("content")
+                if choice.get("finish_reason") != "length" and content and content.strip():
+                    results[int(entry["custom_id"])] = content.strip()
+
         except Exception as e:
-            logger.error(f"Error in OpenAI translation: {e}")
-            return None
+            logger.error(f"Error in OpenAI batch API translation: {e}")
+        return results
+
+    def _completion_request(
+        self, text: str, target_language: str, source_language: str | None
+    ) -> dict[str, Any]:
+        """Build the chat completion parameters for translating one text."""
+        target_name, source_name = self._language_names(target_language, source_language)
+        user_prompt = f"Translate the following text from {source_name} to {target_name}:\n\n{text}"
+        return {
+            "model": self.model,
+            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}],
+            "temperature": 0.1,  # Low temperature for consistent translations
+            "max_tokens": 4000,
+        }
+
+    def _language_names(
+        self, target_language: str, source_language: str | None
+    ) -> tuple[str, str]:
+        """Get the prompt names of the target and source languages."""
+        target_name = self._names.get(target_language, target_language)
+        source_name = (
+            self._names.get(source_language, "auto-detected")
+            if source_language
+            else "auto-detected"
+        )
+        return target_name, source_name
+
+
+@lru_cache(maxsize=1)
+def _googletrans_client() -> Any:
+    """Import googletrans and create its client, once per process.
+
+    The import pulls in httpx and is deferred until the web endpoint fails.
+
+    Returns:
+        googletrans ``Translator`` instance or None if it is not installed
+    """
+    try:
+        from googletrans import Translator
+    except ImportError:
+        logger.debug("googletrans is not installed; no fallback for Google Translate")
+        return None
+    return Translator()
+
 
+class GoogleTranslationService(HTTPTranslationService):
+    """Google Translate service using the public web endpoint.
 
-class GoogleTranslationService(TranslationService):
-    """Google Translate service implementation."""
+    Requests go through the shared aiohttp session. The synchronous
+    ``googletrans`` client, when installed, is only imported and tried if that
+    call fails.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the Google translation service."""
-        self.translator = GoogleTranslator() if HAS_GOOGLETRANS else None
-        self.language_mapping = get_language_mapping()
+    API_URL = "https://translate.googleapis.com/translate_a/single"
 
     def is_available(self) -> bool:
         """Check if the service is available."""
-        return HAS_GOOGLETRANS and self.translator is not None
+        return True
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
-        reraise=True,
-    )
     async def translate(
         self, text: str, target_language: str, source_language: str | None = None
     ) -> str | None:
@@ -162,73 +594,100 @@ class GoogleTranslationService(TranslationService):
         Returns:
             Translated text or None if failed
         """
-        if not self.is_available():
-            logger.error("Google Translate service not available")
+        if _is_blank(text):
             return None
 
+        # Map our language codes to Google Translate codes
+        target_code, source_code = _google_codes(target_language, source_language)
+
         try:
-            # Map our language codes to Google Translate codes
-            target_code = self.language_mapping.GOOGLE_TRANSLATE_CODES.get(
-                target_language, target_language
-            )
-            source_code = (
-                self.language_mapping.GOOGLE_TRANSLATE_CODES.get(
-                    source_language, "auto"
-                )
-                if source_language
-                else "auto"
-            )
+            translated = await self._translate_web(text, target_code, source_code)
+            if translated:
+                return translated
+            logger.error("Empty response from Google Translate service")
+        except Exception as e:
+            logger.error(f"Error in Google translation: {e}")
 
-            # Run the synchronous translation in an executor to avoid blocking
-            loop = asyncio.get_event_loop()
+        return await self._translate_googletrans(text, target_code, source_code)
 
-            def _translate():
-                """Synchronous translation function."""
-                try:
-                    result = self.translator.translate(
-                        text, dest=target_code, src=source_code
-                    )
-                    # Check if result is a coroutine (shouldn't be with googletrans)
-                    if hasattr(result, "__await__"):
-                        logger.error(
-                            "Got coroutine from googletrans - version compatibility issue"
-                        )
-                        return None
-                    return result
-                except Exception as e:
-                    logger.error(f"Error in synchronous translation: {e}")
-                    return None
+    async def _translate_web(
+        self, text: str, target_code: str, source_code: str
+    ) -> str | None:
+        """Translate text through the endpoint the googletrans client wraps.
 
-            result = await loop.run_in_executor(None, _translate)
+        The text is sent as form data rather than in the query string, so long
+        documents do not run into URL length limits.
 
-            if result and hasattr(result, "text") and result.text:
-                return result.text.strip()
+        Args:
+            text: Text to translate
+            target_code: Google target language code
+            source_code: Google source language code
 
-            logger.error("Empty response from Google Translate service")
-            return None
+        Returns:
+            Translated text or None if the reply had none
+        """
+        params = {"client": "gtx", "sl": source_code, "tl": target_code, "dt": "t"}
+        data = await self._request_json("POST", self.API_URL, params=params, data={"q": text})
+
+        # The first element holds one [translated, original, ...] entry per sentence
+        sentences = data[0] if data else None
+        translated = "".join(
+            sentence[0] for sentence in sentences or [] if sentence and sentence[0]
+        )
+        return translated.strip() or None
+
+    async def _translate_googletrans(
+        self, text: str, target_code: str, source_code: str
+    ) -> str | None:
+        """Translate text with the synchronous googletrans client in a worker thread.
+
+        Args:
+            text: Text to translate
+            target_code: Google target language code
+            source_code: Google source language code
+
+        Returns:
+            Translated text or None if failed
+        """
+        try:
+            # The client is created in the worker thread too, on first use
+            translator = await asyncio.to_thread(_googletrans_client)
+            if translator is None:
+                return None
 
+            result = await asyncio.to_thread(
+                translator.translate, text, dest=target_code, src=source_code
+            )
+            # Newer googletrans releases return a coroutine from a sync call
+            if hasattr(result, "__await__"):
+                logger.error("Got coroutine from googletrans - version compatibility issue")
+                return None
+            if result and getattr(result, "text", None):
+                return result.text.strip()
+            return None
         except Exception as e:
-            logger.error(f"Error in Google translation: {e}")
+            logger.error(f"Error in googletrans fallback: {e}")
             return None
 
 
-class MyMemoryTranslationService(TranslationService):
+class MyMemoryTranslationService(HTTPTranslationService):
     """MyMemory translation service implementation (free API)."""
 
-    def __init__(self) -> None:
-        """Initialize the MyMemory translation service."""
+    def __init__(self, max_concurrency: int = 0, requests_per_second: float = 0.0) -> None:
+        """Initialize the MyMemory translation service.
+
+        Args:
+            max_concurrency: Maximum requests in flight (0 for no limit)
+            requests_per_second: Maximum request starts per second (0 for no limit)
+        """
         self.base_url = "https://api.mymemory.translated.net/get"
-        self.language_mapping = get_language_mapping()
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
 
     def is_available(self) -> bool:
         """Check if the service is available."""
         return True  # MyMemory doesn't require API keys
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
-        reraise=True,
-    )
     async def translate(
         self, text: str, target_language: str, source_language: str | None = None
     ) -> str | None:
@@ -242,44 +701,25 @@ class MyMemoryTranslationService(TranslationService):
         Returns:
             Translated text or None if failed
         """
-        try:
-            import aiohttp
-
-            # Map language codes
-            target_code = self.language_mapping.MYMEMORY_CODES.get(
-                target_language, target_language
-            )
-            source_code = (
-                self.language_mapping.MYMEMORY_CODES.get(
-                    source_language, source_language
-                )
-                if source_language
-                else "auto"
-            )
-
-            # MyMemory expects format like "en|it" for source|target
-            if source_code == "auto":
-                lang_pair = target_code
-            else:
-                lang_pair = f"{source_code}|{target_code}"
+        if _is_blank(text):
+            return None
 
+        try:
             params = {
                 "q": text,
-                "langpair": lang_pair,
+                "langpair": _mymemory_langpair(target_language, source_language),
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if (
-                            data.get("responseStatus") == 200
-                            and "responseData" in data
-                            and "translatedText" in data["responseData"]
-                        ):
-                            translated_text = data["responseData"]["translatedText"]
-                            if translated_text and translated_text.strip():
-                                return translated_text.strip()
+            data = await self._request_json("GET", self.base_url, params=params)
+            if (
+                data
+                and data.get("responseStatus") == 200
+                and "responseData" in data
+                and "translatedText" in data["responseData"]
+            ):
+                translated_text = data["responseData"]["translatedText"]
+                if translated_text and translated_text.strip():
+                    return translated_text.strip()
 
             logger.error("Failed to get valid response from MyMemory")
             return None
@@ -288,8 +728,33 @@ class MyMemoryTranslationService(TranslationService):
             logger.error(f"Error in MyMemory translation: {e}")
             return None
 
+    async def translate_many(
+        self, texts: list[str], target_language: str, source_language: str | None = None
+    ) -> list[str] | None:
+        """Translate several texts with one MyMemory request each.
 
-class LibreTranslateService(TranslationService):
+        MyMemory takes the text as a query parameter capped at about 500
+        bytes, so marker-packed batches would be rejected or truncated. The
+        texts are sent one after another within the batch's request slot.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order, or None if any text failed
+        """
+        translated = []
+        for text in texts:
+            part = await self.translate(text, target_language, source_language)
+            if part is None:
+                return None
+            translated.append(part)
+        return translated
+
+
+class LibreTranslateService(HTTPTranslationService):
     """LibreTranslate service implementation (free, self-hosted)."""
 
     def __init__(self, api_url: str = "https://libretranslate.de/translate") -> None:
@@ -299,17 +764,11 @@ class LibreTranslateService(TranslationService):
             api_url: LibreTranslate API URL
         """
         self.api_url = api_url
-        self.language_mapping = get_language_mapping()
 
     def is_available(self) -> bool:
         """Check if the service is available."""
         return True  # LibreTranslate public instance doesn't require API keys
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
-        reraise=True,
-    )
     async def translate(
         self, text: str, target_language: str, source_language: str | None = None
     ) -> str | None:
@@ -323,20 +782,12 @@ class LibreTranslateService(TranslationService):
         Returns:
             Translated text or None if failed
         """
-        try:
-            import aiohttp
+        if _is_blank(text):
+            return None
 
+        try:
             # Map language codes
-            target_code = self.language_mapping.LIBRETRANSLATE_CODES.get(
-                target_language, target_language
-            )
-            source_code = (
-                self.language_mapping.LIBRETRANSLATE_CODES.get(
-                    source_language, source_language
-                )
-                if source_language
-                else "auto"
-            )
+            target_code, source_code = _libretranslate_codes(target_language, source_language)
 
             data = {
                 "q": text,
@@ -345,14 +796,11 @@ class LibreTranslateService(TranslationService):
                 "format": "text",
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.api_url, json=data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        if "translatedText" in result:
-                            translated_text = result["translatedText"]
-                            if translated_text and translated_text.strip():
-                                return translated_text.strip()
+            result = await self._request_json("POST", self.api_url, json=data)
+            if result and "translatedText" in result:
+                translated_text = result["translatedText"]
+                if translated_text and translated_text.strip():
+                    return translated_text.strip()
 
             logger.error("Failed to get valid response from LibreTranslate")
             return None
@@ -361,14 +809,52 @@ class LibreTranslateService(TranslationService):
             logger.error(f"Error in LibreTranslate translation: {e}")
             return None
 
+    async def translate_many(
+        self, texts: list[str], target_language: str, source_language: str | None = None
+    ) -> list[str] | None:
+        """Translate several texts in one LibreTranslate request.
+
+        LibreTranslate accepts a list for ``q`` and returns a list of
+        translations, so no markers are needed.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order, or None if the batch failed
+        """
+        try:
+            target_code, source_code = _libretranslate_codes(target_language, source_language)
+
+            data = {
+                "q": texts,
+                "source": source_code,
+                "target": target_code,
+                "format": "text",
+            }
+
+            result = await self._request_json("POST", self.api_url, json=data)
+            translated = result.get("translatedText") if result else None
+            if (
+                isinstance(translated, list)
+                and len(translated) == len(texts)
+                and all(part and part.strip() for part in translated)
+            ):
+                return [part.strip() for part in translated]
+
+            logger.error("Failed to get valid batch response from LibreTranslate")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error in LibreTranslate batch translation: {e}")
+            return None
+
 
 class MockTranslationService(TranslationService):
     """Mock translation service for testing purposes."""
 
-    def __init__(self) -> None:
-        """Initialize the mock translation service."""
-        self.language_mapping = get_language_mapping()
-
     def is_available(self) -> bool:
         """Check if the service is available."""
         return True
@@ -376,7 +862,7 @@ class MockTranslationService(TranslationService):
     async def translate(
         self, text: str, target_language: str, source_language: str | None = None
     ) -> str | None:
-        """Mock translate text by adding language prefix.
+        """Mock translate text; always returns an empty (failed) translation.
 
         Args:
             text: Text to translate
@@ -384,32 +870,105 @@ class MockTranslationService(TranslationService):
             source_language: Source language code (optional)
 
         Returns:
-            Mock translated text
+            Empty string
         """
-        try:
-            # Get language name for target
-            target_name = self.language_mapping.LANGUAGE_NAMES.get(
-                target_language, target_language
-            )
-
-            # Simple mock translation: add language prefix
-            # mock_translation = f"[{target_name.upper()} TRANSLATION]\n\n{text}" # noqa
-            mock_translation = ""
-            return mock_translation
-        except Exception as e:
-            logger.error(f"Error in mock translation: {e}")
-            return None
+        return ""
 
 
 class TranslationManager:
     """Manage multiple translation services with fallback support."""
 
-    def __init__(self) -> None:
-        """Initialize the translation manager."""
+    def __init__(
+        self,
+        cache: TranslationCache | None = None,
+        detector: "LanguageDetector | None" = None,
+    ) -> None:
+        """Initialize the translation manager.
+
+        Args:
+            cache: Translation cache to use (defaults to the configured cache file)
+            detector: Detector used to pin the source language of texts passed
+                without one, so every service gets the same source (optional)
+        """
         self.config = get_config()
         self.services: list[TranslationService] = []
+        self.cache = cache if cache is not None else self._create_default_cache()
+        self.detector = detector
+        # Connections kept per API host by the HTTP services (0 uses the batch size)
+        self.connection_limit = 0
+        self._exit_stack: contextlib.AsyncExitStack | None = None
+        # Finished translations and in-flight requests by (content hash, source, target)
+        self._memo: OrderedDict[
+            tuple[str, str | None, str], str | asyncio.Future[str | None]
+        ] = OrderedDict()
+        # Consecutive failures and end of the cool-down of recently failing services
+        self._failure_streaks: dict[TranslationService, int] = {}
+        self._demoted_until: dict[TranslationService, float] = {}
         self._setup_services()
 
+    async def __aenter__(self) -> "TranslationManager":
+        """Enter a run that reuses service connections until exit.
+
+        The HTTP services share one connection pool owned by the manager for
+        the duration of the run.
+        """
+        http_services = [
+            service for service in self.services if isinstance(service, HTTPTranslationService)
+        ]
+        if http_services:
+            self._exit_stack = contextlib.AsyncExitStack()
+            session = await self._exit_stack.enter_async_context(
+                HTTPTranslationService.create_session(
+                    hosts=len(http_services), limit_per_host=self.connection_limit
+                )
+            )
+            for service in http_services:
+                service.set_session(session)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close service connections at the end of the run."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the network resources held by all services."""
+        for service in self.services:
+            try:
+                await service.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing {service.__class__.__name__}: {e}")
+
+        if self._exit_stack is not None:
+            exit_stack, self._exit_stack = self._exit_stack, None
+            await exit_stack.aclose()
+
+    def set_connection_limit(self, limit: int) -> None:
+        """Size the HTTP connection pools for a number of requests in flight.
+
+        Applies to sessions opened after the call.
+
+        Args:
+            limit: Connections kept per API host
+        """
+        self.connection_limit = limit
+        for service in self.services:
+            if isinstance(service, HTTPTranslationService):
+                service.connection_limit = limit
+
+    def _create_default_cache(self) -> TranslationCache | None:
+        """Create the translation cache configured in settings, if enabled."""
+        if not self.config.translation_cache_file:
+            return None
+
+        try:
+            return TranslationCache(
+                Path(self.config.translation_cache_file).expanduser(),
+                ttl_seconds=self.config.translation_cache_ttl_days * 86400,
+            )
+        except Exception as e:
+            logger.warning(f"Translation cache disabled: {e}")
+            return None
+
     def _setup_services(self) -> None:
         """Set up available translation services."""
         # Add OpenAI/DeepSeek service if configured
@@ -418,6 +977,8 @@ class TranslationManager:
                 api_key=self.config.openai_api_key,
                 base_url=self.config.openai_base_url,
                 model=self.config.default_model,
+                max_concurrency=self.config.openai_max_concurrency,
+                max_retries=self.config.max_retries,
             )
             self.services.append(openai_service)
             logger.info(
@@ -430,6 +991,8 @@ class TranslationManager:
                 api_key=self.config.deepseek_api_key,
                 base_url=self.config.deepseek_base_url,
                 model=self.config.default_model,
+                max_concurrency=self.config.openai_max_concurrency,
+                max_retries=self.config.max_retries,
             )
             self.services.append(deepseek_service)
             logger.info("Added DeepSeek service")
@@ -441,7 +1004,10 @@ class TranslationManager:
             logger.info("Added Google Translate service")
 
         # Add MyMemory translation service
-        mymemory_service = MyMemoryTranslationService()
+        mymemory_service = MyMemoryTranslationService(
+            max_concurrency=self.config.mymemory_max_concurrency,
+            requests_per_second=self.config.mymemory_requests_per_second,
+        )
         if mymemory_service.is_available():
             self.services.append(mymemory_service)
             logger.info("Added MyMemory translation service")
@@ -452,15 +1018,51 @@ class TranslationManager:
             self.services.append(libre_service)
             logger.info("Added LibreTranslate service")
 
-        # Add Mock translation service
-        mock_service = MockTranslationService()
-        if mock_service.is_available():
-            self.services.append(mock_service)
+        # Add Mock translation service (testing only)
+        if self.config.enable_mock_service:
+            self.services.append(MockTranslationService())
             logger.info("Added Mock translation service")
 
         if not self.services:
             logger.warning("No translation services configured!")
 
+    def _ordered_services(self) -> list[tuple[int, TranslationService]]:
+        """Get the available services in the order they should be tried.
+
+        Services keep their configured order, except that those cooling down
+        after recent failures go last, soonest to recover first.
+
+        Returns:
+            (configured position, service) pairs, positions counted from 1
+        """
+        now = time.monotonic()
+        ready = []
+        cooling = []
+        for number, service in enumerate(self.services, 1):
+            if not service.is_available():
+                continue
+            until = self._demoted_until.get(service, 0.0)
+            if until > now:
+                cooling.append((until, number, service))
+            else:
+                ready.append((number, service))
+        cooling.sort(key=lambda entry: entry[:2])
+        return ready + [(number, service) for _, number, service in cooling]
+
+    def _record_outcome(self, service: TranslationService, succeeded: bool) -> None:
+        """Reset a service's cool-down on success or extend it on failure."""
+        if succeeded:
+            self._failure_streaks.pop(service, None)
+            self._demoted_until.pop(service, None)
+            return
+
+        streak = self._failure_streaks.get(service, 0) + 1
+        self._failure_streaks[service] = streak
+        cooldown = min(
+            SERVICE_COOLDOWN_SECONDS * 2 ** (streak - 1), MAX_SERVICE_COOLDOWN_SECONDS
+        )
+        self._demoted_until[service] = time.monotonic() + cooldown
+
     async def translate(
         self, text: str, target_language: str, source_language: str | None = None
     ) -> str | None:
@@ -474,35 +1076,403 @@ class TranslationManager:
         Returns:
             Translated text or None if all services failed
         """
-        if not text or not text.strip():
+        if _is_blank(text):
             return None
 
+        # Numbers, punctuation and symbols read the same in every language
+        if not _LETTER.search(text):
+            return text
+
         if not self.services:
             logger.error("No translation services available")
             return None
 
-        # Try each service in order
-        for i, service in enumerate(self.services):
-            if not service.is_available():
+        if source_language is None:
+            source_language = await self._detect_source_language(text)
+
+        # Identical texts (templates, boilerplate) share one translation per run
+        key = (content_hash(text), source_language, target_language)
+        shared = self._memo.get(key)
+        if isinstance(shared, str):
+            self._memo.move_to_end(key)
+            logger.debug("Translation shared with an identical text")
+            return shared
+        if shared is None:
+            shared = asyncio.ensure_future(
+                self._translate_uncached(text, target_language, source_language)
+            )
+            shared.add_done_callback(lambda future: self._settle(key, future))
+            self._memo[key] = shared
+        # Shielded so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(shared)
+
+    async def _detect_source_language(self, text: str) -> str | None:
+        """Detect the source language locally, so no service has to auto-detect it.
+
+        Args:
+            text: Text to translate
+
+        Returns:
+            Detected language code, or None without a detector or a reliable result
+        """
+        if self.detector is None:
+            return None
+        return await asyncio.to_thread(self.detector.detect_language, text)
+
+    def _remember(self, key: tuple[str, str | None, str], translation: str) -> None:
+        """Add a finished translation to the memo, evicting the oldest if full."""
+        self._memo[key] = translation
+        self._memo.move_to_end(key)
+        if len(self._memo) > TRANSLATION_MEMO_SIZE:
+            self._memo.popitem(last=False)
+
+    def _settle(
+        self, key: tuple[str, str | None, str], future: "asyncio.Future[str | None]"
+    ) -> None:
+        """Replace a finished request in the memo by its result, or drop a failure."""
+        if self._memo.get(key) is not future:
+            return
+        if not future.cancelled() and future.exception() is None and future.result():
+            self._remember(key, future.result())
+        else:
+            del self._memo[key]
+
+    async def _translate_uncached(
+        self, text: str, target_language: str, source_language: str | None
+    ) -> str | None:
+        """Translate text through the persistent cache and the service fallback chain.
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated text or None if all services failed
+        """
+        model = self.config.default_model
+        if self.cache is not None:
+            cached = self.cache.get(text, target_language, source_language, model)
+            if cached:
+                logger.debug("Translation served from cache")
+                return cached
+
+        result = await self._translate_with_fallback(
+            text, target_language, source_language
+        )
+        if result and self.cache is not None:
+            self.cache.set(text, target_language, source_language, model, result)
+        return result
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        target_language: str,
+        source_language: str | None = None,
+        offline: bool = False,
+    ) -> list[str | None]:
+        """Translate several texts with a single request where possible.
+
+        Uncached texts are sent to each service's batch API in turn (by
+        default a single request with numbered markers). If no service
+        returns a usable batch, each text is translated on its own.
+
+        With ``offline`` set, the uncached texts are instead submitted as one
+        OpenAI Batch API job, which is cheaper but may take up to 24 hours.
+        Texts the job could not translate fall back to online requests.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+            offline: Use the asynchronous OpenAI Batch API
+
+        Returns:
+            Translated texts (None where translation failed), in input order
+        """
+        results: list[str | None] = [None] * len(texts)
+        model = self.config.default_model
+        if source_language is None:
+            source_language = await self._detect_source_language("\n\n".join(texts))
+        pending = []
+        # First position of each text to translate, and later repeats of it
+        first_positions: dict[str, int] = {}
+        repeats: list[tuple[int, int]] = []
+
+        for i, text in enumerate(texts):
+            if _is_blank(text):
+                continue
+            if not _LETTER.search(text):
+                results[i] = text
+                continue
+            key = (content_hash(text), source_language, target_language)
+            shared = self._memo.get(key)
+            if isinstance(shared, str):
+                self._memo.move_to_end(key)
+                results[i] = shared
                 continue
+            if text in first_positions:
+                repeats.append((i, first_positions[text]))
+                continue
+            cached = (
+                self.cache.get(text, target_language, source_language, model)
+                if self.cache is not None
+                else None
+            )
+            if cached:
+                results[i] = cached
+            else:
+                pending.append(i)
+                first_positions[text] = i
+
+        if offline and pending and self.services:
+            parts = await self._translate_offline(
+                [texts[i] for i in pending], target_language, source_language
+            )
+            missing = []
+            for i, part in zip(pending, parts, strict=True):
+                if part:
+                    self._store(texts[i], target_language, source_language, part)
+                    results[i] = part
+                else:
+                    missing.append(i)
+
+            if missing:
+                logger.warning(
+                    f"Batch API left {len(missing)} texts untranslated; translating online"
+                )
+                parts = await asyncio.gather(
+                    *(self.translate(texts[i], target_language, source_language) for i in missing)
+                )
+                for i, part in zip(missing, parts, strict=True):
+                    results[i] = part
+        elif len(pending) < 2:
+            for i in pending:
+                results[i] = await self.translate(
+                    texts[i], target_language, source_language
+                )
+        elif not self.services:
+            logger.error("No translation services available")
+        else:
+            parts = await self._translate_many_with_fallback(
+                [texts[i] for i in pending], target_language, source_language
+            )
+
+            if parts is None:
+                logger.warning(
+                    f"Batched translation of {len(pending)} texts failed; "
+                    "translating individually"
+                )
+                parts = await asyncio.gather(
+                    *(
+                        self.translate(texts[i], target_language, source_language)
+                        for i in pending
+                    )
+                )
+            else:
+                for i, part in zip(pending, parts, strict=True):
+                    self._store(texts[i], target_language, source_language, part)
+
+            for i, part in zip(pending, parts, strict=True):
+                results[i] = part
+
+        for i, first in repeats:
+            results[i] = results[first]
+        return results
+
+    async def translate_concurrently(
+        self,
+        texts: list[str],
+        target_language: str,
+        source_language: str | None = None,
+        concurrency: int | None = None,
+    ) -> list[str | None]:
+        """Translate texts one request each, with several requests in flight.
+
+        Unlike :meth:`translate_batch`, texts are never packed into a shared
+        request, so one bad reply cannot fail its neighbours.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+            concurrency: Maximum translations in flight (defaults to BATCH_SIZE)
+
+        Returns:
+            Translated texts (None where translation failed), in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.config.batch_size))
+
+        async def translate_one(text: str) -> str | None:
+            async with semaphore:
+                return await self.translate(text, target_language, source_language)
+
+        return list(await asyncio.gather(*(translate_one(text) for text in texts)))
 
+    def _store(
+        self, text: str, target_language: str, source_language: str | None, translation: str
+    ) -> None:
+        """Add a translation obtained outside the fallback chain to the memo and cache."""
+        self._remember((content_hash(text), source_language, target_language), translation)
+        if self.cache is not None:
+            self.cache.set(
+                text, target_language, source_language, self.config.default_model, translation
+            )
+
+    async def _translate_offline(
+        self, texts: list[str], target_language: str, source_language: str | None
+    ) -> list[str | None]:
+        """Translate texts with the first available service offering the Batch API.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order (None where translation failed)
+        """
+        for _, service in self._ordered_services():
+            if isinstance(service, OpenAITranslationService):
+                return await service.translate_offline(texts, target_language, source_language)
+
+        logger.warning("No configured service offers the Batch API")
+        return [None] * len(texts)
+
+    async def _translate_with_fallback(
+        self, text: str, target_language: str, source_language: str | None
+    ) -> str | None:
+        """Try each available service in order until one succeeds.
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated text or None if all services failed
+        """
+        if self.config.service_stagger_seconds > 0:
+            return await self._translate_staggered(text, target_language, source_language)
+
+        for number, service in self._ordered_services():
             try:
-                logger.info(
-                    f"Attempting translation with service {i + 1}/{len(self.services)}"
+                logger.debug(
+                    "Attempting translation with service {}/{}", number, len(self.services)
                 )
-                result = await service.translate(text, target_language, source_language)
+                async with service.limit():
+                    result = await service.translate(text, target_language, source_language)
+                self._record_outcome(service, bool(result))
                 if result:
-                    logger.info(f"Translation successful with service {i + 1}")
+                    logger.debug("Translation successful with service {}", number)
                     return result
                 else:
-                    logger.warning(f"Service {i + 1} returned empty result")
+                    logger.warning(f"Service {number} returned empty result")
             except Exception as e:
-                logger.error(f"Service {i + 1} failed: {e}")
+                self._record_outcome(service, False)
+                logger.error(f"Service {number} failed: {e}")
                 continue
 
         logger.error("All translation services failed")
         return None
 
+    async def _translate_staggered(
+        self, text: str, target_language: str, source_language: str | None
+    ) -> str | None:
+        """Race the services in order, each starting when the previous ones stall.
+
+        The services run in one task group. The next one is started as soon as
+        an earlier one fails or has not replied within ``service_stagger_seconds``.
+        The first non-empty result ends the group, which cancels the requests
+        still running, so a slow preferred service costs at most the stagger delay.
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated text or None if all services failed
+        """
+        failed = asyncio.Event()
+        translations: list[str] = []
+
+        async def attempt(number: int, service: TranslationService) -> None:
+            try:
+                result = await self._call_limited(
+                    service, text, target_language, source_language
+                )
+            except Exception as e:
+                logger.error(f"Service {number} failed: {e}")
+                result = None
+            else:
+                if not result:
+                    logger.warning(f"Service {number} returned empty result")
+            self._record_outcome(service, bool(result))
+            if result:
+                logger.debug("Translation successful with service {}", number)
+                translations.append(result)
+                raise _ServiceSucceeded
+            failed.set()
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for number, service in self._ordered_services():
+                    logger.debug(
+                        "Attempting translation with service {}/{}", number, len(self.services)
+                    )
+                    group.create_task(attempt(number, service))
+                    failed.clear()
+                    with contextlib.suppress(TimeoutError):
+                        async with asyncio.timeout(self.config.service_stagger_seconds):
+                            await failed.wait()
+        except* _ServiceSucceeded:
+            pass
+
+        if translations:
+            return translations[0]
+        logger.error("All translation services failed")
+        return None
+
+    @staticmethod
+    async def _call_limited(
+        service: TranslationService,
+        text: str,
+        target_language: str,
+        source_language: str | None,
+    ) -> str | None:
+        """Translate with a service while holding one of its request slots."""
+        async with service.limit():
+            return await service.translate(text, target_language, source_language)
+
+    async def _translate_many_with_fallback(
+        self, texts: list[str], target_language: str, source_language: str | None
+    ) -> list[str] | None:
+        """Try each available service's batch translation until one succeeds.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated texts in input order, or None if every service failed
+        """
+        for number, service in self._ordered_services():
+            try:
+                async with service.limit():
+                    parts = await service.translate_many(
+                        texts, target_language, source_language
+                    )
+                if parts is not None:
+                    logger.debug("Batch of {} translated with service {}", len(texts), number)
+                    return parts
+                logger.warning(f"Service {number} could not translate the batch")
+            except Exception as e:
+                logger.error(f"Service {number} batch failed: {e}")
+
+        return None
+
     def get_available_services(self) -> list[str]:
         """Get list of available service names.
 
@@ -514,3 +1484,106 @@ class TranslationManager:
             for service in self.services
             if service.is_available()
         ]
+
+
+class TranslationBatcher:
+    """Collect concurrent small translation requests into batched calls.
+
+    Requests for the same language pair that arrive within ``max_delay``
+    seconds are sent together through :meth:`TranslationManager.translate_batch`.
+    """
+
+    def __init__(
+        self,
+        manager: TranslationManager,
+        semaphore: asyncio.Semaphore | None = None,
+        max_items: int = 16,
+        max_chars: int = 8000,
+        max_delay: float = 0.05,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            manager: Translation manager used to send batches
+            semaphore: Semaphore bounding concurrent batch requests (optional)
+            max_items: Maximum number of texts per batch
+            max_chars: Maximum total characters per batch
+            max_delay: Seconds to wait for more requests before sending a batch
+        """
+        self.manager = manager
+        self.semaphore = semaphore
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._pending: dict[
+            tuple[str, str | None], list[tuple[str, asyncio.Future[str | None]]]
+        ] = {}
+        self._timers: dict[tuple[str, str | None], asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def translate(
+        self, text: str, target_language: str, source_language: str | None = None
+    ) -> str | None:
+        """Queue a text for batched translation and wait for its result.
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+
+        Returns:
+            Translated text or None if failed
+        """
+        loop = asyncio.get_running_loop()
+        key = (target_language, source_language)
+        future: asyncio.Future[str | None] = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((text, future))
+
+        if (
+            len(group) >= self.max_items
+            or sum(len(queued) for queued, _ in group) >= self.max_chars
+        ):
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: tuple[str, str | None]) -> None:
+        """Send all queued texts for a language pair as one batch."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        group = self._pending.pop(key, [])
+        if group:
+            task = asyncio.create_task(self._send(key, group))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self,
+        key: tuple[str, str | None],
+        group: list[tuple[str, asyncio.Future[str | None]]],
+    ) -> None:
+        """Translate a batch and resolve the waiting futures."""
+        target_language, source_language = key
+        texts = [text for text, _ in group]
+        try:
+            if self.semaphore is not None:
+                async with self.semaphore:
+                    results = await self.manager.translate_batch(
+                        texts, target_language, source_language
+                    )
+            else:
+                results = await self.manager.translate_batch(
+                    texts, target_language, source_language
+                )
+        except Exception as e:
+            logger.error(f"Batched translation failed: {e}")
+            results = [None] * len(group)
+
+        for (_, future), result in zip(group, results, strict=True):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,101 @@
+"""Shared fixtures for the translator tests."""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+    uvloop = None
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from translator.config import TranslationConfig
+    from translator.language_detector import LanguageDetector
+    from translator.processor import DocumentTranslator
+    from translator.translation_service import TranslationManager
+
+
+if HAS_UVLOOP:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], "asyncio.AbstractEventLoop"]]:
+        """Run async tests on uvloop when it is installed, like the CLI does."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_caches() -> Iterator[None]:
+    """Disable the persistent caches before any detector or manager is built.
+
+    Otherwise constructing one opens (and tests write to) the developer's
+    real cache files under ``~/.cache/translator``.
+    """
+    from translator.config import _load_config_once
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("DETECTION_CACHE_FILE", "")
+        monkeypatch.setenv("TRANSLATION_CACHE_FILE", "")
+        _load_config_once.cache_clear()
+        yield
+    _load_config_once.cache_clear()
+
+
+# Built once per test session. Tests that change an instance's services,
+# caches or settings must construct their own instead of using these.
+
+
+@pytest.fixture(scope="session")
+def config() -> "TranslationConfig":
+    """Process-wide configuration."""
+    from translator.config import get_config
+
+    return get_config()
+
+
+@pytest.fixture(scope="session")
+def detector() -> "LanguageDetector":
+    """Language detector without a persistent cache."""
+    from translator.language_detector import LanguageDetector
+
+    detector = LanguageDetector()
+    detector.cache = None
+    return detector
+
+
+@pytest.fixture(scope="session")
+def translation_manager() -> "TranslationManager":
+    """Build a translation manager with the configured services and no persistent cache."""
+    from translator.translation_service import TranslationManager
+
+    manager = TranslationManager()
+    manager.cache = None
+    return manager
+
+
+@pytest.fixture(scope="session")
+def document_translator() -> "DocumentTranslator":
+    """Document translator with the configured services."""
+    from translator.processor import DocumentTranslator
+
+    return DocumentTranslator()
+
+
+@pytest.fixture(scope="session")
+def sample_corpus(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of sample documents, written once. Tests must not modify it."""
+    root = tmp_path_factory.mktemp("corpus")
+    (root / "test.txt").write_text("This is a test file content.", encoding="utf-8")
+    (root / "test.md").write_text("é" * 5000, encoding="utf-8")
+    (root / "latin1.txt").write_bytes("Café crème".encode("latin-1"))
+    (root / "test.unsupported").write_text("x")
+    return root
@@ -2,11 +2,6 @@
 """Test script for googletrans library."""
 
 import asyncio
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from googletrans import Translator
 
@@ -1,56 +1,198 @@
 """Test configuration and basic functionality."""
 
-import sys
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import SimpleNamespace
 
 import pytest
+from click.testing import CliRunner
 
-# Add src to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from translator import document_loader, language_detector, processor, translation_service
+from translator.cache import DetectionCache, TranslationCache, TranslationManifest, json_dumps
+from translator.cli import cli
+from translator.config import TranslationConfig, get_config, get_language_mapping
+from translator.document_loader import DocumentLoader
+from translator.file_io import read_text, write_bytes
+from translator.language_detector import LanguageDetector, _get_langdetect_factory
+from translator.processor import (
+    DocumentTranslator,
+    TranslationResult,
+    TranslationSummary,
+    _split_into_chunks,
+)
+from translator.translation_service import (
+    GoogleTranslationService,
+    LibreTranslateService,
+    MockTranslationService,
+    MyMemoryTranslationService,
+    OpenAITranslationService,
+    TranslationManager,
+    TranslationService,
+    _google_codes,
+    _libretranslate_codes,
+    _mymemory_langpair,
+)
 
-if TYPE_CHECKING:
-    pass
+# Frequent English words; random sequences of them should always detect as English
+COMMON_EN_WORDS = (
+    "the of and to in is that for it with as was on be at by this had not are but from "
+    "have they which you were her all she there would their we him been has when who will "
+    "more no if out so said what up its about into than them can only other new some could "
+    "time these two may then do first any my now such like our over man me even most made "
+    "after also did many before must through back years where much your way well down should "
+    "because each just those people how too little state good very make world still own see "
+    "work long get here between both life being under never day same another know while last"
+).split()
+
+
+def make_echo_service(calls: list[str] | None = None) -> TranslationService:
+    """Create a stub service that prefixes each line with the target language.
+
+    Batch marker lines are left untouched, like a well-behaved LLM would.
+    """
+
+    class EchoService(TranslationService):
+        def is_available(self) -> bool:
+            return True
+
+        async def translate(
+            self, text: str, target_language: str, source_language: str | None = None
+        ) -> str | None:
+            if calls is not None:
+                calls.append(text)
+            return re.sub(r"(?m)^(?!<<<DOC)(.+)$", rf"[{target_language}] \1", text)
+
+    return EchoService()
+
+
+def use_echo_service(translator: object, calls: list[str] | None = None) -> None:
+    """Route a DocumentTranslator's translations to the echo stub, uncached."""
+    manager = translator.translation_manager  # type: ignore[attr-defined]
+    manager.services = [make_echo_service(calls)]
+    manager.cache = None
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    data += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return data
 
 
 class TestConfig:
     """Test configuration functionality."""
 
-    def test_config_creation(self) -> None:
+    def test_config_creation(self, config: TranslationConfig) -> None:
         """Test that configuration can be created."""
-        from translator.config import get_config
-
-        config = get_config()
         assert config is not None
         assert config.supported_languages is not None
         assert len(config.supported_languages) > 0
         assert "en" in config.supported_languages
+        assert config.supported_languages_set == frozenset(config.supported_languages)
+        assert ".md" in config.supported_extensions_set
+
+    def test_config_is_cached(self) -> None:
+        """Test that repeated calls reuse the same configuration instance."""
+        assert get_config() is get_config()
+        assert get_language_mapping() is get_language_mapping()
+
+    def test_config_is_frozen(self) -> None:
+        """Test that the configuration snapshot cannot be mutated in place."""
+        config = get_config()
+        with pytest.raises(FrozenInstanceError):
+            config.batch_size = 1  # type: ignore[misc]
+
+        assert replace(config, batch_size=1).batch_size == 1
+        assert get_config().batch_size == config.batch_size
 
     def test_language_mapping(self) -> None:
         """Test language mapping functionality."""
-        from translator.config import get_language_mapping
-
         mapping = get_language_mapping()
         assert mapping is not None
         assert "en" in mapping.LANGUAGE_NAMES
         assert mapping.LANGUAGE_NAMES["en"] == "English"
 
+        with pytest.raises(TypeError):
+            mapping.LANGUAGE_NAMES["xx"] = "Unknown"  # type: ignore[index]
+
+    def test_config_from_env(self, tmp_path: Path) -> None:
+        """Test reading configuration from environment variables and .env."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comment\n"
+            "BATCH_SIZE=4\n"
+            'OPENAI_API_KEY="from-dotenv"\n'
+            "SUPPORTED_LANGUAGES=en,ja\n"
+        )
+
+        config = TranslationConfig.from_env(
+            {"OPENAI_API_KEY": "from-env", "OVERWRITE_EXISTING": "true", "RETRY_DELAY": "0.5"},
+            env_file=env_file,
+        )
+
+        assert config.batch_size == 4
+        assert config.openai_api_key == "from-env"
+        assert config.overwrite_existing is True
+        assert config.retry_delay == 0.5
+        assert config.supported_languages == ("en", "ja")
+        assert config.supported_languages_set == frozenset({"en", "ja"})
+
+        with pytest.raises(ValueError, match="BATCH_SIZE"):
+            TranslationConfig.from_env({"BATCH_SIZE": "many"}, env_file=None)
+
 
 class TestLanguageDetector:
     """Test language detection functionality."""
 
-    def test_language_detector_creation(self) -> None:
+    def test_language_detector_creation(self, detector: LanguageDetector) -> None:
         """Test that language detector can be created."""
-        from translator.language_detector import LanguageDetector
-
-        detector = LanguageDetector()
         assert detector is not None
 
-    def test_detect_english(self) -> None:
-        """Test detection of English text."""
-        from translator.language_detector import LanguageDetector
+    @pytest.mark.parametrize("seed", range(50))
+    def test_detect_random_english(self, detector: LanguageDetector, seed: int) -> None:
+        """Test that generated English word sequences are detected as English."""
+        rng = random.Random(seed)  # noqa: S311 - seeded test data, not cryptography
+        text = " ".join(rng.choices(COMMON_EN_WORDS, k=rng.randint(20, 100)))
 
-        detector = LanguageDetector()
+        assert detector.detect_language(text) == "en"
+
+    def test_detect_english(self, detector: LanguageDetector) -> None:
+        """Test detection of English text."""
         text = "This is a sample English text for language detection testing."
 
         # Note: langdetect might not be available in test environment
@@ -62,11 +204,145 @@ class TestLanguageDetector:
             # Skip test if langdetect is not available
             pytest.skip("langdetect library not available")
 
-    def test_supported_languages(self) -> None:
-        """Test supported languages functionality."""
-        from translator.language_detector import LanguageDetector
+    def test_detection_cache(self, tmp_path: Path) -> None:
+        """Test that detection results are persisted and reused."""
+        cache_file = tmp_path / "detect.sqlite"
+        text = "Ceci est un exemple de texte en langue française."
+
+        detector = LanguageDetector(cache=DetectionCache(cache_file))
+        detector.cache.set_language(text, "ja", detector.backend)
+        detector.cache.set_confidences(text, [("ja", 0.9)], "langdetect")
+
+        # A fresh cache instance on the same file must see the stored results
+        reloaded = LanguageDetector(cache=DetectionCache(cache_file))
+        assert reloaded.detect_language(text) == "ja"
+        assert reloaded.detect_language_with_confidence(text) == [("ja", 0.9)]
+
+        # Detection only looks at the leading characters of long documents
+        assert reloaded.detect_language(text + "x" * 10000, max_chars=len(text)) == "ja"
+
+        # Results of another backend or model are not reused
+        other = "Voici un autre texte écrit en langue française."
+        detector.cache.set_language(other, "ja", "fasttext:/models/other.ftz")
+        assert reloaded.detect_language(other) == "fr"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Dit is een korte Nederlandse tekst over het weer en de stad waar wij wonen.",
+            "Det här är en kort svensk text om vädret och staden där vi bor tillsammans.",
+        ],
+    )
+    def test_detect_unsupported_language(self, detector: LanguageDetector, text: str) -> None:
+        """Test that text in an unsupported language is not forced into a supported one."""
+        assert "nl" in _get_langdetect_factory().get_lang_list()
+        assert detector.detect_language(text) is None
+
+    def test_detection_memoized_in_memory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeated detections of the same text reuse the first result."""
+        calls = []
+
+        def fake_detect(text: str) -> str:
+            calls.append(text)
+            return "fr"
 
+        monkeypatch.setattr(language_detector, "_detect", fake_detect)
+        monkeypatch.setattr(language_detector, "DETECTION_MEMO_SIZE", 1)
+        detector = LanguageDetector()
+        detector.cache = None
+
+        first = "Bonjour tout le monde, ça va ?"
+        second = "Salut tout le monde, ça va bien ?"
+
+        assert detector.detect_language(first) == "fr"
+        assert detector.detect_language(first) == "fr"
+        assert calls == [first]
+
+        # The oldest entry is evicted once the memo is full
+        detector.detect_language(second)
+        detector.detect_language(first)
+        assert calls == [first, second, first]
+
+        # Texts too short for reliable detection are not analyzed
+        assert detector.detect_language("Bonjour") is None
+        assert calls == [first, second, first]
+
+    def test_detection_memo_thread_safe(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that detecting from many threads does not corrupt the in-memory LRU."""
+        monkeypatch.setattr(language_detector, "_detect", lambda text: "fr")
+        monkeypatch.setattr(language_detector, "DETECTION_MEMO_SIZE", 2)
+        detector = LanguageDetector()
+        detector.cache = None
+
+        class SlowMemo(OrderedDict):
+            def get(self, key: str, default: object = None) -> object:
+                # Widen the window in which other threads could evict the entry
+                value = super().get(key, default)
+                time.sleep(0.0005)
+                return value
+
+        detector._memo = SlowMemo()
+        texts = [f"Bonjour tout le monde, document numéro {i % 5}." for i in range(400)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(detector.detect_language, texts))
+
+        assert results == ["fr"] * len(texts)
+        assert len(detector._memo) <= 2
+
+    def test_detect_with_cld3_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that CLD3 is used when installed and its codes are mapped."""
+        config = replace(get_config(), detection_backend="cld3")
+        monkeypatch.setattr(language_detector, "get_config", lambda: config)
+        monkeypatch.setattr(language_detector, "HAS_GCLD3", True)
+        monkeypatch.setattr(
+            language_detector, "_detect_cld3", lambda text: "zh" if "中" in text else None
+        )
         detector = LanguageDetector()
+        detector.cache = None
+
+        assert detector.use_cld3
+        assert detector.detect_language("这是一个中文文档，用于测试语言检测功能。") == "zh"
+        assert detector.detect_language("An unreliable result is not guessed at.") is None
+
+        monkeypatch.setattr(language_detector, "HAS_GCLD3", False)
+        assert not LanguageDetector().use_cld3
+
+    def test_detect_batch_with_fasttext_model(self, tmp_path: Path) -> None:
+        """Test that batch detection issues one model call for uncached texts."""
+        calls = []
+
+        class FakeModel:
+            def predict(
+                self, texts: list[str], k: int = 1
+            ) -> tuple[list[list[str]], list[list[float]]]:
+                calls.append(texts)
+                return [["__label__fr"], ["__label__xx"]], [[0.9], [0.8]]
+
+        detector = LanguageDetector(cache=DetectionCache(tmp_path / "d.sqlite"))
+        detector.fasttext_model = FakeModel()
+        cached = "This text was detected in an earlier run."
+        detector.cache.set_language(cached, "ja", detector.backend)
+        unknown = "Een tekst die niet wordt herkend."
+
+        results = detector.detect_batch(
+            [cached, "Bonjour tout\nle monde entier", "", "???", unknown]
+        )
+
+        assert results == ["ja", "fr", None, None, None]
+        # Texts too short for reliable detection never reach the model
+        assert calls == [["Bonjour tout le monde entier", unknown]]
+
+    def test_map_langdetect_code(self, detector: LanguageDetector) -> None:
+        """Test mapping langdetect codes to supported language codes."""
+        assert detector._map_langdetect_code("en") == "en"
+        assert detector._map_langdetect_code("zh-cn") == "zh"
+        assert detector._map_langdetect_code("zh-tw") == "zh-tw"
+        assert detector._map_langdetect_code("zh") == "zh"
+        assert detector._map_langdetect_code("nl") is None
+
+    def test_supported_languages(self, detector: LanguageDetector) -> None:
+        """Test supported languages functionality."""
         supported = detector.get_supported_languages()
 
         assert isinstance(supported, dict)
@@ -79,71 +355,248 @@ class TestDocumentLoader:
 
     def test_document_loader_creation(self) -> None:
         """Test that document loader can be created."""
-        from translator.document_loader import DocumentLoader
-
         loader = DocumentLoader()
         assert loader is not None
 
     @pytest.mark.asyncio
-    async def test_load_text_file(self, tmp_path: Path) -> None:
+    async def test_load_text_file(self, sample_corpus: Path) -> None:
         """Test loading a text file."""
-        from translator.document_loader import DocumentLoader
+        loader = DocumentLoader()
+        result = await loader.load_document(sample_corpus / "test.txt")
 
-        # Create a test file
-        test_file = tmp_path / "test.txt"
-        test_content = "This is a test file content."
-        test_file.write_text(test_content, encoding="utf-8")
+        assert result == "This is a test file content."
+
+    @pytest.mark.asyncio
+    async def test_load_latin1_text_file(self, sample_corpus: Path) -> None:
+        """Test that non-UTF-8 text files fall back to Latin-1 decoding."""
+        loader = DocumentLoader()
+        result = await loader.load_document(sample_corpus / "latin1.txt")
+
+        assert result == "Café crème"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("rtf", "expected"),
+        [
+            # WordPad (Riched20) output: cp1252 hex escapes and \uN with "?" fallbacks
+            (
+                r"{\rtf1\ansi\ansicpg1252\deff0\nouicompat\deflang1033"
+                r"{\fonttbl{\f0\fnil\fcharset0 Calibri;}{\f1\fswiss Helvetica;}}"
+                "\r\n"
+                r"{\colortbl ;\red255\green0\blue0;}"
+                "\r\n"
+                r"{\*\generator Riched20 10.0.19041}\viewkind4\uc1 "
+                "\r\n"
+                r"\pard\sa200\sl276\slmult1\f0\fs22\lang9 Hello world.\par"
+                "\r\n"
+                r"Caf\'e9 cr\'e8me br\'fbl\'e9e \endash  na\'efve\par"
+                "\r\n"
+                r"\u26085?\u26412?\u35486? \u-10179?\u-8704? "
+                r"and \cf1\b bold\cf0\b0 , \{kept\} \\ too.\par"
+                "\r\n}\r\n",
+                "Hello world.\nCafé crème brûlée – naïve\n日本語 😀 and bold, {kept} \\ too.",
+            ),
+            # Word output: cp1251 text, style sheet, document info, themes and fields
+            (
+                r"{\rtf1\adeflang1025\ansi\ansicpg1251\uc1\adeff31507\deff0"
+                r"{\fonttbl{\f0\fbidi \froman\fcharset204\fprq2"
+                r"{\*\panose 02020603050405020304}Times New Roman;}}"
+                "\r\n"
+                r"{\colortbl;\red0\green0\blue0;}{\*\defchp \f31506\fs22 }"
+                r"{\stylesheet{\ql \li0\ri0\widctlpar\wrapdefault\faauto\rin0\lin0\itap0 "
+                r"\rtlch\fcs1 \af0\afs22\alang1025 \ltrch\fcs0 \f31506\fs22\lang1049 "
+                r"\snext0 \sqformat \spriority0 Normal;}}"
+                "\r\n"
+                r"{\*\rsidtbl \rsid1071445}{\info{\title Report}{\author Ivan}"
+                r"{\creatim\yr2024\mo5\dy1\hr10\min3}}"
+                "\r\n"
+                r"\pard\plain \ql\li0 {\rtlch\fcs1 \af0 \ltrch\fcs0 \lang1049\insrsid1071445 "
+                r"\'cf\'f0\'e8\'e2\'e5\'f2, \'ec\'e8\'f0!}{\insrsid1071445 \par }"
+                "\r\n"
+                r"{\field{\*\fldinst {HYPERLINK ""https://example.com""}}"
+                r"{\fldrslt {\ul Link text}}}\par"
+                "\r\n"
+                r"{\*\themedata 504b030414000600080000002100e9de0f}}",
+                "Привет, мир!\nLink text",
+            ),
+        ],
+        ids=["wordpad", "word"],
+    )
+    async def test_load_rtf_file(self, tmp_path: Path, rtf: str, expected: str) -> None:
+        """Test that RTF metadata groups are skipped and escaped characters decoded."""
+        test_file = tmp_path / "test.rtf"
+        test_file.write_bytes(rtf.encode("ascii"))
+
+        loader = DocumentLoader()
+        result = await loader.load_document(test_file)
+
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_load_document_prefix(self, sample_corpus: Path) -> None:
+        """Test that only the leading bytes are read, even mid-character."""
+        loader = DocumentLoader()
+        result = await loader.load_document_prefix(sample_corpus / "test.md", n_bytes=4097)
+
+        assert result == "é" * 2048
+
+    @pytest.mark.asyncio
+    async def test_load_docx_file(self, tmp_path: Path) -> None:
+        """Test streaming DOCX paragraph text through the parser process pool."""
+        docx = pytest.importorskip("docx")
+
+        test_file = tmp_path / "test.docx"
+        document = docx.Document()
+        document.add_paragraph("First paragraph.")
+        document.add_paragraph("Second ").add_run("paragraph.\tWith a tab.")
+        document.add_table(rows=1, cols=1).cell(0, 0).text = "Table cell."
+        document.save(str(test_file))
 
         loader = DocumentLoader()
         result = await loader.load_document(test_file)
 
-        assert result == test_content
+        assert result == "First paragraph.\n\nSecond paragraph.\tWith a tab.\n\nTable cell."
 
     @pytest.mark.asyncio
-    async def test_load_nonexistent_file(self, tmp_path: Path) -> None:
+    async def test_load_pdf_file_in_page_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that PDF pages extracted in parallel chunks keep their order."""
+        monkeypatch.setattr(document_loader, "PDF_PAGES_PER_CHUNK", 2)
+        test_file = tmp_path / "test.pdf"
+        test_file.write_bytes(make_pdf([f"Page {i}" for i in range(5)]))
+
+        loader = DocumentLoader()
+        result = await loader.load_document(test_file)
+
+        assert result == "\n\n".join(f"Page {i}" for i in range(5))
+        assert document_loader._extract_pdf_pages(str(test_file), 4, 6, "pypdf2") == (
+            5,
+            ["Page 4"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_nonexistent_file(self, sample_corpus: Path) -> None:
         """Test loading a non-existent file."""
-        from translator.document_loader import DocumentLoader
+        loader = DocumentLoader()
+        result = await loader.load_document(sample_corpus / "nonexistent.txt")
 
-        nonexistent_file = tmp_path / "nonexistent.txt"
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_load_unsupported_file(self, sample_corpus: Path) -> None:
+        """Test that files with unsupported extensions are not loaded."""
         loader = DocumentLoader()
-        result = await loader.load_document(nonexistent_file)
+        result = await loader.load_document(sample_corpus / "test.unsupported")
 
         assert result is None
 
+        # The extension is rejected before the file is even looked up
+        assert await loader.load_document(sample_corpus / "missing.unsupported") is None
+
     @pytest.mark.asyncio
-    async def test_get_supported_files(self, tmp_path: Path) -> None:
-        """Test getting supported files from directory."""
-        from translator.document_loader import DocumentLoader
+    async def test_load_uppercase_extension(self, tmp_path: Path) -> None:
+        """Test that extensions are matched case-insensitively, also in the config."""
+        (tmp_path / "NOTES.TXT").write_text("Upper case extension")
+        loader = DocumentLoader()
+        loader.config = replace(loader.config, supported_extensions=(".TXT",))
 
-        # Create test files
-        (tmp_path / "test.txt").write_text("test content")
-        (tmp_path / "test.md").write_text("# Test markdown")
-        (tmp_path / "test.unsupported").write_text("unsupported content")
+        assert await loader.load_document(tmp_path / "NOTES.TXT") == "Upper case extension"
+        assert await loader.load_document(tmp_path / "notes.md") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("file_name", "included"),
+        [
+            ("test.txt", True),
+            ("test.md", True),
+            ("test.pdf", True),
+            ("test.docx", True),
+            ("test.doc", True),
+            ("test.rtf", True),
+            ("TEST.TXT", True),
+            ("test.unsupported", False),
+            ("README", False),
+        ],
+    )
+    async def test_get_supported_files(
+        self, tmp_path: Path, file_name: str, included: bool
+    ) -> None:
+        """Test getting supported files from directory."""
+        (tmp_path / "nested").mkdir()
+        await asyncio.gather(
+            *(
+                asyncio.to_thread((tmp_path / name).write_text, "content")
+                for name in [file_name, "nested/other.md"]
+            )
+        )
 
         loader = DocumentLoader()
         files = await loader.get_supported_files(tmp_path)
 
-        assert len(files) == 2
-        file_names = [f.name for f in files]
-        assert "test.txt" in file_names
-        assert "test.md" in file_names
-        assert "test.unsupported" not in file_names
+        file_names = {f.relative_to(tmp_path).as_posix() for f in files}
+        expected = {"nested/other.md", file_name} if included else {"nested/other.md"}
+        assert file_names == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parallel_scan", [True, False])
+    async def test_scan_supported_files(self, tmp_path: Path, parallel_scan: bool) -> None:
+        """Test scanning nested directories in worker threads."""
+        for relative in ["top.txt", "a/one.md", "a/deep/two.txt", "b/three.txt", "out/ja/x.txt"]:
+            (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / relative).write_text("content")
+        (tmp_path / "b" / "skip.unsupported").write_text("content")
+
+        loader = DocumentLoader()
+        loader.config = replace(loader.config, parallel_scan=parallel_scan)
+        files = [
+            path.relative_to(tmp_path).as_posix()
+            async for path in loader.scan_supported_files(tmp_path, exclude=tmp_path / "out")
+        ]
+
+        assert files[0] == "top.txt"
+        assert sorted(files) == ["a/deep/two.txt", "a/one.md", "b/three.txt", "top.txt"]
+
+
+class TestFileIO:
+    """Test asynchronous file reads and writes."""
+
+    @pytest.mark.asyncio
+    async def test_write_and_read_round_trip(self, tmp_path: Path) -> None:
+        """Test that written files are created with parents and read back decoded."""
+        target = tmp_path / "ja" / "nested" / "doc.txt"
+        await write_bytes(target, "こんにちは".encode())
+
+        assert await read_text(target) == "こんにちは"
+
+        target.write_bytes("Café".encode("latin-1"))
+        assert await read_text(target) == "Café"
 
 
 class TestTranslationService:
     """Test translation service functionality."""
 
-    def test_translation_manager_creation(self) -> None:
+    def test_translation_manager_creation(
+        self, translation_manager: TranslationManager
+    ) -> None:
         """Test that translation manager can be created."""
-        from translator.translation_service import TranslationManager
+        assert translation_manager is not None
 
-        manager = TranslationManager()
-        assert manager is not None
+    def test_mock_service_opt_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the mock service is only registered when enabled."""
+        monkeypatch.setattr(TranslationManager, "_create_default_cache", lambda self: None)
+
+        def has_mock(env: dict[str, str]) -> bool:
+            config = TranslationConfig.from_env(env, env_file=None)
+            monkeypatch.setattr(translation_service, "get_config", lambda: config)
+            manager = TranslationManager()
+            return any(isinstance(s, MockTranslationService) for s in manager.services)
+
+        assert not has_mock({})
+        assert has_mock({"ENABLE_MOCK_SERVICE": "true"})
 
     def test_openai_service_creation(self) -> None:
         """Test OpenAI service creation."""
-        from translator.translation_service import OpenAITranslationService
-
         service = OpenAITranslationService(
             api_key="test_key", base_url="https://api.test.com", model="test-model"
         )
@@ -152,11 +605,555 @@ class TestTranslationService:
 
     def test_google_service_creation(self) -> None:
         """Test Google service creation."""
-        from translator.translation_service import GoogleTranslationService
-
         service = GoogleTranslationService()
         assert service is not None
-        # Note: May not be available without googletrans installed
+        assert service.is_available()
+
+    @pytest.mark.asyncio
+    async def test_google_service_web_endpoint(self) -> None:
+        """Test that Google translations are parsed from the web endpoint reply."""
+        requests: list[tuple[dict, dict]] = []
+
+        class FakeResponse:
+            status = 200
+
+            async def __aenter__(self) -> "FakeResponse":
+                return self
+
+            async def __aexit__(self, *exc_info: object) -> None:
+                return None
+
+            async def read(self) -> bytes:
+                return json.dumps(
+                    [[["Hallo Welt. ", "Hello world. "], ["Wie geht's?", "How are you?"]]]
+                ).encode()
+
+        class FakeSession:
+            def request(self, method: str, url: str, params: dict, data: dict) -> FakeResponse:
+                requests.append((params, data))
+                return FakeResponse()
+
+        service = GoogleTranslationService()
+        service._get_session = FakeSession
+
+        result = await service.translate("Hello world. How are you?", "de", "en")
+
+        assert result == "Hallo Welt. Wie geht's?"
+        params, data = requests[0]
+        assert (params["client"], params["sl"], params["tl"]) == ("gtx", "en", "de")
+        assert data == {"q": "Hello world. How are you?"}
+
+    @pytest.mark.asyncio
+    async def test_mymemory_translate_many_sends_one_text_per_request(self) -> None:
+        """Test that MyMemory batches are not packed into one size-capped query."""
+        requests: list[str] = []
+
+        async def fake_translate(
+            text: str, target_language: str, source_language: str | None = None
+        ) -> str | None:
+            requests.append(text)
+            return None if text == "fail" else f"[{target_language}] {text}"
+
+        service = MyMemoryTranslationService()
+        service.translate = fake_translate
+
+        assert await service.translate_many(["One", "Two"], "de", "en") == [
+            "[de] One",
+            "[de] Two",
+        ]
+        assert requests == ["One", "Two"]
+        assert await service.translate_many(["fail", "Three"], "de", "en") is None
+
+    @pytest.mark.asyncio
+    async def test_google_service_googletrans_fallback(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that googletrans is only created once the web endpoint has failed."""
+        created: list[str] = []
+
+        class FakeTranslator:
+            def translate(self, text: str, dest: str, src: str) -> SimpleNamespace:
+                return SimpleNamespace(text=f"[{src}->{dest}] {text} ")
+
+        def fake_client() -> FakeTranslator:
+            created.append("client")
+            return FakeTranslator()
+
+        async def failing_web(*args: object) -> str | None:
+            raise ConnectionError("unreachable")
+
+        monkeypatch.setattr(translation_service, "_googletrans_client", fake_client)
+        service = GoogleTranslationService()
+        assert created == []
+
+        service._translate_web = failing_web
+        assert await service.translate("Hello", "de", "en") == "[en->de] Hello"
+        assert created == ["client"]
+
+        monkeypatch.setattr(translation_service, "_googletrans_client", lambda: None)
+        assert await service.translate("Hello", "de", "en") is None
+
+    @pytest.mark.asyncio
+    async def test_http_retries_transient_failures(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that 429/5xx replies are retried and other errors are not."""
+        config = TranslationConfig.from_env({"RETRY_DELAY": "0"}, env_file=None)
+        monkeypatch.setattr(translation_service, "get_config", lambda: config)
+        statuses: list[int] = []
+
+        class FakeResponse:
+            def __init__(self, status: int) -> None:
+                self.status = status
+
+            async def __aenter__(self) -> "FakeResponse":
+                return self
+
+            async def __aexit__(self, *exc_info: object) -> None:
+                return None
+
+            async def read(self) -> bytes:
+                return b'{"translatedText": "Hallo"}'
+
+        def fake_session(replies: list[int]) -> object:
+            class FakeSession:
+                def request(self, method: str, url: str, **kwargs: object) -> FakeResponse:
+                    statuses.append(replies[len(statuses)])
+                    return FakeResponse(statuses[-1])
+
+            return FakeSession
+
+        service = LibreTranslateService()
+        service._get_session = fake_session([503, 429, 200])
+        assert await service.translate("Hello", "de", "en") == "Hallo"
+        assert statuses == [503, 429, 200]
+
+        statuses.clear()
+        service._get_session = fake_session([400, 200])
+        assert await service.translate("Hello", "de", "en") is None
+        assert statuses == [400]
+
+    @pytest.mark.asyncio
+    async def test_http_session_shared_and_closed(self) -> None:
+        """Test that HTTP services reuse one session until the manager exits."""
+        service = LibreTranslateService()
+        other = MyMemoryTranslationService()
+        manager = TranslationManager()
+        manager.services = [service, other]
+
+        async with manager:
+            session = service._get_session()
+            assert service._get_session() is session
+            assert other._get_session() is session
+            assert session.timeout.total == service.REQUEST_TIMEOUT_SECONDS
+            assert session.json_serialize is json_dumps
+
+        assert session.closed
+        assert service._session is None
+
+        # Outside a managed run a service owns and closes a private session
+        private = service._get_session()
+        assert private is not session
+        await service.aclose()
+        assert private.closed
+
+    @pytest.mark.asyncio
+    async def test_manager_reusable_after_exit(self) -> None:
+        """Test that a manager can run again after an earlier run closed its clients."""
+        openai_service = OpenAITranslationService(api_key="test-key")
+        http_service = LibreTranslateService()
+        manager = TranslationManager()
+        manager.services = [openai_service, http_service]
+
+        for _ in range(2):
+            async with manager:
+                assert not openai_service.client.is_closed()
+                assert not http_service._get_session().closed
+
+        assert not openai_service.client.is_closed()
+        assert openai_service.client.api_key == "test-key"
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http_session_sized_to_connection_limit(self) -> None:
+        """Test that the per-run connection limit reaches shared and private sessions."""
+        service = LibreTranslateService()
+        manager = TranslationManager()
+        manager.services = [service]
+        manager.set_connection_limit(50)
+
+        async with manager:
+            assert service._get_session().connector.limit_per_host == 50
+
+        private = service._get_session()
+        assert private.connector.limit_per_host == 50
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_translation_cache(self, tmp_path: Path) -> None:
+        """Test that repeated translations are served from the cache."""
+        calls: list[str] = []
+        manager = TranslationManager(cache=TranslationCache(tmp_path / "t.sqlite"))
+        manager.services = [make_echo_service(calls)]
+
+        first = await manager.translate("Hello", "ja", "en")
+        second = await manager.translate("Hello", "ja", "en")
+
+        assert first == second == "[ja] Hello"
+        assert calls == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_blank_and_letterless_texts_skip_services(self) -> None:
+        """Test that blank texts fail fast and letterless texts pass through."""
+        calls: list[str] = []
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [make_echo_service(calls)]
+
+        assert await manager.translate(" \n\t", "ja") is None
+        assert await manager.translate("42 - 3.14%", "ja") == "42 - 3.14%"
+        assert await manager.translate_batch(["", "2024", "Word"], "ja") == [
+            None,
+            "2024",
+            "[ja] Word",
+        ]
+        assert calls == ["Word"]
+
+    @pytest.mark.asyncio
+    async def test_translate_batch_single_request(self) -> None:
+        """Test that several texts are packed into one request and split back."""
+        calls: list[str] = []
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [make_echo_service(calls)]
+
+        results = await manager.translate_batch(["One", "", "Two\nlines", "Three"], "ja")
+
+        assert results == ["[ja] One", None, "[ja] Two\n[ja] lines", "[ja] Three"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_share_one_translation(self) -> None:
+        """Test that repeated texts are translated once, also while in flight."""
+        calls: list[str] = []
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [make_echo_service(calls)]
+
+        first, second = await asyncio.gather(
+            manager.translate("Shared footer", "ja"), manager.translate("Shared footer", "ja")
+        )
+        batch = await manager.translate_batch(["Shared footer", "Body", "Body", "Tail"], "ja")
+
+        assert first == second == "[ja] Shared footer"
+        assert batch == ["[ja] Shared footer", "[ja] Body", "[ja] Body", "[ja] Tail"]
+        assert calls[0] == "Shared footer"
+        assert len(calls) == 2
+        assert calls[1].count("Body") == 1
+
+    @pytest.mark.asyncio
+    async def test_translate_batch_uses_native_batch_api(self) -> None:
+        """Test that services with a batch API receive the texts as a list."""
+        batches: list[list[str]] = []
+
+        class ListService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                raise AssertionError("single-text translation should not be used")
+
+            async def translate_many(
+                self, texts: list[str], target_language: str, source_language: str | None = None
+            ) -> list[str] | None:
+                batches.append(texts)
+                return [f"<{text}>" for text in texts]
+
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [ListService()]
+
+        results = await manager.translate_batch(["One", "Two", "Three"], "ja")
+
+        assert results == ["<One>", "<Two>", "<Three>"]
+        assert batches == [["One", "Two", "Three"]]
+
+    def test_resolve_service_language_codes(self) -> None:
+        """Test that language pairs resolve to each service's codes."""
+        assert _google_codes("zh", None) == ("zh-cn", "auto")
+        assert _google_codes("ja", "en") == ("ja", "en")
+        assert _mymemory_langpair("zh-tw", None) == "zh-tw"
+        assert _mymemory_langpair("ja", "en") == "en|ja"
+        assert _libretranslate_codes("zh-tw", "ja") == ("zh", "ja")
+        assert _libretranslate_codes("ja", None) == ("ja", "auto")
+
+    @pytest.mark.asyncio
+    async def test_service_limit_caps_concurrency_and_rate(self) -> None:
+        """Test that a service's request slots bound concurrency and pace starts."""
+        service = MyMemoryTranslationService(max_concurrency=2, requests_per_second=100)
+        loop = asyncio.get_running_loop()
+        in_flight = peak = 0
+        starts: list[float] = []
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            async with service.limit():
+                starts.append(loop.time())
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(5)))
+
+        assert peak == 2
+        assert starts[-1] - starts[0] >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_staggered_fallback_returns_first_success(self) -> None:
+        """Test that a stalled service is overtaken by the next one after the stagger."""
+        cancelled = []
+
+        class SlowService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(text)
+                    raise
+                return "too late"
+
+        manager = TranslationManager()
+        manager.cache = None
+        manager.config = replace(manager.config, service_stagger_seconds=0.01)
+        manager.services = [SlowService(), make_echo_service()]
+
+        result = await asyncio.wait_for(manager.translate("Hello", "ja"), timeout=5)
+        await asyncio.sleep(0)
+
+        assert result == "[ja] Hello"
+        assert cancelled == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_staggered_fallback_starts_next_after_failure(self) -> None:
+        """Test that a failed service starts the next one without waiting out the stagger."""
+
+        class FailingService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                raise RuntimeError("service down")
+
+        manager = TranslationManager()
+        manager.cache = None
+        manager.config = replace(manager.config, service_stagger_seconds=30)
+        manager.services = [FailingService(), make_echo_service()]
+
+        result = await asyncio.wait_for(manager.translate("Hello", "ja"), timeout=5)
+
+        assert result == "[ja] Hello"
+
+    @pytest.mark.asyncio
+    async def test_source_language_detected_once_for_all_services(self) -> None:
+        """Test that texts without a source language get one detected locally."""
+        sources: list[str | None] = []
+
+        class RecordingService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                sources.append(source_language)
+                return None
+
+        class FakeDetector:
+            def detect_language(self, text: str) -> str | None:
+                return "fr"
+
+        manager = TranslationManager(detector=FakeDetector())  # type: ignore[arg-type]
+        manager.cache = None
+        manager.services = [RecordingService(), RecordingService()]
+
+        assert await manager.translate("Bonjour tout le monde", "ja") is None
+        assert sources == ["fr", "fr"]
+
+    @pytest.mark.asyncio
+    async def test_failing_service_demoted_until_cooldown(self) -> None:
+        """Test that a service which just failed is tried after the healthy ones."""
+        attempts: list[str] = []
+
+        class DownService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                attempts.append(text)
+                return None
+
+        down = DownService()
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [down, make_echo_service()]
+
+        assert await manager.translate("Hello", "ja") == "[ja] Hello"
+        assert await manager.translate("World", "ja") == "[ja] World"
+        assert attempts == ["Hello"]
+
+        # Once the cool-down is over the configured order applies again
+        manager._demoted_until[down] = 0.0
+        await manager.translate("Again", "ja")
+        assert attempts == ["Hello", "Again"]
+        assert manager._failure_streaks[down] == 2
+
+    @pytest.mark.asyncio
+    async def test_openai_translate_many_uses_json_mode(self) -> None:
+        """Test that OpenAI batches are one JSON-mode completion, checked for length."""
+        requests: list[dict] = []
+        replies = [
+            {"translations": ["Eins", "Zwei"]},
+            {"translations": ["Eins"]},
+        ]
+
+        async def create(**kwargs: object) -> SimpleNamespace:
+            requests.append(kwargs)
+            content = json.dumps(replies[len(requests) - 1])
+            return SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        finish_reason="stop", message=SimpleNamespace(content=content)
+                    )
+                ]
+            )
+
+        service = OpenAITranslationService(api_key="test-key")
+        service.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        assert await service.translate_many(["One", "Two"], "de", "en") == ["Eins", "Zwei"]
+        assert await service.translate_many(["One", "Two"], "de", "en") is None
+        assert requests[0]["response_format"] == {"type": "json_object"}
+        assert '["One","Two"]' in requests[0]["messages"][1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_translate_concurrently_bounds_requests(self) -> None:
+        """Test that texts are translated in parallel up to the concurrency limit."""
+        in_flight = 0
+        peak = 0
+
+        class SlowService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return f"[{target_language}] {text}"
+
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [SlowService()]
+        texts = [f"Text number {i}" for i in range(20)]
+
+        results = await manager.translate_concurrently(texts, "ja", "en", concurrency=8)
+
+        assert results == [f"[ja] {text}" for text in texts]
+        assert peak == 8
+
+    @pytest.mark.asyncio
+    async def test_offline_batch_uses_openai_batch_api(self) -> None:
+        """Test that offline batches go through one Batch API job, with online fallback."""
+        uploads: list[bytes] = []
+        statuses = iter(["in_progress", "completed"])
+
+        async def create_file(file: tuple[str, bytes], purpose: str) -> SimpleNamespace:
+            uploads.append(file[1])
+            return SimpleNamespace(id="file-in")
+
+        async def create_batch(**kwargs: object) -> SimpleNamespace:
+            return SimpleNamespace(id="batch-1", status="validating", output_file_id=None)
+
+        async def retrieve_batch(batch_id: str) -> SimpleNamespace:
+            return SimpleNamespace(id=batch_id, status=next(statuses), output_file_id="file-out")
+
+        async def file_content(file_id: str) -> SimpleNamespace:
+            body = {"choices": [{"finish_reason": "stop", "message": {"content": "Zwei"}}]}
+            lines = [
+                {"custom_id": "1", "response": {"status_code": 200, "body": body}},
+                {"custom_id": "0", "response": {"status_code": 500, "body": {}}},
+            ]
+            return SimpleNamespace(content="\n".join(map(json.dumps, lines)).encode())
+
+        service = OpenAITranslationService(api_key="test-key")
+        service.BATCH_POLL_SECONDS = 0
+        service.client = SimpleNamespace(
+            api_key="test-key",
+            files=SimpleNamespace(create=create_file, content=file_content),
+            batches=SimpleNamespace(create=create_batch, retrieve=retrieve_batch),
+        )
+
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [service, make_echo_service()]
+
+        results = await manager.translate_batch(["One", "Two"], "de", "en", offline=True)
+
+        assert results == ["[de] One", "Zwei"]
+        requests = [json.loads(line) for line in uploads[0].splitlines()]
+        assert [request["custom_id"] for request in requests] == ["0", "1"]
+        assert requests[0]["url"] == "/v1/chat/completions"
+
+    @pytest.mark.asyncio
+    async def test_translate_batch_falls_back_when_markers_lost(self) -> None:
+        """Test per-text translation when a service mangles the batch markers."""
+
+        class PrefixService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                return f"Translation: {text}"
+
+        manager = TranslationManager()
+        manager.cache = None
+        manager.services = [PrefixService()]
+
+        results = await manager.translate_batch(["One", "Two"], "ja")
+
+        assert results == ["Translation: One", "Translation: Two"]
+
+    def test_translation_cache_expiry(self, tmp_path: Path) -> None:
+        """Test that expired translations are not returned."""
+        cache = TranslationCache(tmp_path / "t.sqlite", ttl_seconds=-1)
+        cache.set("Hello", "ja", "en", "model", "こんにちは")
+        assert cache.get("Hello", "ja", "en", "model") is None
+
+        # Expired rows are deleted from disk the next time the cache is opened
+        cache.close()
+        reopened = TranslationCache(tmp_path / "t.sqlite")
+        assert reopened.purge_expired() == 0
+        assert reopened._connection.execute(
+            "SELECT COUNT(*) FROM translation_cache"
+        ).fetchone() == (0,)
 
 
 class TestProcessor:
@@ -164,8 +1161,6 @@ class TestProcessor:
 
     def test_translation_result_creation(self) -> None:
         """Test TranslationResult creation."""
-        from translator.processor import TranslationResult
-
         result = TranslationResult(
             source_file=Path("test.txt"),
             target_file=Path("test_en.txt"),
@@ -177,17 +1172,447 @@ class TestProcessor:
         assert result.success is True
         assert result.source_language == "en"
         assert result.target_language == "ja"
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.success = False  # type: ignore[misc]
+        assert len({result, replace(result)}) == 1
+
+    def test_results_summary_counts(self) -> None:
+        """Test that the summary counts results in one pass, keeping only failures."""
+        summary = TranslationSummary()
+        for language, success in [("ja", True), ("ko", True), ("ja", True), ("ko", False)]:
+            summary.add(TranslationResult(Path("a.txt"), Path("b.txt"), "en", language, success))
 
-    def test_document_translator_creation(self) -> None:
+        assert summary.total == 4
+        assert summary.successful == 3
+        assert [r.target_language for r in summary.failed] == ["ko"]
+        assert dict(summary.by_language) == {"ja": 2, "ko": 1}
+
+    def test_document_translator_creation(
+        self, document_translator: DocumentTranslator
+    ) -> None:
         """Test DocumentTranslator creation."""
-        from translator.processor import DocumentTranslator
+        assert document_translator is not None
+        assert document_translator.config is not None
+        assert document_translator.document_loader is not None
+        assert document_translator.language_detector is not None
+        assert document_translator.translation_manager is not None
+
+    def test_document_translator_lazy_init(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the detector is only created when it is first used."""
+
+        def failing_init(self: LanguageDetector) -> None:
+            raise RuntimeError("detector created")
+
+        monkeypatch.setattr(LanguageDetector, "__init__", failing_init)
+        translator = DocumentTranslator()
+
+        with pytest.raises(RuntimeError, match="detector created"):
+            _ = translator.language_detector
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_skips_output_directory(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that translations written inside the source tree are not rescanned."""
+        (tmp_path / "a.txt").write_text("Hello world, this is a document.")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.md").write_text("# Another English document")
+        # Leftover output from a previous run
+        (tmp_path / "translated" / "ja").mkdir(parents=True)
+        (tmp_path / "translated" / "ja" / "old.txt").write_text("old output")
+
+        translator = DocumentTranslator()
+        use_echo_service(translator)
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path, target_languages=["ja", "ko"]
+        )
+
+        assert len(results) == 4
+        assert all(r.success for r in results)
+        assert {r.source_file.name for r in results} == {"a.txt", "b.md"}
+        assert (tmp_path / "translated" / "ko" / "sub" / "b.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_loads_each_file_once(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a file is loaded once and shared across target languages."""
+        (tmp_path / "doc.txt").write_text("This is a short English document.")
 
         translator = DocumentTranslator()
-        assert translator is not None
-        assert translator.config is not None
-        assert translator.document_loader is not None
-        assert translator.language_detector is not None
-        assert translator.translation_manager is not None
+        use_echo_service(translator)
+        load_document = translator.document_loader.load_document
+        loaded = []
+
+        async def counting_load(file_path: Path, check_size: bool = True) -> str | None:
+            loaded.append(file_path)
+            return await load_document(file_path, check_size)
+
+        translator.document_loader.load_document = counting_load  # type: ignore[method-assign]
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path,
+            target_languages=["ja", "ko", "fr"],
+            output_directory=tmp_path / "out",
+        )
+
+        assert len(results) == 3
+        assert loaded == [tmp_path / "doc.txt"]
+        assert (tmp_path / "out" / "fr" / "doc.txt").read_text().startswith("[fr]")
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_skips_loading_target_language_files(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that documents already in the target language are never fully loaded."""
+        source_dir = tmp_path / "src"
+        (source_dir / "ja").mkdir(parents=True)
+        (source_dir / "ja" / "guide.txt").write_text("The directory hint wins over content.")
+        (source_dir / "notes_ja.md").write_text("The file name hint wins over content.")
+        (source_dir / "english.txt").write_text("This is a plain English document to keep.")
+
+        translator = DocumentTranslator()
+        # Path hints are opt-in
+        translator.config = replace(translator.config, filename_language_hints=True)
+        use_echo_service(translator)
+        loaded = []
+
+        async def counting_load(file_path: Path, check_size: bool = True) -> str | None:
+            loaded.append(file_path.name)
+            return None
+
+        translator.document_loader.load_document = counting_load  # type: ignore[method-assign]
+
+        results = await translator.translate_directory(
+            source_directory=source_dir,
+            target_languages=["ja"],
+            output_directory=tmp_path / "out_ja",
+        )
+
+        assert loaded == ["english.txt"]
+        hinted = [r for r in results if r.source_file.name != "english.txt"]
+        assert len(hinted) == 2
+        assert all(r.success and r.source_language == "ja" for r in hinted)
+
+        loaded.clear()
+        await translator.translate_directory(
+            source_directory=source_dir,
+            target_languages=["en"],
+            output_directory=tmp_path / "out_en",
+        )
+
+        assert sorted(loaded) == ["guide.txt", "notes_ja.md"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("relative_path", "hints", "expected"),
+        [
+            ("guide_ja.md", True, "ja"),
+            ("guide.ja.md", True, "ja"),
+            ("ja/guide.md", True, "ja"),
+            ("guide_ja.md", False, None),
+            ("docs/es/guide.md", True, None),
+            ("es/docs/guide.md", True, None),
+            ("ja.md", True, None),
+            ("pay_per_view.md", True, None),
+        ],
+    )
+    async def test_early_source_language_path_hints(
+        self, tmp_path: Path, relative_path: str, hints: bool, expected: str | None
+    ) -> None:
+        """Test which paths carry a source language hint, and only when enabled."""
+        translator = DocumentTranslator()
+        translator.config = replace(translator.config, filename_language_hints=hints)
+        # Several pending targets, so no content detection is attempted
+        pending = {"fr": tmp_path / "fr", "de": tmp_path / "de"}
+
+        language = await translator._early_source_language(
+            tmp_path / relative_path, Path(relative_path), pending
+        )
+
+        assert language == expected
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_detects_in_batches(self, tmp_path: Path) -> None:
+        """Test that every loaded file goes through batched detection exactly once."""
+        for i in range(5):
+            (tmp_path / f"doc_{i}.txt").write_text(f"This is English document number {i}.")
+
+        translator = DocumentTranslator()
+        use_echo_service(translator)
+        batches: list[list[str]] = []
+
+        def fake_detect_batch(texts: list[str]) -> list[str | None]:
+            batches.append(texts)
+            return ["en"] * len(texts)
+
+        translator.language_detector.detect_batch = fake_detect_batch  # type: ignore[method-assign]
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path,
+            target_languages=["ja", "en"],
+            output_directory=tmp_path / "out",
+        )
+
+        assert len(results) == 10
+        assert sorted(text for batch in batches for text in batch) == [
+            f"This is English document number {i}." for i in range(5)
+        ]
+        assert all(r.source_language == "en" for r in results)
+        assert not (tmp_path / "out" / "en" / "doc_0.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_retranslates_changed_sources(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that only sources changed since the last run are re-translated."""
+        source_dir = tmp_path / "src"
+        source_dir.mkdir()
+        (source_dir / "kept.txt").write_text("This document does not change at all.")
+        (source_dir / "edited.txt").write_text("This document will be edited later.")
+        output_dir = tmp_path / "out"
+
+        calls: list[str] = []
+        translator = DocumentTranslator()
+        translator.config = replace(translator.config, batch_document_chars=0)
+        use_echo_service(translator, calls)
+
+        async def run() -> None:
+            await translator.translate_directory(
+                source_directory=source_dir,
+                target_languages=["ja"],
+                output_directory=output_dir,
+            )
+
+        await run()
+        assert len(calls) == 2
+        assert (output_dir / TranslationManifest.FILENAME).exists()
+
+        (source_dir / "edited.txt").write_text("This document has now been edited.")
+        calls.clear()
+        await run()
+
+        assert calls == ["This document has now been edited."]
+        assert (output_dir / "ja" / "edited.txt").read_text() == (
+            "[ja] This document has now been edited."
+        )
+
+    def test_manifest_saved_during_run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that manifest updates reach the disk without waiting for the run to end."""
+        monkeypatch.setattr(TranslationManifest, "SAVE_EVERY", 3)
+        manifest = TranslationManifest(tmp_path)
+
+        for i in range(4):
+            manifest.set(f"doc_{i}.txt", "ja", f"hash{i}")
+
+        # A run killed now keeps the first three entries
+        reloaded = TranslationManifest(tmp_path)
+        assert [reloaded.get(f"doc_{i}.txt", "ja") for i in range(4)] == [
+            "hash0",
+            "hash1",
+            "hash2",
+            None,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_batches_small_documents(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that small documents share translation requests."""
+        for i in range(6):
+            (tmp_path / f"doc_{i}.txt").write_text(f"This is English document {i}.")
+
+        calls: list[str] = []
+        translator = DocumentTranslator()
+        use_echo_service(translator, calls)
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path,
+            target_languages=["ja"],
+            output_directory=tmp_path / "out",
+        )
+
+        assert len(results) == 6
+        assert all(r.success for r in results)
+        assert len(calls) < 6
+        assert (tmp_path / "out" / "ja" / "doc_3.txt").read_text() == (
+            "[ja] This is English document 3."
+        )
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_chunks_large_documents(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that large documents are translated in chunks written in order."""
+        paragraphs = [f"This is paragraph number {i} of a long document." for i in range(8)]
+        (tmp_path / "long.txt").write_text("\n\n".join(paragraphs))
+
+        calls: list[str] = []
+        translator = DocumentTranslator()
+        translator.config = replace(
+            translator.config, batch_document_chars=0, translation_chunk_chars=120
+        )
+        use_echo_service(translator, calls)
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path,
+            target_languages=["ja"],
+            output_directory=tmp_path / "out",
+        )
+
+        assert len(results) == 1
+        assert results[0].success
+        assert len(calls) == 4
+        assert all(len(call) <= 120 for call in calls)
+        assert (tmp_path / "out" / "ja" / "long.txt").read_text() == "\n\n".join(
+            f"[ja] {p}" for p in paragraphs
+        )
+        assert not list((tmp_path / "out" / "ja").glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_translate_chunks_unwritable_output(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that no chunk is sent for translation when the output cannot be opened."""
+        paragraphs = [f"This is paragraph number {i} of a long document." for i in range(8)]
+        (tmp_path / "long.txt").write_text("\n\n".join(paragraphs))
+
+        def fail_open(file_path: Path) -> None:
+            raise PermissionError(file_path)
+
+        monkeypatch.setattr(processor, "_open_for_writing", fail_open)
+        calls: list[str] = []
+        translator = DocumentTranslator()
+        translator.config = replace(
+            translator.config, batch_document_chars=0, translation_chunk_chars=120
+        )
+        use_echo_service(translator, calls)
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path,
+            target_languages=["ja"],
+            output_directory=tmp_path / "out",
+        )
+
+        assert len(results) == 1
+        assert not results[0].success
+        assert calls == []
+
+    def test_split_into_chunks_keeps_code_blocks(self) -> None:
+        """Test that chunking never splits a fenced code block or drops indentation."""
+        code = "```python\ndef f():\n\n    return 1\n```"
+        text = f"Intro paragraph.\n\n{code}\n\n    Indented paragraph.\n\nLast."
+
+        chunks = _split_into_chunks(text, 40)
+
+        assert chunks[1] == code
+        assert chunks[2].startswith("    Indented paragraph.")
+        assert "\n\n".join(chunks) == text
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_stream(self, tmp_path: Path) -> None:
+        """Test that results are yielded incrementally and early exit is clean."""
+        for i in range(5):
+            (tmp_path / f"doc_{i}.txt").write_text(f"This is English document {i}.")
+
+        translator = DocumentTranslator()
+        use_echo_service(translator)
+
+        stream = translator.translate_directory_stream(
+            source_directory=tmp_path, target_languages=["ja"]
+        )
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert isinstance(first, TranslationResult)
+        assert first.success
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_survives_detection_errors(self, tmp_path: Path) -> None:
+        """Test that a failing detection backend leaves the source language unknown."""
+        (tmp_path / "doc.txt").write_text("This is a short English document.")
+
+        def failing_detect_batch(texts: list[str], max_chars: int = 0) -> list[str | None]:
+            raise KeyError("detector broke")
+
+        translator = DocumentTranslator()
+        use_echo_service(translator)
+        translator.language_detector.detect_batch = failing_detect_batch
+
+        # With several targets the document is detected in the batch stage
+        results = await translator.translate_directory(
+            source_directory=tmp_path, target_languages=["ja", "ko"]
+        )
+
+        assert [(r.success, r.source_language) for r in results] == [(True, None)] * 2
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_stage_failure_cancels_pipeline(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a failing stage is raised and no pipeline task is left running."""
+        (tmp_path / "doc.txt").write_text("This is a short English document.")
+
+        async def failing_scan(directory: Path, exclude: Path | None = None) -> AsyncIterator[Path]:
+            yield tmp_path / "doc.txt"
+            raise PermissionError("scan failed")
+
+        translator = DocumentTranslator()
+        use_echo_service(translator)
+        translator.document_loader.scan_supported_files = failing_scan
+
+        with pytest.raises(PermissionError, match="scan failed"):
+            await translator.translate_directory(
+                source_directory=tmp_path, target_languages=["ja"]
+            )
+        await asyncio.sleep(0)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    @pytest.mark.asyncio
+    async def test_translate_directory_bounds_concurrency(self, tmp_path: Path) -> None:
+        """Test that no more than `concurrency` translations are ever in flight."""
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    (tmp_path / f"doc_{i}.txt").write_text, f"This is English document {i}."
+                )
+                for i in range(50)
+            )
+        )
+        in_flight = 0
+        peak = 0
+
+        class SlowService(TranslationService):
+            def is_available(self) -> bool:
+                return True
+
+            async def translate(
+                self, text: str, target_language: str, source_language: str | None = None
+            ) -> str | None:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.005)
+                in_flight -= 1
+                return f"[{target_language}] {text}"
+
+        translator = DocumentTranslator()
+        # Send every document on its own instead of sharing batched requests
+        translator.config = replace(translator.config, batch_document_chars=0)
+        translator.translation_manager.services = [SlowService()]
+        translator.translation_manager.cache = None
+
+        results = await translator.translate_directory(
+            source_directory=tmp_path, target_languages=["ja", "ko"], concurrency=4
+        )
+
+        assert len(results) == 100
+        assert all(r.success for r in results)
+        assert 1 < peak <= 4
 
 
 class TestCLI:
@@ -195,24 +1620,67 @@ class TestCLI:
 
     def test_cli_import(self) -> None:
         """Test that CLI can be imported."""
-        from translator.cli import cli
-
         assert cli is not None
         assert callable(cli)
 
+    def test_translate_concurrency_option(self) -> None:
+        """Test that --concurrency is accepted as an alias for --batch-size."""
+        result = CliRunner().invoke(cli, ["translate", "--help"])
+        assert result.exit_code == 0
+        assert "--concurrency" in result.output
+
+    def test_translate_rejects_unsupported_language(self, tmp_path: Path) -> None:
+        """Test that unknown target languages are rejected before translating."""
+        result = CliRunner().invoke(cli, ["translate", str(tmp_path), "-l", "xx"])
+        assert result.exit_code != 0
+        assert "unsupported language(s): xx" in result.output
+
+    def test_translate_writes_results_log(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that each result is appended to the JSON Lines log."""
+
+        def setup_echo(manager: TranslationManager) -> None:
+            manager.services = [make_echo_service()]
+
+        monkeypatch.setattr(TranslationManager, "_setup_services", setup_echo)
+        monkeypatch.setattr(TranslationManager, "_create_default_cache", lambda self: None)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "doc.txt").write_text("This is a short English document.")
+        log_path = tmp_path / "results.jsonl"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "translate",
+                str(tmp_path / "src"),
+                "-l",
+                "ja",
+                "-l",
+                "ko",
+                "-o",
+                str(tmp_path / "out"),
+                "--results-log",
+                str(log_path),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert sorted(entry["target_language"] for entry in entries) == ["ja", "ko"]
+        assert all(entry["success"] for entry in entries)
+        assert "Successful: 2" in result.output
+
 
 # Integration test (requires API keys to run)
 @pytest.mark.integration
+@pytest.mark.xdist_group("api")  # Keep API calls on one worker to stay within rate limits
 class TestIntegration:
     """Integration tests that require actual API access."""
 
     @pytest.mark.asyncio
     async def test_full_translation_flow(self, tmp_path: Path) -> None:
         """Test complete translation flow with actual API."""
-        import os
-
-        from translator.processor import DocumentTranslator
-
         # Skip if no API keys configured
         if not (os.getenv("OPENAI_API_KEY") or os.getenv("DEEPSEEK_API_KEY")):
             pytest.skip("No API keys configured for integration test")